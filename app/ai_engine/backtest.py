@@ -0,0 +1,156 @@
+# backtest.py
+# Replays stored daily bars through the RED pipeline
+# (compute_tech_score -> detect_market_regime -> red_engine) at every bar
+# of every symbol, without a per-bar Python loop.
+#
+# Each bar only sees data up to its own close; the signal decided at the
+# close of bar t is held over the return from t to t+1.
+
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.batch_indicators import batch_indicators, close_matrix, tech_scores
+from app.ai_engine.red_engine import REGIME_CODES, red_engine_batch
+from app.ai_engine.regime import regime_frame
+from app.fetcher import fetch_history
+
+# Sentiment confidence used on bars without historical sentiment. The
+# scalar engine answers HOLD below 0.4, so a neutral score with this
+# confidence lets the technicals and regime decide.
+NEUTRAL_SENTIMENT_CONFIDENCE = 0.5
+
+# Closes the live pipeline sees when it labels the regime: about the
+# 6 months red_engine_for_stock fetches
+REGIME_WINDOW = 126
+
+SIGNALS = ("BUY", "SELL", "HOLD")
+
+
+# =====================================================
+# Inputs
+# =====================================================
+def load_closes(symbols, provider, period: str = "max") -> pd.DataFrame:
+    """
+    (dates x symbols) close matrix from `provider` (e.g. the local file
+    provider, for offline runs). Symbols without data are dropped.
+    """
+    closes = {}
+    for symbol in symbols:
+        bars = fetch_history(symbol, period, provider)
+        if bars is not None and not bars.empty:
+            closes[symbol.upper()] = bars["Close"]
+    return close_matrix(closes)
+
+
+def regime_matrix(closes: pd.DataFrame, rsi: pd.DataFrame, window: int = REGIME_WINDOW) -> np.ndarray:
+    """
+    REGIME_CODES at every bar of every symbol, with volatility over the
+    last `window` closes (all history so far if None).
+    """
+    returns_window = None if window is None else max(window - 1, 1)
+    labels = regime_frame(closes, rsi, window=returns_window).to_numpy()
+    codes = np.full(labels.shape, REGIME_CODES["Uncertain"], dtype=np.int8)
+    for label, code in REGIME_CODES.items():
+        codes[labels == label] = code
+    return codes
+
+
+def _align(frame, closes: pd.DataFrame, default: float) -> np.ndarray:
+    if frame is None:
+        return np.full(closes.shape, default)
+    frame = frame.reindex(index=closes.index, columns=closes.columns)
+    return frame.fillna(default).to_numpy(dtype=np.float64)
+
+
+# =====================================================
+# Backtest
+# =====================================================
+def run_backtest(
+    closes: pd.DataFrame,
+    sentiment_score: pd.DataFrame = None,
+    sentiment_confidence: pd.DataFrame = None,
+    neutral_confidence: float = NEUTRAL_SENTIMENT_CONFIDENCE,
+    allow_short: bool = True,
+    cost: float = 0.0,
+    regime_window: int = REGIME_WINDOW
+) -> dict:
+    """
+    RED signals for every bar of `closes` (dates x symbols) and the
+    result of trading them.
+
+    `sentiment_score` / `sentiment_confidence` are optional frames shaped
+    like `closes`; missing bars get score 0 and `neutral_confidence`.
+    BUY goes long, SELL short (or flat if `allow_short` is False), HOLD
+    flat. `cost` is charged per unit of position change. Regime
+    volatility covers the last `regime_window` closes, like the live
+    pipeline's 6 month fetch; None uses all history up to each bar.
+
+    Returns:
+    {
+        signals, confidence, positions, returns, equity: DataFrames,
+        portfolio: equity Series, equal weight over listed symbols,
+        hit_rate: Series per symbol, share of held positions that
+            gained,
+        summary: dict
+    }
+    """
+    closes = closes.dropna(axis=1, how="all").ffill(limit_area="inside")
+    ind = batch_indicators(closes)
+
+    tech = tech_scores(ind)
+    regime = regime_matrix(closes, ind["rsi"], regime_window)
+    score = _align(sentiment_score, closes, 0.0)
+    confidence = _align(sentiment_confidence, closes, neutral_confidence)
+
+    red = red_engine_batch(tech, score, confidence, regime)
+    signals = red["signal"]
+
+    # A symbol trades from its first to its last real close
+    listed = closes.notna().to_numpy()
+    signals = np.where(listed, signals, "HOLD")
+
+    positions = np.select([signals == "BUY", signals == "SELL"], [1.0, -1.0 if allow_short else 0.0], default=0.0)
+
+    # Signal at the close of t earns the return from t to t+1
+    forward = closes.pct_change(fill_method=None).shift(-1).to_numpy()
+    live = np.isfinite(forward)
+    forward = np.where(live, forward, 0.0)
+    turnover = np.abs(np.diff(positions, axis=0, prepend=0.0))
+    returns = positions * forward - turnover * cost
+
+    # Hit rate counts positions actually held (long-only SELLs are flat)
+    traded = (positions != 0.0) & (forward != 0.0)
+    hits = traded & (np.sign(forward) == positions)
+
+    def frame(values):
+        return pd.DataFrame(values, index=closes.index, columns=closes.columns)
+
+    equity = frame(np.cumprod(1.0 + returns, axis=0))
+    # Equal weight over the symbols trading at each bar
+    portfolio_returns = returns.sum(axis=1) / np.maximum(live.sum(axis=1), 1)
+    portfolio = pd.Series(np.cumprod(1.0 + portfolio_returns), index=closes.index)
+
+    trade_counts = traded.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hit_rate = pd.Series(hits.sum(axis=0) / trade_counts, index=closes.columns)
+
+    total_trades = int(trade_counts.sum())
+    summary = {
+        "symbols": closes.shape[1],
+        "bars": closes.shape[0],
+        "signals": {label: int((signals == label).sum()) for label in SIGNALS},
+        "hit_rate": round(float(hits.sum() / total_trades), 4) if total_trades else None,
+        "total_return": round(float(portfolio.iloc[-1] - 1.0), 4) if len(portfolio) else 0.0,
+        "max_drawdown": round(float((portfolio / portfolio.cummax() - 1.0).min()), 4) if len(portfolio) else 0.0,
+    }
+
+    return {
+        "signals": frame(signals),
+        "confidence": frame(red["confidence"]),
+        "positions": frame(positions),
+        "returns": frame(returns),
+        "equity": equity,
+        "portfolio": portfolio,
+        "hit_rate": hit_rate,
+        "summary": summary
+    }
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.indicator_kernel import compute_indicators
+
+INDICATOR_COLUMNS = ("close", "sma", "ema", "rsi", "macd", "macd_signal", "macd_hist")
+
+
+# =====================================================
+# Close matrix
+# =====================================================
+def close_matrix(closes_by_symbol: dict) -> pd.DataFrame:
+    """
+    Aligns per-symbol close series into one (dates x symbols) frame.
+
+    Gaps inside a symbol's history (holidays on other exchanges, missing
+    prints) are forward-filled; dates before its first close and after
+    its last one stay NaN.
+    """
+    frame = pd.DataFrame({sym: s for sym, s in closes_by_symbol.items() if s is not None and len(s)})
+    return frame.sort_index().ffill(limit_area="inside")
+
+
+def batch_indicators(closes: pd.DataFrame) -> dict:
+    """
+    SMA / EMA / RSI / MACD for every symbol (column) of `closes` in one
+    kernel call. Returns {indicator: DataFrame} shaped like `closes`.
+    """
+    ind = compute_indicators(closes.ffill().to_numpy(dtype=np.float64))
+    return {
+        col: pd.DataFrame(ind[col], index=closes.index, columns=closes.columns)
+        for col in INDICATOR_COLUMNS
+    }
+
+
+# =====================================================
+# Vectorized signals and scores
+# =====================================================
+def signal_labels(rsi, macd) -> np.ndarray:
+    """
+    Element-wise `generate_signal`: BUY / SELL / HOLD for whole arrays.
+    """
+    rsi = np.asarray(rsi, dtype=np.float64)
+    macd = np.asarray(macd, dtype=np.float64)
+    return np.select(
+        [(rsi < 30) & (macd > 0), (rsi > 70) & (macd < 0)],
+        ["BUY", "SELL"],
+        default="HOLD"
+    )
+
+
+def tech_scores(ind: dict) -> np.ndarray:
+    """
+    `compute_tech_score` at every bar of every symbol.
+
+    Like the scalar version, the RSI is the last defined value (carried
+    forward over flat windows) and the score is 0 until a symbol has one.
+    """
+    rsi = pd.DataFrame(np.asarray(ind["rsi"], dtype=np.float64)).ffill().to_numpy()
+    macd = np.asarray(ind["macd"], dtype=np.float64)
+    signal = np.asarray(ind["macd_signal"], dtype=np.float64)
+
+    score = np.where(rsi < 30, 0.5, np.where(rsi > 70, -0.5, 0.0))
+    score += np.where(macd > signal, 0.5, -0.5)
+    return np.where(np.isnan(rsi), 0.0, score)
+
+
+def latest_snapshot(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per symbol with the indicators at its last bar, the rule
+    based signal and the technical score. Symbols without any close are
+    dropped.
+    """
+    closes = closes.dropna(axis=1, how="all")
+    ind = batch_indicators(closes)
+
+    last = {col: ind[col].to_numpy()[-1] for col in INDICATOR_COLUMNS} if len(closes) else {}
+    frame = pd.DataFrame(last, index=closes.columns)
+    if frame.empty:
+        return frame
+
+    frame["signal"] = signal_labels(frame["rsi"], frame["macd"])
+    frame["tech_score"] = tech_scores({col: ind[col].to_numpy() for col in ("rsi", "macd", "macd_signal")})[-1]
+    return frame
@@ -0,0 +1,260 @@
+import numpy as np
+import pandas as pd
+
+# =====================================================
+# Default periods (shared by every indicator call site)
+# =====================================================
+SMA_PERIOD = 14
+EMA_PERIOD = 14
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+# Part of every memo key for kernel results (see analysis_memo)
+INDICATOR_PARAMS = (SMA_PERIOD, EMA_PERIOD, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
+
+# From this many bars on, EMA recursions run in pandas' compiled `ewm`;
+# shorter series are faster in a plain loop than the pandas overhead
+EWM_MIN_BARS = 1000
+
+
+def ema_alpha(span: int) -> float:
+    """
+    Smoothing factor used by pandas `ewm(span=...)`.
+    """
+    return 2.0 / (span + 1.0)
+
+
+# =====================================================
+# Array helpers
+# =====================================================
+def as_float_array(values) -> np.ndarray:
+    """
+    Contiguous float64 copy-free view of `values` where possible.
+    """
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing `window` sum along axis 0; the first window-1 rows are NaN.
+
+    Windows are summed oldest to newest with one vector add per lag, so
+    the result is exact per window (no running-sum drift) and matches a
+    plain left-to-right sum of the same values.
+    """
+    n = values.shape[0]
+    out = np.full(values.shape, np.nan)
+    if n < window:
+        return out
+
+    acc = values[:n - window + 1].copy()
+    for lag in range(1, window):
+        acc += values[lag:n - window + 1 + lag]
+    out[window - 1:] = acc
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return rolling_sum(values, window) / window
+
+
+def ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    pandas `ewm(adjust=False)` of a 1-D or (bars x symbols) array; each
+    column is seeded at its first valid value. NaN inputs stay NaN, as
+    in the loop.
+    """
+    frame = pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+    out = frame.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return np.where(np.isnan(values), np.nan, out)
+
+
+def ema(values: np.ndarray, span: int = None, alpha: float = None) -> np.ndarray:
+    """
+    Recursive EMA seeded with the first value (pandas `adjust=False`).
+    """
+    a = alpha if alpha is not None else ema_alpha(span)
+    b = 1.0 - a
+    if len(values) == 0:
+        return np.empty(0)
+    if len(values) >= EWM_MIN_BARS:
+        return ewm(values, a)
+
+    vals = values.tolist()
+    prev = vals[0]
+    out = [prev]
+    for v in vals[1:]:
+        prev = b * prev + a * v
+        out.append(prev)
+    return np.array(out, dtype=np.float64)
+
+
+def rsi_from_delta(delta: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI from price changes using simple rolling means of gains and losses.
+    """
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+
+    avg_gain = rolling_mean(gain, period)
+    avg_loss = rolling_mean(loss, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        return 100.0 - (100.0 / (1.0 + rs))
+
+
+# =====================================================
+# Single-pass indicator kernel
+# =====================================================
+def compute_indicators(
+    close,
+    sma_period: int = SMA_PERIOD,
+    ema_period: int = EMA_PERIOD,
+    rsi_period: int = RSI_PERIOD,
+    fast: int = MACD_FAST,
+    slow: int = MACD_SLOW,
+    signal: int = MACD_SIGNAL
+) -> dict:
+    """
+    Computes SMA, EMA, RSI and MACD (line, signal, histogram) over one
+    contiguous float64 array of closes.
+
+    The price difference is taken once and shared by the RSI; all four
+    EMAs (EMA, MACD fast / slow, MACD signal) are advanced together in a
+    single loop over the closes (pandas `ewm` from EWM_MIN_BARS bars on).
+    Closes must not contain NaN.
+
+    Returns a dict of equally long float64 arrays; leading values that
+    need more history are NaN.
+
+    A 2-D (bars x symbols) array computes every column at once; see
+    `_compute_matrix`.
+    """
+    x = as_float_array(close)
+    if x.ndim == 2:
+        return _compute_matrix(x, sma_period, ema_period, rsi_period, fast, slow, signal)
+
+    n = len(x)
+
+    delta = np.empty(n)
+    if n:
+        delta[0] = np.nan
+        np.subtract(x[1:], x[:-1], out=delta[1:])
+
+    if n >= EWM_MIN_BARS:
+        return _compute_long(x, delta, sma_period, ema_period, rsi_period, fast, slow, signal)
+
+    ema_out, macd, macd_signal = [], [], []
+
+    if n:
+        a_e, a_f, a_s, a_g = ema_alpha(ema_period), ema_alpha(fast), ema_alpha(slow), ema_alpha(signal)
+        b_e, b_f, b_s, b_g = 1.0 - a_e, 1.0 - a_f, 1.0 - a_s, 1.0 - a_g
+
+        vals = x.tolist()
+        e = f = s = vals[0]
+        g = 0.0
+        ema_out.append(e)
+        macd.append(0.0)
+        macd_signal.append(g)
+        for v in vals[1:]:
+            e = b_e * e + a_e * v
+            f = b_f * f + a_f * v
+            s = b_s * s + a_s * v
+            m = f - s
+            g = b_g * g + a_g * m
+            ema_out.append(e)
+            macd.append(m)
+            macd_signal.append(g)
+
+    macd = np.array(macd, dtype=np.float64)
+    macd_signal = np.array(macd_signal, dtype=np.float64)
+
+    return {
+        "close": x,
+        "sma": rolling_mean(x, sma_period),
+        "ema": np.array(ema_out, dtype=np.float64),
+        "rsi": rsi_from_delta(delta, rsi_period),
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd - macd_signal,
+    }
+
+
+def _compute_long(x, delta, sma_period, ema_period, rsi_period, fast, slow, signal) -> dict:
+    """
+    Kernel for long histories (1-D or a matrix): the four EMAs run in
+    pandas `ewm` instead of a Python loop over the bars.
+    """
+    macd = ewm(x, ema_alpha(fast)) - ewm(x, ema_alpha(slow))
+    macd_signal = ewm(macd, ema_alpha(signal))
+
+    return {
+        "close": x,
+        "sma": rolling_mean(x, sma_period),
+        "ema": ewm(x, ema_alpha(ema_period)),
+        "rsi": rsi_from_delta(delta, rsi_period),
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd - macd_signal,
+    }
+
+
+def _compute_matrix(x, sma_period, ema_period, rsi_period, fast, slow, signal) -> dict:
+    """
+    Column-wise kernel for a (bars x symbols) close matrix.
+
+    Columns may start with NaN (symbols with shorter history); each EMA is
+    seeded at the column's first valid close, so every column gives the
+    same values as the 1-D kernel run on its own valid closes. Interior
+    NaNs must be filled by the caller.
+    """
+    n = x.shape[0]
+
+    delta = np.full(x.shape, np.nan)
+    np.subtract(x[1:], x[:-1], out=delta[1:])
+
+    if n >= EWM_MIN_BARS:
+        return _compute_long(x, delta, sma_period, ema_period, rsi_period, fast, slow, signal)
+
+    a_e, a_f, a_s, a_g = ema_alpha(ema_period), ema_alpha(fast), ema_alpha(slow), ema_alpha(signal)
+    b_e, b_f, b_s, b_g = 1.0 - a_e, 1.0 - a_f, 1.0 - a_s, 1.0 - a_g
+
+    ema_out = np.empty(x.shape)
+    macd = np.empty(x.shape)
+    macd_signal = np.empty(x.shape)
+
+    # Row at which each column gets its first close (EMAs are seeded there)
+    valid = ~np.isnan(x)
+    first = np.where(valid.any(axis=0), valid.argmax(axis=0), -1)
+    seeds = {t: np.flatnonzero(first == t) for t in np.unique(first[first >= 0]).tolist()}
+
+    # Advance all columns one bar at a time (vector ops across symbols)
+    e = f = s = g = np.full(x.shape[1], np.nan)
+    for t in range(n):
+        v = x[t]
+        e = b_e * e + a_e * v
+        f = b_f * f + a_f * v
+        s = b_s * s + a_s * v
+        cols = seeds.get(t)
+        if cols is not None:
+            e[cols] = f[cols] = s[cols] = v[cols]
+        m = f - s
+        g = b_g * g + a_g * m
+        if cols is not None:
+            g[cols] = 0.0
+        ema_out[t] = e
+        macd[t] = m
+        macd_signal[t] = g
+
+    return {
+        "close": x,
+        "sma": rolling_mean(x, sma_period),
+        "ema": ema_out,
+        "rsi": rsi_from_delta(delta, rsi_period),
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd - macd_signal,
+    }
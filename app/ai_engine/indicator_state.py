@@ -0,0 +1,342 @@
+import json
+import os
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.indicator_kernel import (
+    EMA_PERIOD,
+    MACD_FAST,
+    MACD_SIGNAL,
+    MACD_SLOW,
+    RSI_PERIOD,
+    SMA_PERIOD,
+    ema_alpha,
+)
+
+INDICATOR_STATE_DIR = os.getenv("INDICATOR_STATE_DIR", "data/indicator_state")
+
+NAN = float("nan")
+
+
+# =====================================================
+# Streaming indicator state
+# =====================================================
+class _Window:
+    """
+    Fixed-size ring buffer with a running sum, O(1) per push.
+
+    Every `size` pushes the sum is recomputed oldest to newest like the
+    batch kernel, so rounding drift never builds up; a window of zeros
+    sums to exactly 0.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.nonzero = 0
+        self.pushes = 0
+
+    def _after(self, value: float):
+        total = self.total + value
+        nonzero = self.nonzero + (value != 0.0)
+        if len(self.values) == self.size:
+            oldest = self.values[0]
+            total -= oldest
+            nonzero -= oldest != 0.0
+        return total, nonzero
+
+    def mean_with(self, value) -> float:
+        """
+        Mean after pushing `value` (None: nothing pushed), without
+        pushing it. NaN until the window is full.
+        """
+        if value is None:
+            count, total, nonzero = len(self.values), self.total, self.nonzero
+        else:
+            count = min(len(self.values) + 1, self.size)
+            total, nonzero = self._after(value)
+        if count < self.size:
+            return NAN
+        return total / self.size if nonzero else 0.0
+
+    def push(self, value: float):
+        self.total, self.nonzero = self._after(value)
+        self.values.append(value)
+        self.pushes += 1
+        if not self.nonzero:
+            self.total = 0.0
+        elif self.pushes % self.size == 0:
+            self.resync()
+
+    def resync(self):
+        total = 0.0
+        if self.values:
+            total = self.values[0]
+            for v in list(self.values)[1:]:
+                total += v
+        self.total = total
+        self.nonzero = sum(v != 0.0 for v in self.values)
+
+
+class IndicatorState:
+    """
+    Running SMA / EMA / RSI / MACD values that advance one close at a time.
+
+    Each update is O(1) in the length of the history: the EMAs are carried
+    forward and the SMA and RSI windows keep running sums over fixed-size
+    ring buffers. Feeding closes c[0..t] one by one gives the values the
+    batch kernel (`compute_indicators`) returns at bar t for the same
+    closes, up to rounding in the window sums.
+    """
+
+    def __init__(
+        self,
+        sma_period: int = SMA_PERIOD,
+        ema_period: int = EMA_PERIOD,
+        rsi_period: int = RSI_PERIOD,
+        fast: int = MACD_FAST,
+        slow: int = MACD_SLOW,
+        signal: int = MACD_SIGNAL
+    ):
+        self.params = {
+            "sma_period": sma_period,
+            "ema_period": ema_period,
+            "rsi_period": rsi_period,
+            "fast": fast,
+            "slow": slow,
+            "signal": signal,
+        }
+        self.count = 0
+        self.last_close = None
+        self.last_timestamp = None
+        self.ema = self.ema_fast = self.ema_slow = self.macd_signal = 0.0
+        self.closes = _Window(sma_period)
+        self.gains = _Window(rsi_period)
+        self.losses = _Window(rsi_period)
+        self._alphas = tuple(ema_alpha(span) for span in (ema_period, fast, slow, signal))
+
+    # -------------------------------
+    # Core step
+    # -------------------------------
+    def _step(self, close: float) -> dict:
+        """
+        State after appending `close`, without modifying self.
+        """
+        if self.count == 0:
+            e = f = s = close
+            g = 0.0
+            gain = loss = None
+        else:
+            a_e, a_f, a_s, a_g = self._alphas
+            e = (1.0 - a_e) * self.ema + a_e * close
+            f = (1.0 - a_f) * self.ema_fast + a_f * close
+            s = (1.0 - a_s) * self.ema_slow + a_s * close
+            g = (1.0 - a_g) * self.macd_signal + a_g * (f - s)
+
+            delta = close - self.last_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+        return {"ema": e, "ema_fast": f, "ema_slow": s, "macd_signal": g, "gain": gain, "loss": loss}
+
+    def _values(self, close: float, step: dict) -> dict:
+        sma = self.closes.mean_with(close)
+        avg_gain = self.gains.mean_with(step["gain"])
+        avg_loss = self.losses.mean_with(step["loss"])
+
+        if avg_gain != avg_gain or avg_loss != avg_loss:
+            rsi = NAN
+        elif avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else NAN
+        else:
+            rsi = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+        macd = step["ema_fast"] - step["ema_slow"]
+        return {
+            "close": close,
+            "sma": sma,
+            "ema": step["ema"],
+            "rsi": rsi,
+            "macd": macd,
+            "macd_signal": step["macd_signal"],
+            "macd_hist": macd - step["macd_signal"],
+        }
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    def update(self, close: float, timestamp=None) -> dict:
+        """
+        Commits a new bar and returns the indicator values at it.
+        """
+        close = float(close)
+        step = self._step(close)
+        values = self._values(close, step)
+
+        self.ema, self.ema_fast, self.ema_slow = step["ema"], step["ema_fast"], step["ema_slow"]
+        self.macd_signal = step["macd_signal"]
+        self.closes.push(close)
+        if step["gain"] is not None:
+            self.gains.push(step["gain"])
+            self.losses.push(step["loss"])
+
+        self.count += 1
+        self.last_close = close
+        self.last_timestamp = timestamp
+        return values
+
+    def peek(self, close: float) -> dict:
+        """
+        Indicator values if `close` were the next bar, without committing
+        it. Used for the still-forming (intraday) bar.
+        """
+        close = float(close)
+        return self._values(close, self._step(close))
+
+    @classmethod
+    def from_closes(cls, closes: pd.Series, **params) -> "IndicatorState":
+        state = cls(**params)
+        for ts, close in zip(closes.index, closes.to_numpy(dtype=np.float64).tolist()):
+            state.update(close, ts)
+        return state
+
+    # -------------------------------
+    # Serialization
+    # -------------------------------
+    def to_dict(self) -> dict:
+        return {
+            "params": self.params,
+            "count": self.count,
+            "last_close": self.last_close,
+            "last_timestamp": self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+            "ema": self.ema,
+            "ema_fast": self.ema_fast,
+            "ema_slow": self.ema_slow,
+            "macd_signal": self.macd_signal,
+            "closes": list(self.closes.values),
+            "gains": list(self.gains.values),
+            "losses": list(self.losses.values),
+            "sums": [w.total for w in self._windows()],
+            "pushes": [w.pushes for w in self._windows()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndicatorState":
+        state = cls(**data["params"])
+        state.count = data["count"]
+        state.last_close = data["last_close"]
+        if data["last_timestamp"] is not None:
+            state.last_timestamp = pd.Timestamp(data["last_timestamp"])
+        state.ema = data["ema"]
+        state.ema_fast = data["ema_fast"]
+        state.ema_slow = data["ema_slow"]
+        state.macd_signal = data["macd_signal"]
+        windows = zip(state._windows(), (data["closes"], data["gains"], data["losses"]), data["sums"], data["pushes"])
+        for window, values, total, pushes in windows:
+            window.values.extend(values)
+            window.resync()
+            window.total, window.pushes = total, pushes
+        return state
+
+    def _windows(self):
+        return self.closes, self.gains, self.losses
+
+
+# =====================================================
+# Per-symbol persistence
+# =====================================================
+_states = {}
+_symbol_locks = {}
+
+# Guards the two dicts above; each symbol's state has its own lock
+_lock = threading.Lock()
+
+
+def _symbol_lock(key: str) -> threading.Lock:
+    with _lock:
+        lock = _symbol_locks.get(key)
+        if lock is None:
+            lock = _symbol_locks[key] = threading.Lock()
+        return lock
+
+
+def _state_path(symbol: str) -> str:
+    safe = symbol.upper().replace("/", "_").replace("\\", "_").replace(":", "_")
+    return os.path.join(INDICATOR_STATE_DIR, f"{safe}.json")
+
+
+def load_state(symbol: str):
+    try:
+        with open(_state_path(symbol)) as f:
+            return IndicatorState.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_state(symbol: str, state):
+    """
+    Writes `state` (an IndicatorState or its `to_dict()` snapshot).
+    """
+    data = state.to_dict() if isinstance(state, IndicatorState) else state
+    path = _state_path(symbol)
+    try:
+        os.makedirs(INDICATOR_STATE_DIR, exist_ok=True)
+        # Per-thread temp file: writers of one symbol never share it
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Could not persist indicator state for {symbol}: {e}")
+
+
+def _is_consistent(state: IndicatorState, closes: pd.Series) -> bool:
+    """
+    The state can be continued with `closes` if its last committed bar is
+    still in the series with the same close (no gap, no back-adjustment).
+    """
+    ts = state.last_timestamp
+    if ts is None or ts not in closes.index:
+        return False
+    return closes.loc[ts] == state.last_close
+
+
+def latest_indicators(symbol: str, closes: pd.Series) -> dict:
+    """
+    Indicator values at the last bar of `closes` for `symbol`.
+
+    Completed bars are committed to the symbol's persisted state; the last
+    bar may still be forming, so it is only peeked. A state that cannot be
+    continued (first call, gap, adjusted history) is rebuilt from `closes`.
+
+    Only calls for the same symbol wait for each other; the state file is
+    written after the symbol's lock is released.
+    """
+    closes = closes.dropna()
+    key = symbol.upper()
+
+    with _symbol_lock(key):
+        state = _states.get(key) or load_state(key)
+
+        if state is None or not _is_consistent(state, closes):
+            state = IndicatorState.from_closes(closes.iloc[:-1])
+            dirty = True
+        else:
+            completed = closes.iloc[:-1]
+            new_bars = completed[completed.index > state.last_timestamp]
+            for ts, close in new_bars.items():
+                state.update(close, ts)
+            dirty = len(new_bars) > 0
+
+        with _lock:
+            _states[key] = state
+        snapshot = state.to_dict() if dirty else None
+        values = state.peek(closes.iloc[-1])
+
+    if snapshot is not None:
+        save_state(key, snapshot)
+    return values
@@ -1,6 +1,17 @@
 import pandas as pd
 import numpy as np
 
+from app.ai_engine.indicator_kernel import (
+    as_float_array,
+    compute_indicators,
+    ema,
+    rolling_mean,
+    rsi_from_delta,
+)
+
+# All functions below are thin pandas wrappers around the NumPy
+# indicator kernel; NaN closes are dropped before computing.
+
 # =====================================================
 # Relative Strength Index (RSI)
 # =====================================================
@@ -8,18 +19,11 @@ def calculate_rsi(close_prices: pd.Series, period: int = 14) -> pd.Series:
     """
     RSI measures momentum to identify overbought or oversold conditions.
     """
-    delta = close_prices.diff()
-
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    close_prices = close_prices.dropna()
+    x = as_float_array(close_prices)
+    delta = np.concatenate(([np.nan], np.diff(x)))
 
-    return rsi
+    return pd.Series(rsi_from_delta(delta, period), index=close_prices.index)
 
 
 # =====================================================
@@ -29,7 +33,8 @@ def calculate_sma(close_prices: pd.Series, period: int) -> pd.Series:
     """
     SMA calculates the average price over a fixed period.
     """
-    return close_prices.rolling(window=period).mean()
+    close_prices = close_prices.dropna()
+    return pd.Series(rolling_mean(as_float_array(close_prices), period), index=close_prices.index)
 
 
 # =====================================================
@@ -39,7 +44,8 @@ def calculate_ema(close_prices: pd.Series, period: int) -> pd.Series:
     """
     EMA gives more weight to recent prices for faster reaction.
     """
-    return close_prices.ewm(span=period, adjust=False).mean()
+    close_prices = close_prices.dropna()
+    return pd.Series(ema(as_float_array(close_prices), period), index=close_prices.index)
 
 
 # =====================================================
@@ -49,11 +55,12 @@ def calculate_macd(close_prices: pd.Series):
     """
     MACD identifies trend direction and momentum.
     """
-    ema_12 = calculate_ema(close_prices, 12)
-    ema_26 = calculate_ema(close_prices, 26)
+    close_prices = close_prices.dropna()
+    ind = compute_indicators(close_prices.to_numpy())
+    index = close_prices.index
 
-    macd_line = ema_12 - ema_26
-    signal_line = macd_line.ewm(span=9, adjust=False).mean()
-    histogram = macd_line - signal_line
+    macd_line = pd.Series(ind["macd"], index=index)
+    signal_line = pd.Series(ind["macd_signal"], index=index)
+    histogram = pd.Series(ind["macd_hist"], index=index)
 
     return macd_line, signal_line, histogram
@@ -0,0 +1,106 @@
+import re
+from bisect import bisect_right
+
+
+# =====================================================
+# Trie regex
+# =====================================================
+def trie_pattern(words) -> str:
+    """
+    One regex alternation for `words`, factored as a trie so that common
+    prefixes are matched once ("gain", "gains", "growth" ->
+    "g(?:ain(?:s)?|rowth)"). Matching cost grows with the length of the
+    text, not with the number of words.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(alternatives) + ")?"
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return build(trie) if trie else "(?!)"
+
+
+# =====================================================
+# Matcher
+# =====================================================
+class KeywordMatcher:
+    """
+    Matches labelled keyword lists against many texts, built once.
+
+    `keywords` maps a label to its words; when a word appears under two
+    labels the first label wins. Texts are lowercased.
+
+    words=True   whole whitespace-separated tokens (same as testing each
+                 token of `text.lower().split()` against the lists); one
+                 dict lookup per token, whatever the lexicon size
+    words=False  substrings anywhere in the text (same as `kw in text`);
+                 one trie regex scan over all texts instead of one scan
+                 per keyword
+    """
+
+    def __init__(self, keywords: dict, words: bool = True):
+        self.words = words
+        self.label_of = {}
+        for label, terms in keywords.items():
+            for term in terms:
+                self.label_of.setdefault(term.lower(), label)
+
+        if not words:
+            # Lookahead finds a match at every start position, so
+            # overlapping keywords are all seen
+            self.regex = re.compile("(?=(" + trie_pattern(self.label_of) + "))")
+
+            # A match also implies every keyword that is a prefix of it
+            self.implied = {
+                term: {self.label_of[term[:i]] for i in range(1, len(term) + 1) if term[:i] in self.label_of}
+                for term in self.label_of
+            }
+
+    def counts(self, texts) -> list:
+        """
+        {label: number of matches} for each text.
+        """
+        if self.words:
+            return [self._count_tokens(text) for text in texts]
+
+        # Substrings: one scan over all texts joined by newlines
+        lowered = [text.lower() for text in texts]
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        results = [{} for _ in lowered]
+        for match in self.regex.finditer("\n".join(lowered)):
+            counts = results[bisect_right(starts, match.start()) - 1]
+            for label in self.implied[match.group(1)]:
+                counts[label] = counts.get(label, 0) + 1
+        return results
+
+    def _count_tokens(self, text: str) -> dict:
+        counts = {}
+        label_of = self.label_of
+        for token in text.lower().split():
+            label = label_of.get(token)
+            if label is not None:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def labels(self, texts) -> list:
+        """
+        Set of matched labels for each text.
+        """
+        return [set(counts) for counts in self.counts(texts)]
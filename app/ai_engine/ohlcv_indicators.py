@@ -0,0 +1,127 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.ai_engine.indicator_kernel import as_float_array, ema, rolling_mean, rolling_sum
+
+# =====================================================
+# Default periods
+# =====================================================
+ATR_PERIOD = 14
+BOLLINGER_PERIOD = 20
+BOLLINGER_STD = 2.0
+STOCH_K_PERIOD = 14
+STOCH_D_PERIOD = 3
+VWAP_PERIOD = 20
+
+# Indicator group -> output columns
+OHLCV_FIELDS = {
+    "atr": ("atr",),
+    "bollinger": ("bb_upper", "bb_middle", "bb_lower", "bb_width"),
+    "stochastic": ("stoch_k", "stoch_d"),
+    "obv": ("obv",),
+    "vwap": ("vwap",),
+}
+
+
+# =====================================================
+# Window helpers
+# =====================================================
+def _rolling(values: np.ndarray, window: int, reduce) -> np.ndarray:
+    """
+    Applies `reduce` (np.max, np.std, ...) over each trailing window;
+    the first window-1 values are NaN.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = reduce(sliding_window_view(values, window), axis=-1)
+    return out
+
+
+def true_range(high, low, prev_close) -> np.ndarray:
+    """
+    Largest of the bar range and the gaps from the previous close. The
+    first bar (no previous close) uses its high - low range.
+    """
+    with np.errstate(invalid="ignore"):
+        tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return tr
+
+
+# =====================================================
+# OHLCV kernel
+# =====================================================
+def compute_ohlcv_indicators(bars, fields=None) -> dict:
+    """
+    Volatility, band, oscillator and volume indicators from one OHLCV
+    block (DataFrame with Open / High / Low / Close / Volume).
+
+    `fields` selects indicator groups (see OHLCV_FIELDS); only those are
+    computed. Columns are converted to float64 arrays once and the
+    previous close is shared by ATR and OBV.
+
+    Bars with a NaN high, low or close are skipped (NaN in the output),
+    so one missing bar does not poison the running ATR and OBV; a NaN
+    volume counts as 0.
+
+    Returns {column: float64 array} aligned with `bars`.
+    """
+    groups = list(OHLCV_FIELDS) if fields is None else [f for f in OHLCV_FIELDS if f in fields]
+
+    high = as_float_array(bars["High"])
+    low = as_float_array(bars["Low"])
+    close = as_float_array(bars["Close"])
+    volume = np.nan_to_num(as_float_array(bars["Volume"]))
+
+    valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(close))
+    if not valid.all():
+        out = compute_ohlcv_indicators({
+            "High": high[valid], "Low": low[valid], "Close": close[valid], "Volume": volume[valid]
+        }, groups)
+        for col, values in out.items():
+            out[col] = np.full(len(valid), np.nan)
+            out[col][valid] = values
+        return out
+
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+
+    out = {}
+
+    if "atr" in groups:
+        # Wilder smoothing: EMA with alpha = 1 / period
+        tr = true_range(high, low, prev_close)
+        atr = ema(tr, alpha=1.0 / ATR_PERIOD)
+        atr[:ATR_PERIOD - 1] = np.nan
+        out["atr"] = atr
+
+    if "bollinger" in groups:
+        middle = rolling_mean(close, BOLLINGER_PERIOD)
+        width = BOLLINGER_STD * _rolling(close, BOLLINGER_PERIOD, np.std)
+        out["bb_upper"] = middle + width
+        out["bb_middle"] = middle
+        out["bb_lower"] = middle - width
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out["bb_width"] = 2.0 * width / middle
+
+    if "stochastic" in groups:
+        highest = _rolling(high, STOCH_K_PERIOD, np.max)
+        lowest = _rolling(low, STOCH_K_PERIOD, np.min)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stoch_k = 100.0 * (close - lowest) / (highest - lowest)
+        stoch_k[highest == lowest] = np.nan
+        out["stoch_k"] = stoch_k
+        out["stoch_d"] = rolling_mean(stoch_k, STOCH_D_PERIOD)
+
+    if "obv" in groups:
+        direction = np.sign(close - prev_close)
+        direction[:1] = 0.0
+        out["obv"] = np.cumsum(direction * volume)
+
+    if "vwap" in groups:
+        typical = (high + low + close) / 3.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out["vwap"] = rolling_sum(typical * volume, VWAP_PERIOD) / rolling_sum(volume, VWAP_PERIOD)
+
+    return out
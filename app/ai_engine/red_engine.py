@@ -1,3 +1,9 @@
+import numpy as np
+
+# Integer regime codes for the batch engine
+REGIME_CODES = {"Trending": 0, "Volatile": 1, "Range-Bound": 2, "Uncertain": 3}
+
+
 def red_engine(
     tech_score: float,
     sentiment: dict,
@@ -93,3 +99,60 @@ def red_engine(
         "risk": risk,
         "reasons": reasons
     }
+
+
+# =====================================================
+# Batch engine
+# =====================================================
+def regime_codes(regimes) -> np.ndarray:
+    """
+    Regime labels -> REGIME_CODES (unknown labels -> Uncertain).
+    """
+    uncertain = REGIME_CODES["Uncertain"]
+    return np.array([REGIME_CODES.get(r, uncertain) for r in regimes], dtype=np.int8)
+
+
+def red_engine_batch(tech_score, sentiment_score, sentiment_confidence, regime) -> dict:
+    """
+    Element-wise `red_engine` for aligned arrays (symbols, days, or both).
+    `regime` holds REGIME_CODES. Returns {"signal", "confidence", "risk"}
+    arrays with the same values as calling `red_engine` per element;
+    reasons are left out.
+    """
+    tech = np.asarray(tech_score, dtype=np.float64)
+    sent = np.asarray(sentiment_score, dtype=np.float64)
+    sent_conf = np.asarray(sentiment_confidence, dtype=np.float64)
+    regime = np.asarray(regime)
+
+    trending = regime == REGIME_CODES["Trending"]
+    volatile = regime == REGIME_CODES["Volatile"]
+
+    # 1. Regime-based weighting
+    tech_w = np.select([trending, volatile], [0.6, 0.4], default=0.5)
+    sent_w = np.select([trending, volatile], [0.4, 0.6], default=0.5)
+    score = tech * tech_w + sent * sent_w
+
+    # 3. Final decision
+    buy = score > 0.4
+    sell = score < -0.4
+    strength = np.minimum(np.abs(score) * 100, 95)
+    dist = 1.0 - (np.abs(score) / 0.4)
+    hold_conf = 40 + (dist * 35) + (score * 5)
+    raw_conf = np.where(buy | sell, strength, hold_conf)
+
+    # 4. Mix in input confidence
+    confidence = np.maximum((raw_conf * 0.7) + (sent_conf * 100 * 0.3), 40)
+    signal = np.select([buy, sell], ["BUY", "SELL"], default="HOLD")
+    risk = np.where(volatile | (confidence < 50), "High", "Medium")
+
+    # 2. Disagreement handling overrides the decision
+    disagree = sent_conf < 0.4
+    signal = np.where(disagree, "HOLD", signal)
+    confidence = np.where(disagree, 35.0, confidence)
+    risk = np.where(disagree, np.where(volatile, "High", "Medium"), risk)
+
+    return {
+        "signal": signal,
+        "confidence": confidence,
+        "risk": risk
+    }
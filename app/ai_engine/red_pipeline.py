@@ -1,27 +1,45 @@
-import yfinance as yf
+import numpy as np
 
-from app.ai_engine.indicators import calculate_rsi, calculate_macd
+from app import analysis_memo
+from app.fetcher import fetch_history
+from app.indicators import indicator_frame
+from app.ai_engine.indicator_kernel import INDICATOR_PARAMS, compute_indicators
+from app.providers import get_provider
 from app.ai_engine.sentiment_ensemble import multi_source_sentiment
-from app.ai_engine.regime import detect_market_regime
+from app.ai_engine.regime import regime_for_symbol
 from app.ai_engine.red_engine import red_engine
 from app.ai_engine.explainability import generate_explanation
 
 
-def compute_tech_score(close_prices):
+def compute_tech_score(close_prices, symbol: str = None, interval: str = "1d"):
     """
     Converts indicators into a normalized technical score [-1, +1]
     """
+    if symbol is not None:
+        close_prices = close_prices.dropna()
+        return analysis_memo.memoize(
+            "tech_score", symbol, close_prices,
+            lambda: _tech_score(indicator_frame(close_prices, symbol, interval)),
+            interval,
+            INDICATOR_PARAMS
+        )
 
-    rsi_series = calculate_rsi(close_prices).dropna()
+    # Unshared: the kernel arrays are enough, no frame needed
+    return _tech_score(compute_indicators(close_prices.dropna().to_numpy()))
 
-    if rsi_series.empty:
+
+def _tech_score(ind):
+    # RSI and MACD from one pass of the indicator kernel (frame or arrays)
+    rsi_values = np.asarray(ind["rsi"])
+    rsi_values = rsi_values[~np.isnan(rsi_values)]
+
+    if len(rsi_values) == 0:
         return 0.0
 
-    rsi = float(rsi_series.iloc[-1].item()) # ✅ scalar
+    rsi = float(rsi_values[-1]) # ✅ scalar
 
-    macd, signal, _ = calculate_macd(close_prices)
-    macd_val = float(macd.dropna().iloc[-1].item())
-    signal_val = float(signal.dropna().iloc[-1].item())
+    macd_val = float(np.asarray(ind["macd"])[-1])
+    signal_val = float(np.asarray(ind["macd_signal"])[-1])
 
     score = 0.0
 
@@ -42,7 +60,8 @@ def compute_tech_score(close_prices):
 
 def red_engine_for_stock(
     stock_symbol: str,
-    news_headlines: list
+    news_headlines: list,
+    market: str = "GLOBAL"
 ):
     """
     Full RED pipeline for a given stock.
@@ -51,9 +70,9 @@ def red_engine_for_stock(
     # -------------------------------
     # 1. Load stock data
     # -------------------------------
-    data = yf.download(stock_symbol, period="6mo", progress=False)
+    data = fetch_history(stock_symbol, "6mo", get_provider(market))
 
-    if data.empty:
+    if data is None or data.empty:
         return {"error": "No stock data available"}
 
     close = data["Close"]
@@ -61,7 +80,7 @@ def red_engine_for_stock(
     # -------------------------------
     # 2. Technical score (dynamic!)
     # -------------------------------
-    tech_score = compute_tech_score(close)
+    tech_score = compute_tech_score(close, symbol=stock_symbol)
 
     # -------------------------------
     # 3. Sentiment ensemble (dynamic!)
@@ -71,8 +90,8 @@ def red_engine_for_stock(
     # -------------------------------
     # 4. Market regime (dynamic!)
     # -------------------------------
-    rsi_series = calculate_rsi(close)
-    regime = detect_market_regime(close, rsi_series)
+    # Shares the memoized indicator frame with the tech score above
+    regime = regime_for_symbol(stock_symbol, close)
 
     # -------------------------------
     # 5. RED Engine decision
@@ -1,16 +1,30 @@
 import numpy as np
 import pandas as pd
 
+from app import analysis_memo
+from app.ai_engine.indicator_kernel import INDICATOR_PARAMS
+from app.indicators import indicator_frame
+from app.resample import DAYS_PER_BAR
 
-def detect_market_regime(close_prices: pd.Series, rsi_series: pd.Series):
+# Daily return volatility above which the market is "Volatile"
+VOLATILITY_THRESHOLD = 0.025
+
+# Defined RSI values whose range decides "Range-Bound"
+RSI_RANGE_BARS = 20
+
+
+def detect_market_regime(close_prices: pd.Series, rsi_series: pd.Series, interval: str = "1d"):
     """
     Detects the current market regime using volatility and RSI behavior.
 
+    For weekly / monthly bars the volatility threshold is scaled by the
+    square root of the trading days per bar.
+
     Returns:
         regime: Trending | Range-Bound | Volatile | Uncertain
     """
 
-    # Daily returns
+    # Per-bar returns
     returns = close_prices.pct_change().dropna()
 
     # Need at least a few points to calculate vol
@@ -22,12 +36,12 @@ def detect_market_regime(close_prices: pd.Series, rsi_series: pd.Series):
 
     # RSI characteristics
     try:
-        # Get up to last 20 points, but handle if we have fewer
+        # Get up to last RSI_RANGE_BARS points, but handle if we have fewer
         recent_rsi = rsi_series.dropna()
         if recent_rsi.empty:
              return "Uncertain"
              
-        recent_rsi = recent_rsi.iloc[-20:]
+        recent_rsi = recent_rsi.iloc[-RSI_RANGE_BARS:]
         
         rsi_range = float(recent_rsi.max() - recent_rsi.min())
         latest_rsi = float(recent_rsi.iloc[-1])
@@ -36,7 +50,7 @@ def detect_market_regime(close_prices: pd.Series, rsi_series: pd.Series):
         return "Uncertain"
 
     # ----- Regime rules -----
-    if volatility > 0.025:
+    if volatility > VOLATILITY_THRESHOLD * np.sqrt(DAYS_PER_BAR[interval]):
         return "Volatile"
 
     if latest_rsi > 60 or latest_rsi < 40:
@@ -46,3 +60,101 @@ def detect_market_regime(close_prices: pd.Series, rsi_series: pd.Series):
         return "Range-Bound"
 
     return "Uncertain"
+
+
+def regime_for_symbol(symbol: str, close_prices: pd.Series, interval: str = "1d"):
+    """
+    `detect_market_regime` for a symbol's close series, reusing the
+    memoized indicator frame for the RSI. Memoized until the next bar.
+    """
+    close_prices = close_prices.dropna()
+
+    def compute():
+        rsi_series = indicator_frame(close_prices, symbol, interval)["rsi"]
+        return detect_market_regime(close_prices, rsi_series, interval)
+
+    params = INDICATOR_PARAMS + (VOLATILITY_THRESHOLD, RSI_RANGE_BARS)
+    return analysis_memo.memoize("regime", symbol, close_prices, compute, interval, params)
+
+
+def regime_series(
+    close_prices: pd.Series,
+    rsi_series: pd.Series,
+    interval: str = "1d",
+    window: int = None
+) -> pd.Series:
+    """
+    Regime label at every bar, vectorized.
+
+    Each bar sees only the data up to it and uses the same rules as
+    `detect_market_regime`: volatility over all returns so far (or the
+    last `window` returns), and the last RSI_RANGE_BARS defined RSI values. The label
+    on the final bar (with `window=None`) equals the scalar function's.
+    """
+    returns = close_prices.pct_change()
+
+    if window is None:
+        volatility = returns.expanding(min_periods=1).std(ddof=0)
+    else:
+        volatility = returns.rolling(window, min_periods=1).std(ddof=0)
+    enough_returns = returns.notna().cumsum() >= 5
+
+    # RSI window over the defined values, then carried to every bar
+    rsi = rsi_series.dropna()
+    recent = rsi.rolling(RSI_RANGE_BARS, min_periods=1)
+    rsi_range = (recent.max() - recent.min()).reindex(close_prices.index).ffill()
+    latest_rsi = rsi.reindex(close_prices.index).ffill()
+
+    labels = np.select(
+        [
+            ~enough_returns.to_numpy() | latest_rsi.isna().to_numpy(),
+            volatility.to_numpy() > VOLATILITY_THRESHOLD * np.sqrt(DAYS_PER_BAR[interval]),
+            (latest_rsi > 60).to_numpy() | (latest_rsi < 40).to_numpy(),
+            (rsi_range < 15).to_numpy(),
+        ],
+        ["Uncertain", "Volatile", "Trending", "Range-Bound"],
+        default="Uncertain"
+    )
+    return pd.Series(labels, index=close_prices.index)
+
+
+def regime_frame(
+    closes: pd.DataFrame,
+    rsi: pd.DataFrame,
+    interval: str = "1d",
+    window: int = None
+) -> pd.DataFrame:
+    """
+    `regime_series` for every column of a (dates x symbols) close frame.
+
+    Columns whose RSI has gaps after its first value (flat stretches)
+    need the RSI window over defined values only and go through
+    `regime_series`; all others are labelled in one pass.
+    """
+    returns = closes.pct_change(fill_method=None)
+
+    if window is None:
+        volatility = returns.expanding(min_periods=1).std(ddof=0)
+    else:
+        volatility = returns.rolling(window, min_periods=1).std(ddof=0)
+    enough_returns = returns.notna().cumsum() >= 5
+
+    recent = rsi.rolling(RSI_RANGE_BARS, min_periods=1)
+    rsi_range = recent.max() - recent.min()
+
+    labels = np.select(
+        [
+            ~enough_returns.to_numpy() | rsi.isna().to_numpy(),
+            volatility.to_numpy() > VOLATILITY_THRESHOLD * np.sqrt(DAYS_PER_BAR[interval]),
+            (rsi > 60).to_numpy() | (rsi < 40).to_numpy(),
+            (rsi_range < 15).to_numpy(),
+        ],
+        ["Uncertain", "Volatile", "Trending", "Range-Bound"],
+        default="Uncertain"
+    )
+    labels = pd.DataFrame(labels, index=closes.index, columns=closes.columns)
+
+    gaps = (rsi.isna() & rsi.ffill().notna()).any()
+    for symbol in gaps.index[gaps.to_numpy()]:
+        labels[symbol] = regime_series(closes[symbol], rsi[symbol], interval, window)
+    return labels
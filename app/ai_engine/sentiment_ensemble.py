@@ -1,11 +1,33 @@
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
+import os
+import threading
+
+from app import headline_cache
+from app.ai_engine.keyword_matcher import KeywordMatcher
 
 # -------------------------------
-# Initialize VADER (once)
+# VADER (loaded on first use)
 # -------------------------------
-nltk.download('vader_lexicon', quiet=True)
-vader = SentimentIntensityAnalyzer()
+# The lexicon ships with the app, so loading never touches the network
+# and cold starts do not pay for nltk until a headline is scored.
+NLTK_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nltk_data")
+VADER_LEXICON = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+_vader = None
+_vader_lock = threading.Lock()
+
+
+def get_vader():
+    global _vader
+    if _vader is None:
+        with _vader_lock:
+            if _vader is None:
+                import nltk
+                from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+                if NLTK_DATA_DIR not in nltk.data.path:
+                    nltk.data.path.insert(0, NLTK_DATA_DIR)
+                _vader = SentimentIntensityAnalyzer(lexicon_file=VADER_LEXICON)
+    return _vader
 
 # -------------------------------
 # Simple financial lexicon
@@ -21,28 +43,33 @@ NEGATIVE_WORDS = {
 }
 
 
+# Built once from both word lists; one lookup per headline token
+LEXICON_MATCHER = KeywordMatcher({1: POSITIVE_WORDS, -1: NEGATIVE_WORDS})
+
+
 # -------------------------------
 # Lexicon-based sentiment
 # -------------------------------
-def lexicon_sentiment(text: str) -> float:
+def lexicon_sentiments(headlines) -> list:
     """
-    Rule-based sentiment using a financial lexicon.
-    Output normalized to range [-1, 1].
+    Rule-based sentiment using a financial lexicon, for a batch of
+    headlines. Each output normalized to range [-1, 1].
     """
-    words = text.lower().split()
-    score = 0
+    scores = []
+    for counts in LEXICON_MATCHER.counts(headlines):
+        score = counts.get(1, 0) - counts.get(-1, 0)
+
+        # Normalize score
+        scores.append(0.0 if score == 0 else max(min(score / 5, 1.0), -1.0))
+    return scores
 
-    for w in words:
-        if w in POSITIVE_WORDS:
-            score += 1
-        elif w in NEGATIVE_WORDS:
-            score -= 1
 
-    # Normalize score
-    if score == 0:
-        return 0.0
+def lexicon_sentiment(text: str) -> float:
+    return lexicon_sentiments([text])[0]
+
 
-    return max(min(score / 5, 1.0), -1.0)
+def vader_compound(text: str) -> float:
+    return get_vader().polarity_scores(text)["compound"]
 
 
 # -------------------------------
@@ -72,12 +99,9 @@ def multi_source_sentiment(headlines):
             }
         }
 
-    vader_scores = []
-    lexicon_scores = []
-
-    for text in headlines:
-        vader_scores.append(vader.polarity_scores(text)["compound"])
-        lexicon_scores.append(lexicon_sentiment(text))
+    # Only headlines not seen before are scored
+    vader_scores = headline_cache.scores(headlines, "vader", vader_compound)
+    lexicon_scores = headline_cache.scores(headlines, "lexicon", batch_scorer=lexicon_sentiments)
 
     avg_vader = sum(vader_scores) / len(vader_scores)
     avg_lexicon = sum(lexicon_scores) / len(lexicon_scores)
@@ -0,0 +1,80 @@
+# analysis_memo.py
+# Memo for per-bar analysis results (indicator frames, regimes, tech scores).
+#
+# Every result depends only on the price series it was computed from, so it
+# is stored under (kind, symbol, interval, params) together with a
+# fingerprint of that series (first / last bar, length, last close). The
+# entry stays valid until the series advances or is revised; a new bar (or
+# a new intraday close for the forming bar) changes the fingerprint and the
+# value is recomputed and replaced in place.
+
+import os
+import threading
+from collections import OrderedDict
+
+ANALYSIS_MEMO_MAX_ENTRIES = int(os.getenv("ANALYSIS_MEMO_MAX_ENTRIES", "4096"))
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+
+def fingerprint(series):
+    """
+    Identifies a price series by its first and last bar, its length and
+    its last value.
+    """
+    if series is None or len(series) == 0:
+        return None
+    return (series.index[0], series.index[-1], len(series), float(series.iloc[-1]))
+
+
+def memoize(kind: str, symbol: str, series, compute, interval: str = "1d", params: tuple = ()):
+    """
+    Returns the memoized `kind` result for `symbol` computed from `series`,
+    calling `compute()` if there is none or the series has moved on.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+    key = (kind, symbol.upper(), interval, params)
+    fp = fingerprint(series)
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] == fp:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return entry[1]
+
+        _stats["misses"] += 1
+        if entry is not None:
+            _stats["invalidations"] += 1
+
+    value = compute()
+
+    with _lock:
+        _entries[key] = (fp, value)
+        _entries.move_to_end(key)
+        while len(_entries) > ANALYSIS_MEMO_MAX_ENTRIES:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+    return value
+
+
+def stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries": len(_entries),
+            "max_entries": ANALYSIS_MEMO_MAX_ENTRIES,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+        for k in _stats:
+            _stats[k] = 0
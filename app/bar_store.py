@@ -0,0 +1,252 @@
+# bar_store.py
+# Persistent per-symbol OHLCV store for remote market data providers.
+#
+# Every symbol gets its own directory under data/bars/ holding one .npy file
+# per column (memory-mappable) plus a small meta.json. The full daily history
+# is downloaded once; after that only the missing tail since the last stored
+# bar is requested upstream.
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+BAR_STORE_DIR = os.getenv("BAR_STORE_DIR", "data/bars")
+
+# How long a stored series is considered fresh before we ask upstream
+# for the tail again (seconds).
+REFRESH_SECONDS = int(os.getenv("BAR_STORE_REFRESH_SECONDS", "900"))
+
+# Bars re-requested before the last stored bar. They are used to detect
+# back-adjustments (splits / dividends) that invalidate the stored history.
+OVERLAP_BARS = 5
+
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+PERIOD_OFFSETS = {
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+    "max": None,
+}
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(symbol: str) -> threading.Lock:
+    with _locks_guard:
+        lock = _locks.get(symbol)
+        if lock is None:
+            lock = _locks[symbol] = threading.Lock()
+        return lock
+
+
+def _symbol_dir(symbol: str) -> str:
+    safe = symbol.upper().replace("/", "_").replace("\\", "_").replace(":", "_")
+    return os.path.join(BAR_STORE_DIR, safe)
+
+
+# =====================================================
+# Period helpers
+# =====================================================
+def slice_period(bars: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Returns the trailing `period` window of `bars`, measured back from the
+    last stored bar (same period strings as yfinance).
+    """
+    if bars is None or bars.empty:
+        return bars
+
+    if period not in PERIOD_OFFSETS:
+        raise ValueError(f"Unsupported period: {period}")
+
+    offset = PERIOD_OFFSETS[period]
+    if offset is None:
+        return bars
+
+    start = bars.index[-1] - offset
+    return bars[bars.index >= start]
+
+
+# =====================================================
+# Disk format
+# =====================================================
+def load_bars(symbol: str):
+    """
+    Loads the stored bars for `symbol` as memory-mapped columns.
+
+    Returns (DataFrame, meta) or (None, None) if nothing is stored yet.
+    """
+    path = _symbol_dir(symbol)
+    meta_path = os.path.join(path, "meta.json")
+
+    if not os.path.exists(meta_path):
+        return None, None
+
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        stamps = np.load(os.path.join(path, "index.npy"), mmap_mode="r")
+        columns = {
+            col: np.load(os.path.join(path, f"{col}.npy"), mmap_mode="r")
+            for col in COLUMNS
+        }
+    except (OSError, ValueError) as e:
+        print(f"Bar store corrupt for {symbol}, ignoring: {e}")
+        return None, None
+
+    if meta.get("tz"):
+        index = pd.to_datetime(np.asarray(stamps), utc=True).tz_convert(meta["tz"])
+    else:
+        index = pd.to_datetime(np.asarray(stamps))
+    index.name = "Date"
+
+    return pd.DataFrame(columns, index=index, copy=False), meta
+
+
+def save_bars(symbol: str, bars: pd.DataFrame):
+    """
+    Writes `bars` for `symbol`. Each file is written to a temp name first
+    and swapped in, so readers never see a half-written column.
+    """
+    path = _symbol_dir(symbol)
+    tz = str(bars.index.tz) if bars.index.tz is not None else None
+
+    # Stored as int64 nanoseconds since the epoch (UTC when tz-aware)
+    index = bars.index.as_unit("ns")
+    if tz:
+        stamps = index.tz_convert("UTC").tz_localize(None).asi8
+    else:
+        stamps = index.asi8
+
+    meta = {"symbol": symbol, "tz": tz, "rows": len(bars), "checked_at": time.time()}
+
+    try:
+        os.makedirs(path, exist_ok=True)
+        arrays = {"index": np.ascontiguousarray(stamps, dtype=np.int64)}
+        for col in COLUMNS:
+            arrays[col] = np.ascontiguousarray(bars[col].to_numpy(dtype=np.float64))
+
+        for name, arr in arrays.items():
+            tmp = os.path.join(path, f"{name}.tmp.npy")
+            np.save(tmp, arr)
+            os.replace(tmp, os.path.join(path, f"{name}.npy"))
+
+        _write_meta(path, meta)
+    except OSError as e:
+        # Read-only filesystems (serverless) still get the fetched data
+        print(f"Could not persist bars for {symbol}: {e}")
+
+
+def _write_meta(path: str, meta: dict):
+    tmp = os.path.join(path, "meta.tmp.json")
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, "meta.json"))
+
+
+def _touch(symbol: str, meta: dict):
+    meta = dict(meta, checked_at=time.time())
+    try:
+        _write_meta(_symbol_dir(symbol), meta)
+    except OSError:
+        pass
+
+
+# =====================================================
+# Upstream
+# =====================================================
+def _download(provider, symbol: str, period: str = None, start=None) -> pd.DataFrame:
+    hist = provider.history(symbol, period=period, start=start)
+
+    if hist is None or hist.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    hist = hist[COLUMNS].astype(np.float64)
+    return hist[~hist.index.duplicated(keep="last")].sort_index()
+
+
+def _append_tail(provider, symbol: str, bars: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fetches bars from slightly before the last stored bar onwards and
+    splices them in. The last stored bar is always replaced because it
+    may have been a partial (intraday) bar.
+    """
+    overlap_start = bars.index[max(len(bars) - OVERLAP_BARS, 0)]
+    tail = _download(provider, symbol, start=overlap_start.date())
+
+    if tail.empty:
+        return bars
+
+    if tail.index.tz is None and bars.index.tz is not None:
+        tail.index = tail.index.tz_localize(bars.index.tz)
+    elif tail.index.tz is not None and bars.index.tz is not None:
+        tail.index = tail.index.tz_convert(bars.index.tz)
+
+    # Completed bars must not change. If they did, the provider
+    # back-adjusted the series and the stored copy is stale.
+    settled = bars.index[(bars.index >= tail.index[0]) & (bars.index < bars.index[-1])]
+    common = settled.intersection(tail.index)
+    if len(common):
+        old = bars.loc[common, "Close"].to_numpy()
+        new = tail.loc[common, "Close"].to_numpy()
+        if not np.allclose(old, new, rtol=1e-6, equal_nan=True):
+            print(f"History for {symbol} was adjusted upstream, re-downloading")
+            full = _download(provider, symbol, period="max")
+            return full if not full.empty else bars
+
+    return pd.concat([bars[bars.index < tail.index[0]], tail])
+
+
+# =====================================================
+# Public API
+# =====================================================
+def get_bars(symbol: str, period: str, provider):
+    """
+    Returns daily OHLCV bars for `symbol` covering `period`, served from the
+    local store. Only the missing tail is downloaded from `provider` once
+    the stored copy is older than REFRESH_SECONDS.
+
+    Returns None if the symbol has no data; raises if nothing is stored
+    and the download fails.
+    """
+    with _lock_for(symbol):
+        bars, meta = load_bars(symbol)
+
+        if bars is None or bars.empty:
+            try:
+                bars = _download(provider, symbol, period="max")
+            except Exception as e:
+                # Not the same as "no data": the caller must not remember
+                # the symbol as missing
+                print(f"Download failed for {symbol}: {e}")
+                raise
+            if bars.empty:
+                return None
+            save_bars(symbol, bars)
+
+        elif time.time() - meta.get("checked_at", 0) > REFRESH_SECONDS:
+            try:
+                updated = _append_tail(provider, symbol, bars)
+            except Exception as e:
+                # Serve what we have rather than failing the request
+                print(f"Tail refresh failed for {symbol}: {e}")
+                updated = bars
+
+            if updated is bars:
+                _touch(symbol, meta)
+            else:
+                bars = updated
+                save_bars(symbol, bars)
+
+    return slice_period(bars, period)
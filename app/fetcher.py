@@ -1,101 +1,265 @@
-import yfinance as yf
-
-def fetch_prices(symbol: str):
-    # Try fetching as provided
-    stock = yf.Ticker(symbol)
-    data = stock.history(period="6mo")
-
-    if data.empty:
-        # Retry with .NS if not present and likely an Indian stock (or just retry generic)
-        if not symbol.endswith(".NS") and not symbol.endswith(".BO"):
-            print(f"Retrying {symbol} as {symbol}.NS...")
-            stock = yf.Ticker(f"{symbol}.NS")
-            data = stock.history(period="6mo")
-            
-        if data.empty:
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from app.bar_store import get_bars, slice_period
+from app import price_cache, resample
+from app.providers import get_provider
+from app.singleflight import coalesce
+from app.symbol_mapper import is_missing, mark_missing, remember_resolution, resolved_symbol
+
+# Cache misses load at least this window, so the 1mo / 6mo / 1y reads
+# made by different routes for one symbol are served by a single load.
+PRICE_CACHE_FILL_PERIOD = os.getenv("PRICE_CACHE_FILL_PERIOD", "1y")
+
+def fetch_history(symbol: str, period: str = "6mo", provider=None):
+    """
+    Daily OHLCV bars for `symbol` covering `period`, via the shared
+    in-process cache. Remote providers are read through the local bar
+    store; local providers are read directly.
+    """
+    provider = provider or get_provider()
+
+    # Recently returned no data: answer immediately
+    if is_missing(symbol, provider.name):
+        return None
+
+    def load(load_period):
+        if provider.persist:
+            return get_bars(symbol, load_period, provider)
+        bars = provider.history(symbol, period=load_period)
+        return None if bars.empty else bars
+
+    try:
+        bars = price_cache.get_or_load(
+            symbol,
+            period,
+            load,
+            fill_period=PRICE_CACHE_FILL_PERIOD,
+            source=provider.name
+        )
+    except Exception as e:
+        # Network error / rate limit: retry on the next request instead of
+        # remembering a valid symbol as missing
+        print(f"Could not load {symbol}: {e}")
+        return None
+
+    if bars is None or bars.empty:
+        mark_missing(symbol, provider.name)
+        return None
+    return bars
+
+def fetch_bars(symbol: str, interval: str = "1d", period: str = None, provider=None):
+    """
+    OHLCV bars at `interval` (1d / 1wk / 1mo). Weekly and monthly bars are
+    aggregated from the cached daily bars, never downloaded separately.
+    """
+    provider = provider or get_provider()
+    period = period or resample.DEFAULT_PERIODS[interval]
+
+    daily = fetch_history(symbol, period, provider)
+    if interval == "1d" or daily is None:
+        return daily
+
+    bars = resample.get_resampled(symbol, daily, interval, source=provider.name)
+    return slice_period(bars, period)
+
+@coalesce()
+def fetch_ohlcv(symbol: str, provider=None, interval: str = "1d"):
+    """
+    Full OHLCV bars for `symbol`, retrying as an NSE symbol if needed.
+    """
+    provider = provider or get_provider()
+
+    # Try fetching as provided, plus .NS if not present (likely an Indian stock)
+    candidates = [symbol]
+    if not symbol.endswith(".NS") and not symbol.endswith(".BO"):
+        candidates.append(f"{symbol}.NS")
+
+    # Start with whichever form worked last time
+    resolved = resolved_symbol(symbol, provider.name)
+    if resolved in candidates:
+        candidates.remove(resolved)
+        candidates.insert(0, resolved)
+
+    for i, candidate in enumerate(candidates):
+        if i > 0:
+            print(f"Retrying {symbol} as {candidate}...")
+
+        data = fetch_bars(candidate, interval, provider=provider)
+        if data is not None and not data.empty:
+            remember_resolution(symbol, candidate, provider.name)
+            return data
+
+    return None
+
+def fetch_prices(symbol: str, provider=None, interval: str = "1d"):
+    data = fetch_ohlcv(symbol, provider, interval)
+    return None if data is None else data["Close"]
+
+# Shared pool for multi-ticker fetches. Bounded so a large symbol list
+# cannot open an unbounded number of upstream connections.
+INDEX_FETCH_WORKERS = int(os.getenv("INDEX_FETCH_WORKERS", "8"))
+INDEX_FETCH_TIMEOUT = float(os.getenv("INDEX_FETCH_TIMEOUT", "6"))
+
+_index_pool = ThreadPoolExecutor(max_workers=INDEX_FETCH_WORKERS, thread_name_prefix="fetch-indices")
+
+def _fetch_quote(symbol: str, timeout: float, provider):
+    """
+    Latest price and day-over-day change for a single symbol, or None.
+    """
+    try:
+        # Fetch slightly more data to ensure we have at least 2 days
+        hist = provider.history(symbol, period="1mo", timeout=timeout)
+        
+        if hist.empty:
+            print(f"No data found for {symbol}")
+            return None
+        
+        # Use 'Close' column and drop NaNs
+        closes = hist['Close'].dropna()
+        
+        if len(closes) < 2:
+            print(f"Not enough data for {symbol} (len={len(closes)})")
+            return None
+
+        current = float(closes.iloc[-1])
+        prev = float(closes.iloc[-2])
+        
+        # Double check for NaN (float('nan'))
+        if math.isnan(current) or math.isnan(prev):
+            print(f"NaN data detected for {symbol}")
             return None
 
-    return data["Close"]
+        change = ((current - prev) / prev) * 100
+        
+        return {
+            "price": current,
+            "change": change
+        }
+
+    except Exception as e:
+        print(f"Error fetching {symbol}: {e}")
+        return None
+
+@coalesce(key=lambda symbols, timeout=INDEX_FETCH_TIMEOUT: (tuple(symbols), timeout))
+def fetch_indices(symbols: list[str], timeout: float = INDEX_FETCH_TIMEOUT):
+    """
+    Fetches {symbol: {price, change}} for all symbols concurrently.
+
+    Each symbol is fetched on the shared pool with its own upstream timeout.
+    Symbols that fail, return no data or miss the deadline are left out of
+    the result instead of failing the whole call. A fetch that misses the
+    deadline while already running is not cancelled: it keeps its pool
+    thread until the provider's own timeout returns.
+    """
+    provider = get_provider()
+    symbols = list(dict.fromkeys(symbols))
+    futures = {symbol: _index_pool.submit(_fetch_quote, symbol, timeout, provider) for symbol in symbols}
+
+    # Upstream timeout applies per HTTP request; allow for queueing
+    # behind other symbols when there are more symbols than workers.
+    rounds = max(math.ceil(len(symbols) / INDEX_FETCH_WORKERS), 1)
+    done, _ = wait(futures.values(), timeout=timeout * rounds + 1)
 
-def fetch_indices(symbols: list[str]):
     results = {}
-    for symbol in symbols:
-        try:
-            # Iterative fetch is slower but more robust against partial failures/timeouts
-            stock = yf.Ticker(symbol)
-            # Fetch slightly more data to ensure we have at least 2 days
-            hist = stock.history(period="1mo")
-            
-            if hist.empty:
-                print(f"No data found for {symbol}")
-                continue
-            
-            # Use 'Close' column and drop NaNs
-            closes = hist['Close'].dropna()
-            
-            if len(closes) >= 2:
-                current = float(closes.iloc[-1])
-                prev = float(closes.iloc[-2])
-                
-                # Double check for NaN (float('nan'))
-                import math
-                if math.isnan(current) or math.isnan(prev):
-                     print(f"NaN data detected for {symbol}")
-                     continue
-
-                change = ((current - prev) / prev) * 100
-                
-                results[symbol] = {
-                    "price": current,
-                    "change": change
-                }
-            else:
-                 print(f"Not enough data for {symbol} (len={len(closes)})")
-
-        except Exception as e:
-            print(f"Error fetching {symbol}: {e}")
+    for symbol, future in futures.items():
+        if future not in done:
+            # Only drops symbols still queued; running fetches finish
+            # in the background
+            future.cancel()
+            print(f"Timed out fetching {symbol}")
             continue
+
+        quote = future.result()
+        if quote is not None:
+            results[symbol] = quote
             
     return results
 
-def fetch_stock_details(symbol: str):
+# Fundamentals change at most daily, so `info` (a slow upstream call) is
+# cached much longer than prices. Failed lookups are retried sooner.
+FUNDAMENTALS_TTL = float(os.getenv("FUNDAMENTALS_TTL", "21600"))
+FUNDAMENTALS_ERROR_TTL = 60.0
+
+FUNDAMENTAL_KEYS = ["currency", "trailingPE", "marketCap", "fiftyTwoWeekHigh", "fiftyTwoWeekLow"]
+
+# Keyed by request input, so kept as a bounded LRU
+FUNDAMENTALS_MAX_ENTRIES = int(os.getenv("FUNDAMENTALS_MAX_ENTRIES", "2048"))
+
+_fundamentals = OrderedDict()
+_fundamentals_lock = threading.Lock()
+
+@coalesce(key=lambda symbol, provider: (symbol.upper(), provider.name))
+def fetch_fundamentals(symbol: str, provider):
+    """
+    P/E, market cap, 52W range and currency for `symbol`, cached for
+    FUNDAMENTALS_TTL seconds.
+    """
+    key = (provider.name, symbol.upper())
+    with _fundamentals_lock:
+        cached = _fundamentals.get(key)
+        if cached and cached[0] > time.monotonic():
+            _fundamentals.move_to_end(key)
+            return cached[1]
+
     try:
-        stock = yf.Ticker(symbol)
-        # Get history (1y for chart)
-        hist = stock.history(period="1y")
+        info = provider.info(symbol)
+        data = {k: info[k] for k in FUNDAMENTAL_KEYS if info.get(k) is not None}
+        ttl = FUNDAMENTALS_TTL
+    except Exception as e:
+        print(f"Error fetching fundamentals for {symbol}: {e}")
+        data = {}
+        ttl = FUNDAMENTALS_ERROR_TTL
+
+    with _fundamentals_lock:
+        _fundamentals[key] = (time.monotonic() + ttl, data)
+        _fundamentals.move_to_end(key)
+        while len(_fundamentals) > FUNDAMENTALS_MAX_ENTRIES:
+            _fundamentals.popitem(last=False)
+    return data
+
+@coalesce()
+def fetch_stock_details(symbol: str, provider=None):
+    try:
+        provider = provider or get_provider()
+
+        # Get history (1y for chart) from the shared price cache
+        hist = fetch_history(symbol, "1y", provider)
         
-        if hist.empty:
+        if hist is None or hist.empty:
             return None
             
-        # Get info
-        info = stock.info
+        # Fundamentals (cached separately, long TTL)
+        info = fetch_fundamentals(symbol, provider)
         
-        # Calculate current params
-        current_price = info.get('currentPrice', info.get('regularMarketPrice', hist['Close'].iloc[-1]))
-        prev_close = info.get('previousClose', hist['Close'].iloc[-2] if len(hist) > 1 else current_price)
+        # Price and change come from the bars, which are refreshed far
+        # more often than the cached fundamentals (at most the bar store
+        # refresh plus PRICE_CACHE_TTL old, instead of the live info quote)
+        closes = hist['Close'].to_numpy()
+        current_price = float(closes[-1])
+        prev_close = float(closes[-2]) if len(closes) > 1 else current_price
         change_pct = ((current_price - prev_close) / prev_close) * 100 if prev_close else 0.0
         currency = info.get('currency', 'USD') # Default USD
         
         # Format history
-        # Frontend expects List<Map<String, dynamic>> with 'value' key?
-        # Actually StockDetailScreen uses:
-        # history.asMap().entries.map((e) => FlSpot(e.key.toDouble(), e.value['value']...))
-        # Wait, the code says: `history = List<Map<String, dynamic>>.from(data['history']);` and `e.value['value']`.
-        # So it expects a list of objects with a 'value' property.
-        
-        history_list = []
-        for date, row in hist.iterrows():
-            history_list.append({
-                "time": date.strftime("%Y-%m-%d"),
-                "value": row['Close']
-            })
+        # Frontend expects a list of objects with 'time' and 'value' keys.
+        # Built from whole columns at once instead of iterating rows.
+        history_list = [
+            {"time": t, "value": v}
+            for t, v in zip(hist.index.strftime("%Y-%m-%d"), closes.tolist())
+        ]
             
         # Stats
+        last = hist.iloc[-1]
         stats = {
-            "Open": info.get('open', hist['Open'].iloc[-1]),
-            "High": info.get('dayHigh', hist['High'].iloc[-1]),
-            "Low": info.get('dayLow', hist['Low'].iloc[-1]),
-            "Vol": info.get('volume', hist['Volume'].iloc[-1]),
+            "Open": float(last['Open']),
+            "High": float(last['High']),
+            "Low": float(last['Low']),
+            "Vol": float(last['Volume']),
             "P/E": info.get('trailingPE', "N/A"),
             "Mkt Cap": info.get('marketCap', "N/A"),
             "52W High": info.get('fiftyTwoWeekHigh', "N/A"),
@@ -0,0 +1,82 @@
+# headline_cache.py
+# Per-headline sentiment scores shared by every symbol and endpoint.
+#
+# The same market-wide headlines come back for many symbols (and the mock
+# feed repeats its titles on every call), so each scorer (TextBlob, VADER,
+# lexicon) runs once per distinct headline. Entries are keyed by the SHA-1
+# of the whitespace-normalized text; case is kept because VADER scores
+# capitalized words differently.
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+HEADLINE_CACHE_MAX_ENTRIES = int(os.getenv("HEADLINE_CACHE_MAX_ENTRIES", "20000"))
+
+_entries = OrderedDict()   # key -> {source: score}
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def headline_key(text: str) -> str:
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def scores(headlines, source: str, scorer=None, batch_scorer=None) -> list:
+    """
+    `scorer(text)` for every headline, computing only headlines that
+    have no cached `source` score yet. A `batch_scorer(texts)` scores all
+    missing headlines in one call instead.
+    """
+    keys = [headline_key(text) for text in headlines]
+    results = [None] * len(keys)
+    missing = {}
+
+    with _lock:
+        for i, key in enumerate(keys):
+            entry = _entries.get(key)
+            if entry is not None and source in entry:
+                _entries.move_to_end(key)
+                results[i] = entry[source]
+            else:
+                missing.setdefault(key, headlines[i])
+
+        _stats["misses"] += len(missing)
+        _stats["hits"] += len(keys) - len(missing)
+
+    if not missing:
+        return results
+
+    if batch_scorer is not None:
+        computed = dict(zip(missing, batch_scorer(list(missing.values()))))
+    else:
+        computed = {key: scorer(text) for key, text in missing.items()}
+
+    with _lock:
+        for key, score in computed.items():
+            _entries.setdefault(key, {})[source] = score
+            _entries.move_to_end(key)
+        while len(_entries) > HEADLINE_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+    return [computed[key] if score is None else score for key, score in zip(keys, results)]
+
+
+def stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries": len(_entries),
+            "max_entries": HEADLINE_CACHE_MAX_ENTRIES,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+        for k in _stats:
+            _stats[k] = 0
@@ -1,40 +1,97 @@
+import numpy as np
 import pandas as pd
 
-def calculate_indicators_df(prices):
-    df = prices.to_frame(name="close")
+from app import analysis_memo
+from app.ai_engine.indicator_kernel import INDICATOR_PARAMS, compute_indicators
+from app.ai_engine.indicator_state import latest_indicators
+from app.ai_engine.ohlcv_indicators import OHLCV_FIELDS, compute_ohlcv_indicators
 
-    # SMA
-    df["sma"] = df["close"].rolling(window=14).mean()
+# Fields accepted by /get_indicators?fields=...
+CLOSE_FIELDS = ("rsi", "sma", "ema", "macd", "signal")
+INDICATOR_FIELDS = CLOSE_FIELDS + tuple(OHLCV_FIELDS)
 
-    # EMA
-    df["ema"] = df["close"].ewm(span=14, adjust=False).mean()
+def indicator_frame(prices, symbol: str = None, interval: str = "1d"):
+    """
+    Full kernel output for every bar (NaN where an indicator still needs
+    more history). With a `symbol` the frame is memoized until the series
+    gains a bar or its last close changes; treat it as read-only.
+    """
+    prices = prices.dropna()
 
-    # RSI
-    delta = df["close"].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
+    def compute():
+        ind = compute_indicators(prices.to_numpy())
+        return pd.DataFrame(ind, index=prices.index)
 
-    avg_gain = gain.rolling(window=14).mean()
-    avg_loss = loss.rolling(window=14).mean()
+    if symbol is None:
+        return compute()
+    return analysis_memo.memoize("indicators", symbol, prices, compute, interval, INDICATOR_PARAMS)
 
-    rs = avg_gain / avg_loss
-    df["rsi"] = 100 - (100 / (1 + rs))
+def calculate_indicators_df(prices, symbol: str = None, interval: str = "1d"):
+    """
+    Close, SMA(14), EMA(14), RSI(14) and MACD for every bar that has
+    enough history for all of them.
+    """
+    frame = indicator_frame(prices, symbol, interval)
 
-    # MACD
-    ema_12 = df["close"].ewm(span=12, adjust=False).mean()
-    ema_26 = df["close"].ewm(span=26, adjust=False).mean()
-    df["macd"] = ema_12 - ema_26
+    # Keep only rows where every indicator is defined (no NaN rows)
+    valid = frame["sma"].notna() & frame["rsi"].notna()
 
-    # ✅ CRITICAL FIX: remove NaN rows
-    df = df.dropna()
-    
-    return df
+    return frame.loc[valid, ["close", "sma", "ema", "rsi", "macd"]]
 
-def calculate_indicators(prices):
-    df = calculate_indicators_df(prices)
-    if df.empty:
-        return None 
-    return df.iloc[-1]
+def calculate_indicators(prices, symbol: str = None, interval: str = "1d"):
+    """
+    Indicators at the latest bar.
+
+    With a `symbol`, the per-symbol streaming state is advanced by the new
+    bars only (O(1) per bar) instead of recomputing the whole window, and
+    the result is memoized until the next bar or price change.
+    """
+    if symbol is None:
+        df = calculate_indicators_df(prices)
+        if df.empty:
+            return None 
+        return df.iloc[-1]
+
+    prices = prices.dropna()
+    if interval == "1d":
+        latest = analysis_memo.memoize("latest", symbol, prices, lambda: latest_indicators(symbol, prices), interval, INDICATOR_PARAMS)
+    else:
+        latest = indicator_frame(prices, symbol, interval).iloc[-1]
+
+    if np.isnan(latest["sma"]) or np.isnan(latest["rsi"]):
+        return None
+    return pd.Series({col: latest[col] for col in ("close", "sma", "ema", "rsi", "macd")})
+
+def calculate_fields(bars, fields, symbol: str = None, interval: str = "1d"):
+    """
+    Latest values of the requested `fields` from an OHLCV block.
+
+    Close based fields come from the (memoized) close kernel; OHLCV groups
+    (ATR, Bollinger, ...) are computed only when requested. Returns
+    {name: value} with NaN as None, or None if the close indicators are
+    not defined yet.
+    """
+    values = {}
+
+    if any(f in CLOSE_FIELDS for f in fields):
+        latest = calculate_indicators(bars["Close"], symbol=symbol, interval=interval)
+        if latest is None:
+            return None
+        for f in fields:
+            if f == "signal":
+                values[f] = generate_signal(latest["rsi"], latest["macd"])
+            elif f in CLOSE_FIELDS:
+                values[f] = float(latest[f])
+
+    groups = [f for f in fields if f in OHLCV_FIELDS]
+    if groups:
+        # Latest real bar, as for the close fields
+        bars = bars.dropna(subset=["High", "Low", "Close"])
+        for col, series in compute_ohlcv_indicators(bars, groups).items():
+            value = float(series[-1])
+            values[col] = None if np.isnan(value) else value
+
+    return values
 
 def generate_signal(rsi, macd):
     if rsi < 30 and macd > 0:
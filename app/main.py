@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -5,14 +8,30 @@ from fastapi.responses import FileResponse
 
 # Database
 from app.database import engine, Base
+from app import analysis_memo, headline_cache, price_cache, resample, singleflight, symbol_mapper
 
 # Routers
-from app.routes import sentiment, insight, stock_routes, ai_routes, market_routes, history_routes
+from app.routes import sentiment, insight, stock_routes, ai_routes, market_routes, history_routes, stream_routes, screen_routes
+from app.services import http_client, news_service
+from app.services.market_snapshot import start_refresher
 
 # -------------------------------------------------
 # 1️⃣ CREATE FASTAPI APP
 # -------------------------------------------------
-app = FastAPI(title="Stock Backend API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep the market-pulse / trending snapshot warm in the background
+    refresher = start_refresher()
+    yield
+    if refresher:
+        refresher.cancel()
+        try:
+            await refresher
+        except asyncio.CancelledError:
+            pass
+    await asyncio.to_thread(http_client.close)
+
+app = FastAPI(title="Stock Backend API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +63,8 @@ app.include_router(stock_routes.router, tags=["Stocks"])
 app.include_router(ai_routes.router, tags=["AI"])
 app.include_router(market_routes.router, tags=["Market"])
 app.include_router(history_routes.router, tags=["History"])
+app.include_router(stream_routes.router, tags=["Stream"])
+app.include_router(screen_routes.router, tags=["Screener"])
 
 # -------------------------------------------------
 # 4️⃣ BASIC HEALTH ROUTE
@@ -51,3 +72,16 @@ app.include_router(history_routes.router, tags=["History"])
 @app.get("/health")
 def root():
     return {"status": "ok", "message": "Backend is running successfully"}
+
+@app.get("/health/cache")
+def cache_stats():
+    return {
+        "price_cache": price_cache.stats(),
+        "singleflight": singleflight.stats(),
+        "symbols": symbol_mapper.resolution_stats(),
+        "analysis": analysis_memo.stats(),
+        "resample": resample.stats(),
+        "headlines": headline_cache.stats(),
+        "http": http_client.stats(),
+        "news": news_service.news_stats()
+    }
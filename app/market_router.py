@@ -3,23 +3,27 @@
 from fastapi import APIRouter
 from app.ai_engine.red_pipeline import red_engine_for_stock
 from app.services.news_service import fetch_stock_news
-from app.fetcher import fetch_prices
+from app.fetcher import fetch_ohlcv, fetch_prices
+from app.providers import get_provider
 
 router = APIRouter()
-def fetch_market_prices(symbol: str, market: str):
+def fetch_market_prices(symbol: str, market: str, interval: str = "1d"):
     """
-    Route data fetching based on market
+    Route data fetching based on market.
+    Each market can be served by its own provider (see MARKET_PROVIDERS),
+    e.g. NSE / BSE from local end-of-day dumps and GLOBAL from Yahoo Finance.
     """
 
     market = market.upper()
 
-    if market in ["NSE", "BSE"]:
-        # Indian markets still use Yahoo Finance,
-        # but symbol already has .NS or .BO
-        return fetch_prices(symbol)
+    # Indian symbols already carry their .NS / .BO suffix
+    return fetch_prices(symbol, provider=get_provider(market), interval=interval)
 
-    # Global market
-    return fetch_prices(symbol)
+def fetch_market_bars(symbol: str, market: str, interval: str = "1d"):
+    """
+    Full OHLCV bars, routed by market like `fetch_market_prices`.
+    """
+    return fetch_ohlcv(symbol, provider=get_provider(market.upper()), interval=interval)
 
 @router.get("/analyze/{symbol}")
 def analyze_stock(symbol: str, market: str = "GLOBAL"):
@@ -38,7 +42,8 @@ def analyze_stock(symbol: str, market: str = "GLOBAL"):
     # 3️⃣ Call RED Engine pipeline
     result = red_engine_for_stock(
         stock_symbol=symbol,
-        news_headlines=headlines
+        news_headlines=headlines,
+        market=market
     )
 
     return result
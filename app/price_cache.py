@@ -0,0 +1,141 @@
+# price_cache.py
+# In-process cache for price history, shared by every route.
+#
+# Entries are keyed by (source, symbol, interval) and remember which period they
+# cover. A request for a shorter period is answered by slicing the cached
+# longer window, so 1mo / 6mo / 1y reads of one symbol share one load.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app.bar_store import PERIOD_OFFSETS, slice_period
+
+PRICE_CACHE_TTL = float(os.getenv("PRICE_CACHE_TTL", "300"))
+PRICE_CACHE_MAX_BYTES = int(os.getenv("PRICE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Periods ordered from shortest to longest ("max" last)
+_PERIOD_RANK = {period: rank for rank, period in enumerate(PERIOD_OFFSETS)}
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+_bytes = 0
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+
+def _covers(cached_period: str, period: str) -> bool:
+    return _PERIOD_RANK[cached_period] >= _PERIOD_RANK[period]
+
+
+def _size_of(bars) -> int:
+    return int(bars.memory_usage(index=True, deep=True).sum())
+
+
+def _drop(key):
+    global _bytes
+    entry = _entries.pop(key)
+    _bytes -= entry["nbytes"]
+
+
+def get(symbol: str, period: str, interval: str = "1d", source: str = ""):
+    """
+    Returns cached bars for `period`, or None on a miss.
+    """
+    key = (source, symbol.upper(), interval)
+
+    with _lock:
+        entry = _entries.get(key)
+
+        if entry is not None and entry["expires_at"] <= time.monotonic():
+            _drop(key)
+            _stats["expired"] += 1
+            entry = None
+
+        if entry is None or not _covers(entry["period"], period):
+            _stats["misses"] += 1
+            return None
+
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        bars = entry["bars"]
+
+    return slice_period(bars, period)
+
+
+def put(symbol: str, period: str, bars, interval: str = "1d", source: str = ""):
+    """
+    Stores `bars` covering `period`. Least recently used entries are
+    evicted until the cache fits in PRICE_CACHE_MAX_BYTES.
+    """
+    global _bytes
+
+    if bars is None or bars.empty:
+        return
+
+    key = (source, symbol.upper(), interval)
+    nbytes = _size_of(bars)
+
+    if nbytes > PRICE_CACHE_MAX_BYTES:
+        return
+
+    with _lock:
+        if key in _entries:
+            _drop(key)
+
+        _entries[key] = {
+            "bars": bars,
+            "period": period,
+            "nbytes": nbytes,
+            "expires_at": time.monotonic() + PRICE_CACHE_TTL,
+        }
+        _bytes += nbytes
+
+        while _bytes > PRICE_CACHE_MAX_BYTES:
+            oldest = next(iter(_entries))
+            _drop(oldest)
+            _stats["evictions"] += 1
+
+
+def get_or_load(symbol: str, period: str, loader, fill_period: str = None, interval: str = "1d", source: str = ""):
+    """
+    Serves `period` from the cache, or calls `loader(load_period)` on a miss.
+
+    `fill_period` lets a miss load a longer window than requested so that
+    later requests for longer periods are hits too.
+    """
+    bars = get(symbol, period, interval, source)
+    if bars is not None:
+        return bars
+
+    load_period = period
+    if fill_period and not _covers(period, fill_period):
+        load_period = fill_period
+
+    bars = loader(load_period)
+    if bars is None or bars.empty:
+        return bars
+
+    put(symbol, load_period, bars, interval, source)
+    return slice_period(bars, period)
+
+
+def stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries": len(_entries),
+            "bytes": _bytes,
+            "max_bytes": PRICE_CACHE_MAX_BYTES,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def clear():
+    global _bytes
+    with _lock:
+        _entries.clear()
+        _bytes = 0
+        for k in _stats:
+            _stats[k] = 0
@@ -0,0 +1,44 @@
+# Market data providers.
+#
+# MARKET_DATA_PROVIDER picks the default provider ("yfinance" or "local").
+# MARKET_PROVIDERS overrides it per market, e.g. "NSE=local,BSE=local".
+# LOCAL_DATA_DIR is the directory read by the local provider.
+
+import os
+
+from app.providers.base import MarketDataProvider, OHLCV_COLUMNS
+
+DEFAULT_PROVIDER = os.getenv("MARKET_DATA_PROVIDER", "yfinance").lower()
+LOCAL_DATA_DIR = os.getenv("LOCAL_DATA_DIR", "data/local")
+
+MARKET_PROVIDERS = {
+    market.strip().upper(): name.strip().lower()
+    for market, _, name in (
+        item.partition("=") for item in os.getenv("MARKET_PROVIDERS", "").split(",") if "=" in item
+    )
+}
+
+_instances = {}
+
+
+def _create(name: str) -> MarketDataProvider:
+    if name == "yfinance":
+        from app.providers.yfinance_provider import YFinanceProvider
+        return YFinanceProvider()
+    if name == "local":
+        from app.providers.local_provider import LocalFileProvider
+        return LocalFileProvider(LOCAL_DATA_DIR)
+    raise ValueError(f"Unknown market data provider: {name}")
+
+
+def get_provider(market: str = None) -> MarketDataProvider:
+    """
+    Provider configured for `market` (NSE / BSE / GLOBAL), falling back
+    to the default provider.
+    """
+    name = MARKET_PROVIDERS.get((market or "").upper(), DEFAULT_PROVIDER)
+
+    provider = _instances.get(name)
+    if provider is None:
+        provider = _instances.setdefault(name, _create(name))
+    return provider
@@ -0,0 +1,45 @@
+import pandas as pd
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class MarketDataProvider:
+    """
+    Source of daily OHLCV bars.
+
+    `persist` marks remote providers whose bars should be kept in the local
+    bar store; local providers are already on disk and are read directly.
+    """
+
+    name = "base"
+    persist = False
+
+    def history(self, symbol: str, period: str = None, start=None, timeout: float = None) -> pd.DataFrame:
+        """
+        Daily bars with a DatetimeIndex and OHLCV_COLUMNS, oldest first.
+        Returns an empty frame if the symbol is unknown.
+        """
+        raise NotImplementedError
+
+    def info(self, symbol: str) -> dict:
+        """
+        Quote / fundamentals metadata (yfinance `info` keys). Optional.
+        """
+        return {}
+
+
+def empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+
+
+def clean_bars(bars: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keeps OHLCV columns as float64, sorted, one row per timestamp.
+    """
+    if bars is None or bars.empty:
+        return empty_bars()
+
+    bars = bars[OHLCV_COLUMNS].astype("float64")
+    bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+    bars.index.name = "Date"
+    return bars
@@ -0,0 +1,140 @@
+import os
+import threading
+
+import pandas as pd
+
+from app.bar_store import slice_period
+from app.providers.base import MarketDataProvider, OHLCV_COLUMNS, clean_bars, empty_bars
+
+DATE_COLUMNS = ("date", "datetime", "timestamp", "time")
+SYMBOL_COLUMNS = ("symbol", "ticker")
+
+COLUMN_ALIASES = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "adj close": "Adj Close",
+    "adj_close": "Adj Close",
+    "volume": "Volume",
+}
+
+
+def _read_file(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        # Needs pyarrow or fastparquet
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Maps vendor column names onto Date + OHLCV.
+    """
+    lower = {c: str(c).strip().lower() for c in frame.columns}
+    date_col = next((c for c, l in lower.items() if l in DATE_COLUMNS), None)
+
+    if date_col is not None:
+        frame = frame.set_index(date_col)
+    frame.index = pd.to_datetime(frame.index)
+
+    frame = frame.rename(columns={c: COLUMN_ALIASES[l] for c, l in lower.items() if l in COLUMN_ALIASES})
+
+    if "Close" not in frame and "Adj Close" in frame:
+        frame["Close"] = frame["Adj Close"]
+    for col in ("Open", "High", "Low"):
+        if col not in frame:
+            frame[col] = frame["Close"]
+    if "Volume" not in frame:
+        frame["Volume"] = 0.0
+
+    return clean_bars(frame)
+
+
+class LocalFileProvider(MarketDataProvider):
+    """
+    Serves bars from a directory of CSV / Parquet end-of-day files.
+
+    Two layouts are understood and can be mixed:
+      - one file per symbol, named after it (RELIANCE.NS.csv, AAPL.parquet)
+      - bulk dumps with a symbol/ticker column holding many symbols
+    Files are parsed once and kept in memory until they change on disk.
+    """
+
+    name = "local"
+    persist = False
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._files = {}      # path -> (mtime, {SYMBOL: bars})
+        self._symbols = {}    # SYMBOL -> path
+        self._scanned_at = None
+
+    def _load(self, path: str) -> dict:
+        mtime = os.path.getmtime(path)
+        cached = self._files.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        frame = _read_file(path)
+        lower = {str(c).strip().lower(): c for c in frame.columns}
+        symbol_col = next((lower[c] for c in SYMBOL_COLUMNS if c in lower), None)
+
+        if symbol_col is None:
+            stem = os.path.basename(path).rsplit(".", 1)[0].upper()
+            by_symbol = {stem: _normalize(frame)}
+        else:
+            by_symbol = {
+                str(sym).upper(): _normalize(group.drop(columns=[symbol_col]))
+                for sym, group in frame.groupby(symbol_col)
+            }
+
+        self._files[path] = (mtime, by_symbol)
+        return by_symbol
+
+    def _scan(self):
+        if not os.path.isdir(self.directory):
+            return
+
+        mtime = os.path.getmtime(self.directory)
+        if self._scanned_at == mtime:
+            return
+
+        symbols = {}
+        for entry in sorted(os.listdir(self.directory)):
+            if not entry.endswith((".csv", ".parquet")):
+                continue
+            path = os.path.join(self.directory, entry)
+            try:
+                for sym in self._load(path):
+                    symbols.setdefault(sym, path)
+            except Exception as e:
+                print(f"Skipping local data file {entry}: {e}")
+
+        self._symbols = symbols
+        self._scanned_at = mtime
+
+    def symbols(self) -> list:
+        with self._lock:
+            self._scan()
+            return sorted(self._symbols)
+
+    def history(self, symbol: str, period: str = None, start=None, timeout: float = None):
+        with self._lock:
+            self._scan()
+            path = self._symbols.get(symbol.upper())
+            if path is None:
+                return empty_bars()
+            try:
+                bars = self._load(path).get(symbol.upper(), empty_bars())
+            except Exception as e:
+                print(f"Could not read local data for {symbol}: {e}")
+                return empty_bars()
+
+        if start is not None:
+            bars = bars[bars.index >= pd.Timestamp(start, tz=bars.index.tz)]
+        elif period:
+            bars = slice_period(bars, period)
+
+        return bars[OHLCV_COLUMNS]
@@ -0,0 +1,22 @@
+import yfinance as yf
+
+from app.providers.base import MarketDataProvider, clean_bars
+
+
+class YFinanceProvider(MarketDataProvider):
+    name = "yfinance"
+    persist = True
+
+    def history(self, symbol: str, period: str = None, start=None, timeout: float = None):
+        kwargs = {"timeout": timeout} if timeout else {}
+        stock = yf.Ticker(symbol)
+
+        if start is not None:
+            hist = stock.history(start=start, **kwargs)
+        else:
+            hist = stock.history(period=period or "max", **kwargs)
+
+        return clean_bars(hist)
+
+    def info(self, symbol: str) -> dict:
+        return yf.Ticker(symbol).info or {}
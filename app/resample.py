@@ -0,0 +1,147 @@
+# resample.py
+# Weekly / monthly bars derived from the daily OHLCV bars.
+#
+# Higher-timeframe bars never trigger an extra upstream download: they are
+# aggregated from the daily bars the fetcher already has. Completed periods
+# are cached per (source, symbol, interval); when the daily series advances
+# only the current (still open) period is re-aggregated and appended.
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+INTERVALS = ("1d", "1wk", "1mo")
+
+# Calendar period each bar covers (pandas period aliases)
+PERIOD_FREQ = {"1wk": "W", "1mo": "M"}
+
+# Trading days per bar, used to scale daily thresholds
+DAYS_PER_BAR = {"1d": 1, "1wk": 5, "1mo": 21}
+
+# Default history window per interval (enough bars for the indicators)
+DEFAULT_PERIODS = {"1d": "6mo", "1wk": "2y", "1mo": "10y"}
+
+RESAMPLE_CACHE_MAX_ENTRIES = int(os.getenv("RESAMPLE_CACHE_MAX_ENTRIES", "1024"))
+
+AGGREGATIONS = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "extends": 0, "rebuilds": 0}
+
+
+# =====================================================
+# Aggregation
+# =====================================================
+def _period_keys(index: pd.DatetimeIndex, interval: str):
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_period(PERIOD_FREQ[interval])
+
+
+def resample_bars(daily: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Aggregates daily OHLCV bars into `interval` bars. Each bar is labelled
+    with the last trading day it contains.
+    """
+    if interval == "1d" or daily.empty:
+        return daily
+
+    keys = _period_keys(daily.index, interval)
+    bars = daily.groupby(keys, sort=True).agg({col: agg for col, agg in AGGREGATIONS.items() if col in daily})
+
+    # Daily bars are sorted, so each period ends where the key changes
+    codes = keys.asi8
+    last = np.flatnonzero(np.append(codes[1:] != codes[:-1], True))
+    bars.index = daily.index[last]
+    return bars
+
+
+# =====================================================
+# Incremental cache
+# =====================================================
+def _can_extend(entry: dict, daily: pd.DataFrame) -> bool:
+    """
+    Cached completed periods can be reused if `daily` has no older history
+    than they were built from, the open period still starts inside it and
+    the last completed daily close is unchanged.
+    """
+    open_start = entry["open_start"]
+    if daily.index[0] < entry["daily_first"] or daily.index[-1] < entry["daily_last"]:
+        return False
+    if open_start not in daily.index:
+        return False
+
+    anchor = entry["anchor"]
+    if anchor is None:
+        return daily.index[0] == open_start
+    ts, close = anchor
+    return ts in daily.index and daily.at[ts, "Close"] == close
+
+
+def get_resampled(symbol: str, daily: pd.DataFrame, interval: str, source: str = "") -> pd.DataFrame:
+    """
+    `interval` bars for `symbol` built from its `daily` bars, reusing the
+    cached completed periods. May cover more history than `daily` when an
+    earlier call supplied a longer window.
+    """
+    if interval == "1d" or daily is None or daily.empty:
+        return daily
+
+    key = (source, symbol.upper(), interval)
+
+    with _lock:
+        entry = _entries.get(key)
+
+    reusable = entry is not None and _can_extend(entry, daily)
+    if reusable and entry["daily_last"] == daily.index[-1] and entry["close"] == daily["Close"].iloc[-1]:
+        with _lock:
+            _stats["hits"] += 1
+        return entry["bars"]
+
+    if reusable:
+        open_bars = resample_bars(daily[daily.index >= entry["open_start"]], interval)
+        bars = pd.concat([entry["completed"], open_bars])
+        counter = "extends"
+    else:
+        bars = resample_bars(daily, interval)
+        counter = "rebuilds"
+
+    # The last bar may still be forming: remember where its period starts
+    open_key = _period_keys(daily.index[-1:], interval)[0]
+    in_open = _period_keys(daily.index, interval) == open_key
+    open_start = daily.index[in_open][0]
+    before = daily.index[~in_open]
+    anchor = (before[-1], daily.at[before[-1], "Close"]) if len(before) else None
+
+    with _lock:
+        _stats[counter] += 1
+        _entries[key] = {
+            "bars": bars,
+            "completed": bars.iloc[:-1],
+            "open_start": open_start,
+            "anchor": anchor,
+            "daily_first": entry["daily_first"] if reusable else daily.index[0],
+            "daily_last": daily.index[-1],
+            "close": daily["Close"].iloc[-1],
+        }
+        _entries.move_to_end(key)
+        while len(_entries) > RESAMPLE_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+    return bars
+
+
+def stats() -> dict:
+    with _lock:
+        return {**_stats, "entries": len(_entries)}
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+        for k in _stats:
+            _stats[k] = 0
@@ -1,9 +1,13 @@
+import json
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models import RedEngineResult
-from app.schemas import RedEngineCreate, FusionResponse
-from app.services.fusion_service import generate_fusion_insight
+from app.schemas import RedEngineCreate, FusionBatchRequest, FusionResponse
+from app.resample import INTERVALS
+from app.services.fusion_service import FUSION_BATCH_MAX_SYMBOLS, generate_fusion_insight, stream_fusion_insights
 from app.symbol_mapper import normalize_symbol
 
 router = APIRouter()
@@ -42,13 +46,42 @@ def store_red_engine_result(
     }
 
 @router.get("/fusion/insight", response_model=FusionResponse)
-def fusion_insight(symbol: str, market: str = "GLOBAL", db: Session = Depends(get_db)):
+def fusion_insight(symbol: str, market: str = "GLOBAL", interval: str = "1d", db: Session = Depends(get_db)):
+    if interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval must be one of {', '.join(INTERVALS)}")
+
     # Normalize symbol
     final_symbol, resolved_market = normalize_symbol(symbol, market)
     
-    insight = generate_fusion_insight(final_symbol, resolved_market, db)
+    insight = generate_fusion_insight(final_symbol, resolved_market, db, interval=interval)
     
     if not insight:
         raise HTTPException(status_code=404, detail=f"Not enough data to generate insight for {final_symbol}")
         
     return insight
+
+@router.post("/fusion/insight/batch")
+async def fusion_insight_batch(request: FusionBatchRequest):
+    """
+    Insights for a whole watchlist in one request, streamed as
+    newline-delimited JSON: one line per symbol as soon as it completes
+    (status ok / no_data / timeout / error), then a {"done": true} line.
+    """
+    if request.interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval must be one of {', '.join(INTERVALS)}")
+
+    symbols = [s.strip() for s in request.symbols if s.strip()]
+    if not symbols:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    if len(symbols) > FUSION_BATCH_MAX_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {FUSION_BATCH_MAX_SYMBOLS} symbols per batch")
+
+    async def lines():
+        async for result in stream_fusion_insights(symbols, request.market, request.interval):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
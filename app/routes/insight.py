@@ -27,7 +27,7 @@ def get_final_insight(symbol: str):
             detail=f"Not enough data to generic insight for {symbol} (tried {final_symbol})"
         )
 
-    indicators = calculate_indicators(prices)
+    indicators = calculate_indicators(prices, symbol=final_symbol)
 
     # Technicals
     rsi = float(indicators["rsi"])
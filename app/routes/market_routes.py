@@ -1,49 +1,40 @@
-from fastapi import APIRouter
-from app.fetcher import fetch_indices
+from fastapi import APIRouter, Response
+from app.ai_engine.keyword_matcher import KeywordMatcher
+from app.services.market_snapshot import INDEX_NAMES, get_snapshot
 from app.services.news_service import fetch_stock_news
 
 router = APIRouter()
 
+# Headline keywords for /news (substring match, positive checked first)
+NEWS_POSITIVE = ["soar", "surge", "jump", "record", "bull", "gain", "high", "growth", "active"]
+NEWS_NEGATIVE = ["plunge", "drop", "crash", "bear", "loss", "low", "weak", "down", "fall"]
+NEWS_MATCHER = KeywordMatcher({"Positive": NEWS_POSITIVE, "Negative": NEWS_NEGATIVE}, words=False)
+
 @router.get("/market-pulse")
-def get_market_pulse():
-    indices = ["^NSEI", "^BSESN", "^GSPC", "^CNX500"]
-    data = fetch_indices(indices)
+def get_market_pulse(response: Response):
+    # Served from the in-memory snapshot kept warm by the background refresher
+    snapshot = get_snapshot()
+    data = snapshot.quotes
     
     pulse = []
-    if "^NSEI" in data:
-        pulse.append({
-            "name": "Nifty 50",
-            "price": f"{data['^NSEI']['price']:.2f}",
-            "change": f"{data['^NSEI']['change']:.2f}%",
-            "isPositive": data['^NSEI']['change'] >= 0
-        })
-    if "^BSESN" in data:
-         pulse.append({
-            "name": "Sensex",
-            "price": f"{data['^BSESN']['price']:.2f}",
-            "change": f"{data['^BSESN']['change']:.2f}%",
-            "isPositive": data['^BSESN']['change'] >= 0
-        })
-    if "^GSPC" in data:
-         pulse.append({
-            "name": "S&P 500",
-            "price": f"{data['^GSPC']['price']:.2f}",
-            "change": f"{data['^GSPC']['change']:.2f}%",
-            "isPositive": data['^GSPC']['change'] >= 0
-        })
-    if "^CNX500" in data:
-         pulse.append({
-            "name": "Nifty 500",
-            "price": f"{data['^CNX500']['price']:.2f}",
-            "change": f"{data['^CNX500']['change']:.2f}%",
-            "isPositive": data['^CNX500']['change'] >= 0
-        })
+    for symbol, name in INDEX_NAMES.items():
+        if symbol in data:
+            pulse.append({
+                "symbol": symbol,
+                "name": name,
+                "price": f"{data[symbol]['price']:.2f}",
+                "change": f"{data[symbol]['change']:.2f}%",
+                "isPositive": data[symbol]['change'] >= 0
+            })
+
+    response.headers["X-Snapshot-Age"] = str(snapshot.age)
 
     return {
         "market_pulse": "Bullish" if any(p['isPositive'] for p in pulse) else "Mixed",
         "description": "Global markets are mixed today.",
         "confidence": 75,
-        "indices": pulse
+        "indices": pulse,
+        "snapshot_age": snapshot.age
     }
 
 @router.get("/news")
@@ -51,14 +42,15 @@ def get_general_news(symbol: str = "stock market"):
     query = f"{symbol} stock" if symbol != "stock market" else "stock market"
     raw_news = fetch_stock_news(query)
     
+    titles = [article.get("title", "No Title") for article in raw_news]
+    matched = NEWS_MATCHER.labels(titles)
+
     formatted = []
-    for article in raw_news:
-        title = article.get("title", "No Title")
+    for article, title, labels in zip(raw_news, titles, matched):
         sentiment = "Neutral"
-        t_lower = title.lower()
-        if any(x in t_lower for x in ["soar", "surge", "jump", "record", "bull", "gain", "high", "growth", "active"]):
+        if "Positive" in labels:
              sentiment = "Positive"
-        elif any(x in t_lower for x in ["plunge", "drop", "crash", "bear", "loss", "low", "weak", "down", "fall"]):
+        elif "Negative" in labels:
              sentiment = "Negative"
              
         formatted.append({
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, HTTPException
+
+from app.services.screener import SCREEN_DEADLINE, screen
+
+router = APIRouter()
+
+
+@router.get("/screen")
+def screen_universe(
+    universe: str = None,
+    symbols: str = None,
+    filters: str = None,
+    sort: str = "-tech_score",
+    limit: int = 50,
+    market: str = "GLOBAL",
+    deadline: float = SCREEN_DEADLINE
+):
+    """
+    Screen a named universe (nifty50, trending) or comma separated
+    `symbols`.
+
+    `filters` is a comma separated list such as
+    "rsi<30,sentiment>0,regime=Trending". Numeric fields: close, sma, ema,
+    rsi, macd, macd_signal, macd_hist, tech_score, sentiment, confidence;
+    label fields (= / !=): regime, signal, tech_signal, risk. Sentiment,
+    the RED signal and its confidence / risk are only computed (and news
+    only fetched) when a filter or `sort` uses them.
+
+    Results are ranked by `sort` ("-" prefix for descending). Symbols not
+    loaded within `deadline` seconds are listed under "skipped".
+    """
+    expressions = [f for f in (filters or "").split(",") if f.strip()]
+    try:
+        return screen(
+            universe=universe,
+            symbols=symbols,
+            filters=expressions,
+            sort=sort,
+            limit=max(1, min(limit, 500)),
+            market=market,
+            deadline=max(0.1, min(deadline, SCREEN_DEADLINE))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
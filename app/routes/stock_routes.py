@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.fetcher import fetch_prices, fetch_stock_details
-from app.indicators import calculate_indicators, generate_signal
+from app.indicators import CLOSE_FIELDS, INDICATOR_FIELDS, calculate_fields
 from app.symbol_mapper import normalize_symbol
-from app.market_router import fetch_market_prices
+from app.market_router import fetch_market_bars
+from app.resample import INTERVALS
+from app.services.market_snapshot import TRENDING_SYMBOLS, get_snapshot
 
 router = APIRouter()
 
@@ -39,42 +41,60 @@ def get_prices(symbol: str):
     }
 
 @router.get("/get_indicators")
-def get_indicators(symbol: str, market: str = "GLOBAL"):
+def get_indicators(symbol: str, market: str = "GLOBAL", interval: str = "1d", fields: str = None):
     """
     Get technical indicators for a stock symbol.
-    Supports NSE, BSE, and GLOBAL markets.
+    Supports NSE, BSE, and GLOBAL markets, on daily (1d), weekly (1wk)
+    or monthly (1mo) bars.
+
+    `fields` is a comma separated subset of rsi, sma, ema, macd, signal,
+    atr, bollinger, stochastic, obv, vwap; only those are computed.
+    Defaults to the RSI / SMA / EMA / MACD set.
     """
+    if interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval must be one of {', '.join(INTERVALS)}")
+
+    requested = CLOSE_FIELDS if fields is None else [f.strip().lower() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in INDICATOR_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(status_code=400, detail=f"fields must be a subset of {', '.join(INDICATOR_FIELDS)}")
+
     final_symbol, resolved_market = normalize_symbol(symbol, market)
-    prices = fetch_market_prices(final_symbol, resolved_market)
+    bars = fetch_market_bars(final_symbol, resolved_market, interval)
+
+    values = None
+    if bars is not None and len(bars) >= 50:
+        values = calculate_fields(bars, list(dict.fromkeys(requested)), symbol=final_symbol, interval=interval)
 
-    if prices is None or len(prices) < 50:
+    if values is None:
         return {
             "error": "Not enough data to calculate indicators",
             "symbol": final_symbol,
-            "market": resolved_market
+            "market": resolved_market,
+            "interval": interval
         }
 
-    indicators = calculate_indicators(prices)
-    signal = generate_signal(indicators["rsi"], indicators["macd"])
-
-    return {
+    result = {
         "symbol": final_symbol,
         "market": resolved_market,
-        "RSI": round(indicators["rsi"], 2),
-        "SMA": round(indicators["sma"], 2),
-        "EMA": round(indicators["ema"], 2),
-        "MACD": round(indicators["macd"], 2),
-        "signal": signal
+        "interval": interval
     }
+    for name, value in values.items():
+        if name == "signal":
+            result["signal"] = value
+        else:
+            result[name.upper()] = round(value, 2) if value is not None else None
+
+    return result
 
 @router.get("/trending")
-def get_trending():
-    from app.fetcher import fetch_indices
-    trending_symbols = ["TCS.NS", "IDEA.NS", "RELIANCE.NS", "AAPL", "TSLA"]
-    data = fetch_indices(trending_symbols)
+def get_trending(response: Response):
+    # Served from the in-memory snapshot kept warm by the background refresher
+    snapshot = get_snapshot()
+    data = snapshot.quotes
     
     trending_list = []
-    for sym in trending_symbols:
+    for sym in TRENDING_SYMBOLS:
         s_data = data.get(sym)
         if s_data:
              change = s_data['change']
@@ -91,8 +111,11 @@ def get_trending():
                 "change": f"{s_data['change']:.2f}%", 
                 "isPositive": s_data['change'] >= 0,
                 "currency": "USD" if "NS" not in sym else "INR",
-                "action": action
+                "action": action,
+                "snapshot_age": snapshot.age
             })
+
+    response.headers["X-Snapshot-Age"] = str(snapshot.age)
     return trending_list
 
 @router.get("/search")
@@ -0,0 +1,48 @@
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.services.market_snapshot import INDEX_NAMES
+from app.services.quote_stream import MAX_STREAM_SYMBOLS, hub
+
+router = APIRouter()
+
+# Comment line sent when idle so proxies keep the connection open
+HEARTBEAT_SECONDS = 15
+
+
+@router.get("/stream/quotes")
+async def stream_quotes(request: Request, symbols: str = "", indices: bool = True):
+    """
+    Server-sent events stream of {symbol: {price, change}} deltas.
+    The first event carries the latest known quotes; later events only
+    the symbols whose quote changed.
+    """
+    wanted = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    if indices:
+        wanted += list(INDEX_NAMES)
+    wanted = list(dict.fromkeys(wanted))
+
+    if not wanted:
+        raise HTTPException(status_code=400, detail="No symbols to stream")
+    if len(wanted) > MAX_STREAM_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_STREAM_SYMBOLS} symbols per stream")
+
+    async def events():
+        sub = hub.subscribe(wanted)
+        try:
+            while not await request.is_disconnected():
+                updates = await sub.next_update(HEARTBEAT_SECONDS)
+                if updates:
+                    yield f"event: quotes\ndata: {json.dumps(updates)}\n\n"
+                else:
+                    yield ": keep-alive\n\n"
+        finally:
+            hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
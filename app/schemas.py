@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import List, Optional
 
 # ---------- Request Schemas ----------
 
@@ -7,6 +8,12 @@ class StockRequest(BaseModel):
     symbol: str
 
 
+class FusionBatchRequest(BaseModel):
+    symbols: List[str]
+    market: str = "GLOBAL"
+    interval: str = "1d"
+
+
 # ---------- Response Schemas ----------
 
 class PriceResponse(BaseModel):
@@ -86,9 +93,6 @@ class FusionResponse(BaseModel):
     cons: List[str] = []
 
 
-from datetime import datetime
-from typing import List, Optional
-
 class IndicatorHistoryItem(BaseModel):
     rsi: float
     sma: float
@@ -1,16 +1,32 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy.orm import Session
 from app.models import Indicator, RedEngineResult
 import random
 
 from app.ai_engine.red_engine import red_engine
 from app.ai_engine.explainability import generate_explanation
-from app.ai_engine.regime import detect_market_regime
+from app.ai_engine.regime import regime_for_symbol
 from app.indicators import calculate_indicators_df, generate_signal
 from app.market_router import fetch_market_prices
 from app.schemas import FusionResponse, TechnicalIndicators, AIInsight
 
 from app.services.news_service import fetch_stock_news
 from app.services.sentiment_service import analyze_sentiment
+from app.symbol_mapper import normalize_symbol
+
+# Batch insight: symbols per request, symbols computed at once (across
+# all requests), the seconds one symbol's own work may take before it is
+# reported as timed out, and the seconds a whole batch request may take
+FUSION_BATCH_MAX_SYMBOLS = int(os.getenv("FUSION_BATCH_MAX_SYMBOLS", "300"))
+FUSION_BATCH_WORKERS = int(os.getenv("FUSION_BATCH_WORKERS", "8"))
+FUSION_SYMBOL_TIMEOUT = float(os.getenv("FUSION_SYMBOL_TIMEOUT", "15"))
+FUSION_BATCH_DEADLINE = float(os.getenv("FUSION_BATCH_DEADLINE", "60"))
+
+_batch_pool = ThreadPoolExecutor(max_workers=FUSION_BATCH_WORKERS, thread_name_prefix="fusion")
 
 def get_latest_indicator(db: Session, symbol: str):
     return (
@@ -28,7 +44,10 @@ def get_latest_red_result(db: Session, symbol: str):
         .first()
     )
 
-def generate_fusion_insight(symbol: str, market: str, db: Session = None):
+# Bar unit used in the generated pros / cons text
+BAR_UNITS = {"1d": "day", "1wk": "week", "1mo": "month"}
+
+def generate_fusion_insight(symbol: str, market: str, db: Session = None, interval: str = "1d"):
     """
     Orchestrates the AI Insight generation:
     1. Fetch Prices
@@ -39,12 +58,12 @@ def generate_fusion_insight(symbol: str, market: str, db: Session = None):
     """
     
     # 1. Fetch Data
-    prices = fetch_market_prices(symbol, market)
+    prices = fetch_market_prices(symbol, market, interval)
     if prices is None or len(prices) < 50:
          return None
          
-    # 2. Technicals
-    df = calculate_indicators_df(prices)
+    # 2. Technicals (memoized per symbol until the next bar)
+    df = calculate_indicators_df(prices, symbol=symbol, interval=interval)
     if df.empty:
         return None
         
@@ -58,7 +77,7 @@ def generate_fusion_insight(symbol: str, market: str, db: Session = None):
     elif technical_signal == "SELL": tech_score = -1.0
     
     # 3. Market Regime
-    regime = detect_market_regime(df['close'], df['rsi'])
+    regime = regime_for_symbol(symbol, prices, interval)
     
     # 4. Sentiment Analysis
     # Fetch news
@@ -98,8 +117,8 @@ def generate_fusion_insight(symbol: str, market: str, db: Session = None):
     elif latest['rsi'] > 55: cons.append("Overbought Bias: Momentum suggests a potential peak is approaching.")
     
     # Technical: SMA/EMA
-    if latest['close'] > latest['sma']: pros.append("Bullish Trend: Price is trading comfortably above its 14-day average (SMA).")
-    else: cons.append("Bearish Trend: Price has fallen below its 14-day moving average (SMA).")
+    if latest['close'] > latest['sma']: pros.append(f"Bullish Trend: Price is trading comfortably above its 14-{BAR_UNITS[interval]} average (SMA).")
+    else: cons.append(f"Bearish Trend: Price has fallen below its 14-{BAR_UNITS[interval]} moving average (SMA).")
     
     if latest['close'] > latest['ema']: pros.append("EMA Support: Short-term price action remains positive above the EMA.")
     else: cons.append("EMA Resistance: Short-term trend is struggling to break above the EMA line.")
@@ -165,3 +184,89 @@ def generate_fusion_insight(symbol: str, market: str, db: Session = None):
         pros=selected_pros,
         cons=selected_cons
     )
+
+
+async def stream_fusion_insights(
+    symbols: list,
+    market: str = "GLOBAL",
+    interval: str = "1d",
+    timeout: float = None,
+    deadline: float = None
+):
+    """
+    Yields one result dict per symbol as soon as its insight is ready,
+    then a summary. Insights run on a shared bounded pool, so concurrent
+    symbols share price / news fetches and the indicator caches.
+
+    Each result is {"symbol", "market", "requested" (the input spellings),
+    "status": ok | no_data | timeout | error} with the "insight" (ok) or
+    a "detail".
+
+    The whole request ends within `deadline` seconds: symbols still queued
+    then are cancelled and reported as timed out.
+    """
+    started = time.monotonic()
+    timeout = timeout or FUSION_SYMBOL_TIMEOUT
+    deadline = deadline or FUSION_BATCH_DEADLINE
+    deadline_at = started + deadline
+    loop = asyncio.get_running_loop()
+
+    # Duplicates (e.g. "tcs" and "TCS.NS" on NSE) are computed once
+    resolved = {}
+    for symbol in symbols:
+        resolved.setdefault(normalize_symbol(symbol, market), []).append(symbol)
+
+    async def run(final_symbol: str, resolved_market: str):
+        result = {"symbol": final_symbol, "market": resolved_market, "requested": resolved[(final_symbol, resolved_market)]}
+        return {**result, **await compute(final_symbol, resolved_market)}
+
+    async def compute(final_symbol: str, resolved_market: str):
+        # The pool is shared by all requests and a thread stays busy until
+        # its insight really finishes, so it bounds the total work. The
+        # timeout starts when the job leaves the queue and starts running,
+        # but never runs past the request's deadline.
+        running = loop.create_future()
+
+        def work():
+            loop.call_soon_threadsafe(lambda: running.done() or running.set_result(None))
+            return generate_fusion_insight(final_symbol, resolved_market, None, interval)
+
+        job = loop.run_in_executor(_batch_pool, work)
+        try:
+            await asyncio.wait_for(running, deadline_at - time.monotonic())
+        except asyncio.TimeoutError:
+            # Still queued: free its place for other requests
+            job.cancel()
+            return {"status": "timeout", "detail": f"Not started within the {deadline:g}s batch deadline"}
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+
+        try:
+            insight = await asyncio.wait_for(job, min(timeout, deadline_at - time.monotonic()))
+        except asyncio.TimeoutError:
+            return {"status": "timeout", "detail": f"No result within {timeout:g}s"}
+        except asyncio.CancelledError:
+            # Client went away: drop the job if it has not started yet
+            job.cancel()
+            raise
+        except Exception as e:
+            print(f"Batch insight failed for {final_symbol}: {e}")
+            return {"status": "error", "detail": str(e)}
+
+        if not insight:
+            return {"status": "no_data", "detail": f"Not enough data to generate insight for {final_symbol}"}
+        return {"status": "ok", "insight": insight.model_dump()}
+
+    tasks = [asyncio.ensure_future(run(*key)) for key in resolved]
+    counts = {}
+    try:
+        for done in asyncio.as_completed(tasks):
+            result = await done
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield {"done": True, "counts": counts, "elapsed": round(time.monotonic() - started, 3)}
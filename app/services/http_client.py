@@ -0,0 +1,159 @@
+# http_client.py
+# Shared keep-alive HTTP client for outbound API calls (NewsAPI, ...).
+#
+# One httpx.AsyncClient lives on a dedicated background event loop thread,
+# so sync routes (FastAPI threadpool) and worker threads share the same
+# connection pool. Successful JSON responses are cached per (url, params)
+# for a TTL; once stale they are revalidated with If-None-Match /
+# If-Modified-Since when the server sent an ETag or Last-Modified.
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "512"))
+
+_loop = None
+_client = None
+_start_lock = threading.Lock()
+
+_cache = OrderedDict()   # (url, params) -> {data, etag, last_modified, expires_at}
+_lock = threading.Lock()
+_stats = {"requests": 0, "hits": 0, "revalidated": 0, "errors": 0}
+
+
+# =====================================================
+# Background loop
+# =====================================================
+def _ensure_loop():
+    global _loop
+    with _start_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="http-client", daemon=True).start()
+            _loop = loop
+    return _loop
+
+
+def _get_client():
+    # Only called on the background loop, which owns the pool
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS
+            )
+        )
+    return _client
+
+
+# =====================================================
+# Cached GET
+# =====================================================
+async def _get_json(url: str, params: dict, ttl: float, headers: dict, on_response=None):
+    key = (url, tuple(sorted(params.items())))
+    now = time.monotonic()
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry["expires_at"] > now:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return 200, entry["data"]
+
+    request_headers = dict(headers)
+    if entry is not None:
+        if entry["etag"]:
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    with _lock:
+        _stats["requests"] += 1
+    response = await _get_client().get(url, params=params, headers=request_headers)
+    if on_response is not None:
+        on_response(response)
+
+    if response.status_code == 304 and entry is not None:
+        with _lock:
+            entry["expires_at"] = now + ttl
+            _stats["revalidated"] += 1
+        return 200, entry["data"]
+
+    if response.status_code != 200:
+        with _lock:
+            _stats["errors"] += 1
+        return response.status_code, None
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if ttl > 0 or etag or last_modified:
+        with _lock:
+            _cache[key] = {
+                "data": data,
+                "etag": etag,
+                "last_modified": last_modified,
+                "expires_at": now + ttl,
+            }
+            _cache.move_to_end(key)
+            while len(_cache) > HTTP_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+
+    return 200, data
+
+
+def get_json(url: str, params: dict = None, ttl: float = 0.0, headers: dict = None, timeout: float = None, on_response=None):
+    """
+    GET `url` and return (status, parsed JSON or None). Blocks the calling
+    thread; the request itself runs on the shared client's loop.
+
+    `on_response(response)` is called only when a request actually went
+    out (not for cache hits), e.g. to count API quota.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _get_json(url, params or {}, ttl, headers or {}, on_response),
+        _ensure_loop()
+    )
+    return future.result(timeout or HTTP_TIMEOUT + 1)
+
+
+def close():
+    """
+    Closes the pool and stops the background loop (app shutdown).
+    """
+    global _client, _loop
+    with _start_lock:
+        loop, client = _loop, _client
+        _loop = _client = None
+    if loop is None:
+        return
+    if client is not None:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(HTTP_TIMEOUT)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["requests"]
+        return {
+            **_stats,
+            "entries": len(_cache),
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+        for k in _stats:
+            _stats[k] = 0
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from app.fetcher import fetch_indices
+
+# Fixed universe kept warm by the refresher
+INDEX_NAMES = {
+    "^NSEI": "Nifty 50",
+    "^BSESN": "Sensex",
+    "^GSPC": "S&P 500",
+    "^CNX500": "Nifty 500",
+}
+TRENDING_SYMBOLS = ["TCS.NS", "IDEA.NS", "RELIANCE.NS", "AAPL", "TSLA"]
+
+# Seconds between refreshes; 0 disables the background task and the
+# snapshot is then refreshed on demand when it gets this old.
+SNAPSHOT_INTERVAL = float(os.getenv("MARKET_SNAPSHOT_INTERVAL", "60"))
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    quotes: MappingProxyType   # symbol -> {price, change}
+    taken_at: float
+
+    @property
+    def age(self) -> float:
+        return round(time.time() - self.taken_at, 1)
+
+
+_snapshot = None
+_refresher_running = False
+
+
+def refresh_snapshot() -> MarketSnapshot:
+    """
+    Fetches the whole universe and publishes a new immutable snapshot.
+    Symbols that fail this round keep their previous quote.
+    """
+    global _snapshot
+
+    fresh = fetch_indices(list(INDEX_NAMES) + TRENDING_SYMBOLS)
+
+    quotes = dict(_snapshot.quotes) if _snapshot else {}
+    quotes.update({sym: MappingProxyType(dict(q)) for sym, q in fresh.items()})
+
+    # Single reference swap: readers see either the old or the new snapshot
+    _snapshot = MarketSnapshot(quotes=MappingProxyType(quotes), taken_at=time.time())
+    return _snapshot
+
+
+def get_snapshot() -> MarketSnapshot:
+    """
+    Latest published snapshot. Without a running refresher (e.g. on
+    serverless), a missing or stale snapshot is refreshed inline.
+    """
+    snapshot = _snapshot
+    if snapshot is None:
+        return refresh_snapshot()
+
+    if not _refresher_running and time.time() - snapshot.taken_at > max(SNAPSHOT_INTERVAL, 60):
+        return refresh_snapshot()
+
+    return snapshot
+
+
+async def run_refresher(interval: float = SNAPSHOT_INTERVAL):
+    global _refresher_running
+    _refresher_running = True
+    try:
+        while True:
+            try:
+                await asyncio.to_thread(refresh_snapshot)
+            except Exception as e:
+                print(f"Market snapshot refresh failed: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        _refresher_running = False
+
+
+def start_refresher():
+    """
+    Starts the background refresher on the running event loop.
+    Returns the task, or None if disabled.
+    """
+    if SNAPSHOT_INTERVAL <= 0:
+        return None
+    return asyncio.create_task(run_refresher(SNAPSHOT_INTERVAL))
@@ -1,45 +1,311 @@
 import os
-import requests
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from datetime import datetime, timedelta, timezone
+
+from app.ai_engine.keyword_matcher import trie_pattern
+from app.services.http_client import get_json
+from app.singleflight import coalesce
+from app.symbol_mapper import COMMON_SYMBOL_MAP
 
 API_KEY = os.getenv("NEWS_API_KEY")
 BASE_URL = "https://newsapi.org/v2/everything"
 
-def fetch_stock_news(symbol: str):
-    if not API_KEY:
-        # Return mock news for demonstration/fallback
-        return [
-            {"title": "Global Markets Rally: Live Updates and Trends", "url": "https://www.google.com/search?q=Global+Stock+Markets+News+latest&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1611974765270-ca1258634369?w=400", "source": {"name": "MarketWatch"}},
-            {"title": "Technology Sector Surges: Weekly Performance Review", "url": "https://www.google.com/search?q=Tech+Sector+Stocks+News+latest&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?w=400", "source": {"name": "Bloomberg"}},
-            {"title": "Federal Reserve Outlook: Interest Rate Impacts", "url": "https://www.google.com/search?q=Fed+Rate+News&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1556740758-90de29294860?w=400", "source": {"name": "Reuters"}},
-            {"title": "Energy Sector Shift: Renewable Growth Surpasses Forecasts", "url": "https://www.google.com/search?q=Energy+Market+News&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1466611653911-95081537e5b7?w=400", "source": {"name": "CleanTech"}},
-            {"title": "Corporate Earnings Season: Key Highlights and Surprises", "url": "https://www.google.com/search?q=Earnings+Season+Highlights&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1580519542036-c47de6196ba5?w=400", "source": {"name": "CNBC"}}
-        ]
-
-    # Enhanced targeted keywords for market impact
-    impact_keywords = "(earnings OR dividend OR " + symbol + " news OR price target OR acquisition OR surge OR plunge)"
-    
-    # Clean symbol for search (e.g., IRFC.NS -> IRFC)
-    clean_symbol = symbol.split('.')[0]
-    
-    query = f"({clean_symbol} OR {symbol}) AND {impact_keywords}"
+# Seconds a query's articles are reused before asking NewsAPI again
+NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", "600"))
+
+# Batching: concurrent symbol requests arriving within NEWS_BATCH_WINDOW
+# seconds are merged into OR queries of at most NEWS_QUERY_MAX_CHARS
+# (NewsAPI's limit for `q`) and NEWS_BATCH_MAX_SYMBOLS symbols.
+NEWS_BATCH_WINDOW = float(os.getenv("NEWS_BATCH_WINDOW", "0.05"))
+NEWS_BATCH_MAX_SYMBOLS = int(os.getenv("NEWS_BATCH_MAX_SYMBOLS", "15"))
+NEWS_QUERY_MAX_CHARS = 500
+NEWS_ARTICLES_PER_SYMBOL = 10
+
+# Symbols whose articles are kept for NEWS_CACHE_TTL
+NEWS_SYMBOL_CACHE_MAX_ENTRIES = int(os.getenv("NEWS_SYMBOL_CACHE_MAX_ENTRIES", "2000"))
+
+# Requests per day allowed by the NewsAPI plan (developer plan: 100)
+NEWS_DAILY_QUOTA = int(os.getenv("NEWS_DAILY_QUOTA", "100"))
+
+IMPACT_KEYWORDS = ["earnings", "dividend", "price target", "acquisition", "surge", "plunge"]
+
+MOCK_NEWS = [
+    {"title": "Global Markets Rally: Live Updates and Trends", "url": "https://www.google.com/search?q=Global+Stock+Markets+News+latest&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1611974765270-ca1258634369?w=400", "source": {"name": "MarketWatch"}},
+    {"title": "Technology Sector Surges: Weekly Performance Review", "url": "https://www.google.com/search?q=Tech+Sector+Stocks+News+latest&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?w=400", "source": {"name": "Bloomberg"}},
+    {"title": "Federal Reserve Outlook: Interest Rate Impacts", "url": "https://www.google.com/search?q=Fed+Rate+News&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1556740758-90de29294860?w=400", "source": {"name": "Reuters"}},
+    {"title": "Energy Sector Shift: Renewable Growth Surpasses Forecasts", "url": "https://www.google.com/search?q=Energy+Market+News&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1466611653911-95081537e5b7?w=400", "source": {"name": "CleanTech"}},
+    {"title": "Corporate Earnings Season: Key Highlights and Surprises", "url": "https://www.google.com/search?q=Earnings+Season+Highlights&tbs=qdr:m", "urlToImage": "https://images.unsplash.com/photo-1580519542036-c47de6196ba5?w=400", "source": {"name": "CNBC"}}
+]
+
+
+# =====================================================
+# Quota
+# =====================================================
+class NewsQuota:
+    """
+    Counts NewsAPI requests per UTC day. After a 429 (rate limited) no
+    further requests are sent until the next day.
+    """
+
+    def __init__(self, daily_limit: int):
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._day = None
+        self.used = 0
+        self.blocked = False
+
+    def _roll(self):
+        today = datetime.now(timezone.utc).date()
+        if today != self._day:
+            self._day = today
+            self.used = 0
+            self.blocked = False
+
+    def available(self) -> bool:
+        with self._lock:
+            self._roll()
+            return not self.blocked and self.used < self.daily_limit
+
+    def record(self, response):
+        with self._lock:
+            self._roll()
+            self.used += 1
+            if response.status_code == 429:
+                self.blocked = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._roll()
+            return {
+                "used": self.used,
+                "remaining": 0 if self.blocked else max(self.daily_limit - self.used, 0),
+                "daily_limit": self.daily_limit,
+                "resets_at": (datetime.combine(self._day, datetime.min.time(), timezone.utc) + timedelta(days=1)).isoformat(),
+            }
+
+
+quota = NewsQuota(NEWS_DAILY_QUOTA)
+
+
+def _request(query: str, page_size: int):
+    """
+    One NewsAPI search. Returns the articles, or None if the request
+    failed or the quota is used up.
+    """
+    if not quota.available():
+        return None
 
     params = {
         "q": query,
         "language": "en",
         "sortBy": "relevancy", # Relevancy is better for targeted news
-        "pageSize": 10,
+        "pageSize": page_size,
         "apiKey": API_KEY
     }
-
     try:
-        response = requests.get(BASE_URL, params=params, timeout=5)
-        if response.status_code != 200:
-            # Fallback to simple query if complex one fails
-            params["q"] = f"{symbol} stock news"
-            response = requests.get(BASE_URL, params=params, timeout=5)
-            if response.status_code != 200:
-                return []
-        
-        return response.json().get("articles", [])
-    except Exception:
-        return []
+        # Pooled keep-alive client; repeated queries are served from its cache
+        status, data = get_json(BASE_URL, params, ttl=NEWS_CACHE_TTL, on_response=quota.record)
+    except Exception as e:
+        print(f"News request failed: {e}")
+        return None
+    return data.get("articles", []) if status == 200 else None
+
+
+# =====================================================
+# Multi-symbol queries
+# =====================================================
+def symbol_terms(symbol: str) -> tuple:
+    """
+    (tickers, names) an article about `symbol` would mention: the ticker
+    without exchange suffix and any company names mapped to it.
+    """
+    base = symbol.upper().split(".")[0]
+    names = sorted(name for name, code in COMMON_SYMBOL_MAP.items() if code == base)
+    return [base], names
+
+
+def _clause(symbol: str) -> str:
+    tickers, names = symbol_terms(symbol)
+    # NewsAPI search is case-insensitive, so "reliance" adds nothing to RELIANCE
+    names = [f'"{name}"' if " " in name else name for name in names if name.upper() not in tickers]
+    return " OR ".join(tickers + names)
+
+
+def build_queries(symbols) -> list:
+    """
+    Packs symbols into as few OR queries as fit NewsAPI's query length.
+    Returns [(query, [symbols])].
+    """
+    impact = " AND (" + " OR ".join(f'"{k}"' if " " in k else k for k in IMPACT_KEYWORDS) + ")"
+    budget = NEWS_QUERY_MAX_CHARS - len(impact) - 2
+
+    groups, clauses, members = [], [], []
+    for symbol in symbols:
+        clause = _clause(symbol)
+        length = len(" OR ".join(clauses + [clause]))
+        if members and (length > budget or len(members) >= NEWS_BATCH_MAX_SYMBOLS):
+            groups.append(("(" + " OR ".join(clauses) + ")" + impact, members))
+            clauses, members = [], []
+        clauses.append(clause)
+        members.append(symbol)
+
+    if members:
+        groups.append(("(" + " OR ".join(clauses) + ")" + impact, members))
+    return groups
+
+
+def split_articles(articles, symbols) -> dict:
+    """
+    Assigns each article to every symbol whose ticker (case-sensitive,
+    whole word) or company name (any case) it mentions.
+    """
+    by_ticker, by_name = {}, {}
+    for symbol in symbols:
+        tickers, names = symbol_terms(symbol)
+        for t in tickers:
+            by_ticker.setdefault(t, []).append(symbol)
+        for n in names:
+            by_name.setdefault(n.lower(), []).append(symbol)
+
+    ticker_re = re.compile(r"(?<![A-Za-z0-9])(" + trie_pattern(by_ticker) + r")(?![A-Za-z0-9])")
+    name_re = re.compile(r"(?<![a-z0-9])(" + trie_pattern(by_name) + r")(?![a-z0-9])")
+
+    result = {symbol: [] for symbol in symbols}
+    for article in articles:
+        text = " ".join(article.get(k) or "" for k in ("title", "description", "content"))
+        matched = set()
+        for m in ticker_re.finditer(text):
+            matched.update(by_ticker[m.group(1)])
+        for m in name_re.finditer(text.lower()):
+            matched.update(by_name[m.group(1)])
+        for symbol in matched:
+            result[symbol].append(article)
+    return result
+
+
+_symbol_cache = OrderedDict()   # SYMBOL -> (expires_at, articles), oldest first
+_cache_lock = threading.Lock()
+_stats = {"symbols": 0, "cached": 0, "queries": 0}
+
+
+def _cache_put(symbol: str, articles: list):
+    # Every entry lives NEWS_CACHE_TTL, so insertion order is expiry
+    # order: expired entries are always at the front
+    now = time.monotonic()
+    with _cache_lock:
+        _symbol_cache.pop(symbol, None)
+        _symbol_cache[symbol] = (now + NEWS_CACHE_TTL, articles)
+        while _symbol_cache:
+            _, (expires_at, _) = next(iter(_symbol_cache.items()))
+            if expires_at > now and len(_symbol_cache) <= NEWS_SYMBOL_CACHE_MAX_ENTRIES:
+                break
+            _symbol_cache.popitem(last=False)
+
+
+def fetch_news_batch(symbols) -> dict:
+    """
+    Articles for many symbols at once: cached symbols are answered from
+    memory, the rest share as few NewsAPI queries as possible.
+    """
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    now = time.monotonic()
+    results = {}
+
+    with _cache_lock:
+        for symbol in symbols:
+            entry = _symbol_cache.get(symbol)
+            if entry is not None and entry[0] > now:
+                results[symbol] = entry[1]
+        _stats["symbols"] += len(symbols)
+        _stats["cached"] += len(results)
+
+    missing = [s for s in symbols if s not in results]
+    for query, members in build_queries(missing):
+        articles = _request(query, page_size=100)
+        with _cache_lock:
+            _stats["queries"] += 1
+        if articles is None:
+            results.update({symbol: [] for symbol in members})
+            continue
+
+        for symbol, matched in split_articles(articles, members).items():
+            matched = matched[:NEWS_ARTICLES_PER_SYMBOL]
+            results[symbol] = matched
+            _cache_put(symbol, matched)
+
+    return results
+
+
+# =====================================================
+# Micro-batching of concurrent requests
+# =====================================================
+class NewsScheduler:
+    """
+    Collects symbol requests for NEWS_BATCH_WINDOW seconds and sends them
+    as one batch; every caller waits for its own symbol's articles.
+    """
+
+    def __init__(self, window: float = NEWS_BATCH_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+
+    def fetch(self, symbol: str, timeout: float = 15.0) -> list:
+        key = symbol.upper()
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            return []
+
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._timer = None
+
+        try:
+            results = fetch_news_batch(list(batch))
+        except Exception as e:
+            print(f"News batch failed: {e}")
+            results = {}
+
+        for symbol, future in batch.items():
+            future.set_result(results.get(symbol, []))
+
+
+scheduler = NewsScheduler()
+
+
+def news_stats() -> dict:
+    with _cache_lock:
+        stats = dict(_stats, entries=len(_symbol_cache))
+    return {**stats, "quota": quota.stats()}
+
+
+# =====================================================
+# Entry point
+# =====================================================
+@coalesce()
+def fetch_stock_news(symbol: str):
+    if not API_KEY:
+        # Return mock news for demonstration/fallback
+        return list(MOCK_NEWS)
+
+    # Free-text searches (e.g. "stock market") are sent as they are
+    if " " in symbol.strip():
+        return _request(symbol, page_size=10) or []
+
+    # Symbols are merged with concurrent requests into shared queries
+    return scheduler.fetch(symbol)
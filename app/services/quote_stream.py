@@ -0,0 +1,99 @@
+import asyncio
+import os
+
+from app.fetcher import fetch_indices
+from app.services import market_snapshot
+
+# Seconds between upstream polls of the subscribed symbols
+STREAM_POLL_INTERVAL = float(os.getenv("QUOTE_STREAM_INTERVAL", "15"))
+MAX_STREAM_SYMBOLS = 50
+
+
+class Subscription:
+    """
+    One connected client. Updates are merged into `pending` (latest quote
+    per symbol wins), so a slow client never builds an unbounded backlog.
+    """
+
+    def __init__(self, symbols):
+        self.symbols = frozenset(symbols)
+        self.pending = {}
+        self.event = asyncio.Event()
+
+    def push(self, quotes: dict):
+        updates = {s: q for s, q in quotes.items() if s in self.symbols}
+        if updates:
+            self.pending.update(updates)
+            self.event.set()
+
+    async def next_update(self, timeout: float):
+        """
+        Waits for updates; returns {} if nothing arrived within `timeout`.
+        """
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {}
+        self.event.clear()
+        updates, self.pending = self.pending, {}
+        return updates
+
+
+class QuoteHub:
+    """
+    Shared server-side poller. However many clients are connected, the
+    union of their symbols is polled once per interval and only quotes
+    that changed are pushed out.
+    """
+
+    def __init__(self, interval: float = STREAM_POLL_INTERVAL):
+        self.interval = interval
+        self._subscriptions = set()
+        self._last = {}
+        self._task = None
+
+    def subscribe(self, symbols) -> Subscription:
+        sub = Subscription(symbols)
+        self._subscriptions.add(sub)
+
+        # New clients start from the last known quotes
+        sub.push(self._last)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        self._subscriptions.discard(sub)
+
+    def _fetch(self, symbols: list) -> dict:
+        # The snapshot refresher already polls the index / trending
+        # universe; only fetch what it does not cover.
+        snapshot = market_snapshot.get_snapshot()
+        quotes = {s: dict(q) for s, q in snapshot.quotes.items() if s in symbols}
+        missing = [s for s in symbols if s not in quotes]
+        if missing:
+            quotes.update(fetch_indices(missing))
+        return quotes
+
+    async def _run(self):
+        while self._subscriptions:
+            symbols = sorted(set().union(*(s.symbols for s in self._subscriptions)))
+            try:
+                quotes = await asyncio.to_thread(self._fetch, symbols)
+            except Exception as e:
+                print(f"Quote stream poll failed: {e}")
+                quotes = {}
+
+            changed = {s: q for s, q in quotes.items() if self._last.get(s) != q}
+            merged = {**self._last, **quotes}
+            self._last = {s: merged[s] for s in symbols if s in merged}
+
+            if changed:
+                for sub in list(self._subscriptions):
+                    sub.push(changed)
+
+            await asyncio.sleep(self.interval)
+
+
+hub = QuoteHub()
@@ -0,0 +1,280 @@
+# screener.py
+# Screens a universe of symbols with filters over indicators, regime,
+# sentiment and the RED signal.
+#
+# Prices (and news, when a filter needs sentiment) are fetched in parallel
+# on one bounded pool shared by all requests, and the whole fetch is cut
+# off at a deadline; symbols that miss it are reported as skipped.
+# Indicators, regimes and RED signals are then computed at once for all
+# symbols sharing a calendar.
+
+import operator
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.batch_indicators import INDICATOR_COLUMNS, batch_indicators, signal_labels, tech_scores
+from app.ai_engine.red_engine import red_engine_batch, regime_codes
+from app.ai_engine.regime import regime_frame
+from app.market_router import fetch_market_prices
+from app.services.market_snapshot import TRENDING_SYMBOLS
+from app.services.news_service import fetch_stock_news
+from app.services.sentiment_service import analyze_sentiment
+from app.symbol_mapper import normalize_symbol
+
+# Upstream fetch threads shared by all /screen requests
+SCREEN_MAX_WORKERS = int(os.getenv("SCREEN_MAX_WORKERS", "8"))
+SCREEN_DEADLINE = float(os.getenv("SCREEN_DEADLINE", "10"))
+SCREEN_MAX_SYMBOLS = int(os.getenv("SCREEN_MAX_SYMBOLS", "500"))
+
+# Same minimum history as /fusion/insight
+MIN_BARS = 50
+
+_screen_pool = ThreadPoolExecutor(max_workers=SCREEN_MAX_WORKERS, thread_name_prefix="screen")
+
+UNIVERSES = {
+    "nifty50": [
+        "ADANIENT.NS", "ADANIPORTS.NS", "APOLLOHOSP.NS", "ASIANPAINT.NS", "AXISBANK.NS",
+        "BAJAJ-AUTO.NS", "BAJFINANCE.NS", "BAJAJFINSV.NS", "BEL.NS", "BHARTIARTL.NS",
+        "CIPLA.NS", "COALINDIA.NS", "DRREDDY.NS", "EICHERMOT.NS", "ETERNAL.NS",
+        "GRASIM.NS", "HCLTECH.NS", "HDFCBANK.NS", "HDFCLIFE.NS", "HEROMOTOCO.NS",
+        "HINDALCO.NS", "HINDUNILVR.NS", "ICICIBANK.NS", "INDUSINDBK.NS", "INFY.NS",
+        "ITC.NS", "JIOFIN.NS", "JSWSTEEL.NS", "KOTAKBANK.NS", "LT.NS",
+        "M&M.NS", "MARUTI.NS", "NESTLEIND.NS", "NTPC.NS", "ONGC.NS",
+        "POWERGRID.NS", "RELIANCE.NS", "SBILIFE.NS", "SBIN.NS", "SHRIRAMFIN.NS",
+        "SUNPHARMA.NS", "TATACONSUM.NS", "TATAMOTORS.NS", "TATASTEEL.NS", "TCS.NS",
+        "TECHM.NS", "TITAN.NS", "TRENT.NS", "ULTRACEMCO.NS", "WIPRO.NS",
+    ],
+    "trending": TRENDING_SYMBOLS,
+}
+
+NUMERIC_FIELDS = INDICATOR_COLUMNS + ("tech_score", "sentiment", "confidence")
+LABEL_FIELDS = ("regime", "signal", "tech_signal", "risk")
+
+# Fields that need news to be fetched
+SENTIMENT_FIELDS = ("sentiment", "signal", "confidence", "risk")
+
+OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "=": operator.eq, "==": operator.eq, "!=": operator.ne,
+}
+
+FILTER_PATTERN = re.compile(r"^\s*([a-z_]+)\s*(<=|>=|==|!=|<|>|=)\s*(.+?)\s*$")
+
+
+# =====================================================
+# Filters
+# =====================================================
+def parse_filter(expression: str) -> tuple:
+    """
+    "rsi<30" -> ("rsi", "<", 30.0); "regime=Trending" -> ("regime", "=", "trending").
+    Raises ValueError for unknown fields, operators or values.
+    """
+    match = FILTER_PATTERN.match(expression.lower())
+    if match is None:
+        raise ValueError(f"Invalid filter: {expression}")
+
+    field, op, value = match.groups()
+    if field in NUMERIC_FIELDS:
+        try:
+            return field, op, float(value)
+        except ValueError:
+            raise ValueError(f"{field} needs a number: {expression}")
+
+    if field in LABEL_FIELDS:
+        if op not in ("=", "==", "!="):
+            raise ValueError(f"{field} only supports = and !=: {expression}")
+        return field, op, value
+
+    raise ValueError(f"Unknown filter field {field}; use one of {', '.join(NUMERIC_FIELDS + LABEL_FIELDS)}")
+
+
+def parse_sort(sort: str) -> tuple:
+    """
+    "-confidence" -> ("confidence", descending=True).
+    """
+    field = sort.strip().lower()
+    descending = field.startswith("-")
+    field = field.lstrip("-")
+    if field not in NUMERIC_FIELDS:
+        raise ValueError(f"Can only sort by {', '.join(NUMERIC_FIELDS)}")
+    return field, descending
+
+
+def resolve_universe(universe: str = None, symbols: str = None, market: str = "GLOBAL") -> list:
+    """
+    Symbols of a named universe or a comma separated list, with exchange
+    suffixes applied for `market`.
+    """
+    if symbols:
+        names = [s.strip() for s in symbols.split(",") if s.strip()]
+    elif universe:
+        names = UNIVERSES.get(universe.lower())
+        if names is None:
+            raise ValueError(f"Unknown universe {universe}; use one of {', '.join(UNIVERSES)}")
+    else:
+        raise ValueError("Give a universe or symbols")
+
+    resolved = list(dict.fromkeys(normalize_symbol(s, market)[0] for s in names))
+    if len(resolved) > SCREEN_MAX_SYMBOLS:
+        raise ValueError(f"At most {SCREEN_MAX_SYMBOLS} symbols per screen")
+    return resolved
+
+
+# =====================================================
+# Parallel fetch
+# =====================================================
+def _load(symbol: str, with_news: bool):
+    prices = fetch_market_prices(symbol, normalize_symbol(symbol)[1])
+    if prices is None or len(prices.dropna()) < MIN_BARS:
+        return None, None
+
+    if not with_news:
+        return prices, None
+    news = fetch_stock_news(symbol)
+    return prices, {
+        "score": analyze_sentiment(news)["score"],
+        # Same confidence rule as /fusion/insight
+        "confidence": 0.7 if news else 0.3
+    }
+
+
+def fetch_universe(symbols, with_news: bool, deadline: float = SCREEN_DEADLINE):
+    """
+    Loads prices (and sentiment) for `symbols` on the shared screen pool.
+    Returns ({symbol: (prices, sentiment)}, {symbol: reason}) for
+    everything finished / skipped within `deadline` seconds.
+    """
+    futures = {_screen_pool.submit(_load, symbol, with_news): symbol for symbol in symbols}
+    done, not_done = wait(futures, timeout=deadline)
+
+    # Queued work is dropped; fetches already running finish in the
+    # background but keep their pool thread, so the limit still holds
+    for future in not_done:
+        future.cancel()
+
+    loaded, skipped = {}, {}
+    for future in done:
+        symbol = futures[future]
+        try:
+            prices, sentiment = future.result()
+        except Exception as e:
+            print(f"Screen fetch failed for {symbol}: {e}")
+            skipped[symbol] = "error"
+            continue
+        if prices is None:
+            skipped[symbol] = "not enough data"
+        else:
+            loaded[symbol] = (prices, sentiment)
+
+    for future in not_done:
+        skipped[futures[future]] = "deadline"
+    return loaded, skipped
+
+
+# =====================================================
+# Screen
+# =====================================================
+def calendar_frames(closes_by_symbol: dict) -> list:
+    """
+    One close frame per set of symbols trading on exactly the same dates.
+    Indicators are computed per frame, never over a forward-filled union
+    of calendars (NSE and US holidays differ), so they equal the per
+    symbol values served by /fusion/insight.
+    """
+    groups = {}
+    for symbol, prices in closes_by_symbol.items():
+        prices = prices.dropna()
+        groups.setdefault(prices.index.asi8.tobytes(), {})[symbol] = prices
+    return [pd.DataFrame(members) for members in groups.values()]
+
+
+def evaluate(closes, sentiment: dict = None) -> dict:
+    """
+    Latest indicators, regime and RED signal for every column of a close
+    frame without gaps, as {field: array over symbols}.
+    """
+    ind = batch_indicators(closes)
+    rsi = ind["rsi"]
+
+    rows = {col: ind[col].to_numpy()[-1] for col in INDICATOR_COLUMNS}
+    rows["tech_score"] = tech_scores(ind)[-1]
+    rows["tech_signal"] = signal_labels(rows["rsi"], rows["macd"])
+    rows["regime"] = regime_frame(closes, rsi).to_numpy()[-1]
+
+    if sentiment is not None:
+        symbols = closes.columns
+        rows["sentiment"] = np.array([sentiment[s]["score"] for s in symbols], dtype=np.float64)
+        red = red_engine_batch(
+            rows["tech_score"],
+            rows["sentiment"],
+            np.array([sentiment[s]["confidence"] for s in symbols], dtype=np.float64),
+            regime_codes(rows["regime"])
+        )
+        rows.update(red)
+    return rows
+
+
+def screen(
+    universe: str = None,
+    symbols: str = None,
+    filters=(),
+    sort: str = "-tech_score",
+    limit: int = 50,
+    market: str = "GLOBAL",
+    deadline: float = SCREEN_DEADLINE
+) -> dict:
+    """
+    Symbols of the universe passing every filter, ranked by `sort`.
+    Raises ValueError for bad input.
+    """
+    started = time.monotonic()
+    parsed = [parse_filter(f) for f in filters]
+    sort_field, descending = parse_sort(sort)
+    members = resolve_universe(universe, symbols, market)
+
+    with_news = any(field in SENTIMENT_FIELDS for field, _, _ in parsed) or sort_field in SENTIMENT_FIELDS
+    loaded, skipped = fetch_universe(members, with_news, deadline)
+
+    results = []
+    matched = 0
+    if loaded:
+        frames = calendar_frames({s: prices for s, (prices, _) in loaded.items()})
+        sentiment = {s: sent for s, (_, sent) in loaded.items()} if with_news else None
+        parts = [evaluate(frame, sentiment) for frame in frames]
+
+        names = [symbol for frame in frames for symbol in frame.columns]
+        rows = {field: np.concatenate([part[field] for part in parts]) for field in parts[0]}
+
+        mask = np.ones(len(names), dtype=bool)
+        for field, op, value in parsed:
+            column = rows[field]
+            if field in LABEL_FIELDS:
+                column = np.char.lower(column.astype(str))
+            mask &= OPERATORS[op](column, value)
+
+        # Missing values rank last either way
+        keys = rows[sort_field][mask]
+        keys = np.where(np.isnan(keys), np.inf, -keys if descending else keys)
+        index = np.flatnonzero(mask)[np.argsort(keys, kind="stable")][:limit]
+        matched = int(mask.sum())
+
+        for i in index:
+            row = {"symbol": names[i]}
+            for field, column in rows.items():
+                value = column[i]
+                row[field] = str(value) if field in LABEL_FIELDS else (None if np.isnan(value) else round(float(value), 2))
+            results.append(row)
+
+    return {
+        "universe": universe.lower() if universe and not symbols else "custom",
+        "screened": len(loaded),
+        "matched": matched,
+        "results": results,
+        "skipped": skipped,
+        "elapsed": round(time.monotonic() - started, 3)
+    }
@@ -1,4 +1,12 @@
-from textblob import TextBlob
+from app import headline_cache
+
+
+def textblob_polarity(text: str) -> float:
+    # Imported on first use: textblob pulls in nltk, which is slow to
+    # import and not needed for cold starts that never score headlines
+    from textblob import TextBlob
+
+    return TextBlob(text).sentiment.polarity
 
 
 def analyze_sentiment(news_articles):
@@ -9,18 +17,17 @@ def analyze_sentiment(news_articles):
             "score": 0.0
         }
 
-    scores = []
-
-    for article in news_articles:
-        title = article.get("title", "")
-        if title:
-            polarity = TextBlob(title).sentiment.polarity
+    titles = [article.get("title", "") for article in news_articles]
+    titles = [title for title in titles if title]
 
-            # 🔥 amplify negative sentiment (finance-aware tweak)
-            if polarity < 0:
-                polarity *= 1.5
+    # Each distinct headline is scored once and shared across symbols
+    scores = []
+    for polarity in headline_cache.scores(titles, "textblob", textblob_polarity):
+        # 🔥 amplify negative sentiment (finance-aware tweak)
+        if polarity < 0:
+            polarity *= 1.5
 
-            scores.append(polarity)
+        scores.append(polarity)
 
     # If no valid scores
     if not scores:
@@ -0,0 +1,70 @@
+# singleflight.py
+# Request coalescing for upstream fetches.
+#
+# While a call for a key is in flight, concurrent callers with the same key
+# wait for it and receive the same result (or exception) instead of issuing
+# their own upstream request.
+
+import functools
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "shared": 0}
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) once per in-flight `key`.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.stats["calls"] += 1
+            else:
+                self.stats["shared"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+_group = SingleFlight()
+
+
+def coalesce(key=None):
+    """
+    Decorator: concurrent calls with equal arguments share one execution.
+
+    `key` maps the call arguments to a hashable key; by default the
+    positional and keyword arguments themselves are used. Callers share
+    the returned object, so it must be treated as read-only.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            call_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            return _group.do((fn.__module__, fn.__qualname__, call_key), fn, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stats() -> dict:
+    with _group._lock:
+        return {**_group.stats, "in_flight": len(_group._calls)}
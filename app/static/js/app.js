@@ -1,5 +1,31 @@
 const API_URL = ""; // Relative path setup
 
+// --- Live Quotes (server-sent events) ---
+
+// Opens one stream for the given symbols and calls onUpdate(symbol, quote)
+// for every price/change delta pushed by the server.
+function subscribeQuotes(symbols, onUpdate, includeIndices = false) {
+    if (!window.EventSource || symbols.length === 0) return null;
+
+    const params = new URLSearchParams({ symbols: symbols.join(','), indices: includeIndices });
+    const source = new EventSource(`${API_URL}/stream/quotes?${params}`);
+
+    source.addEventListener('quotes', (e) => {
+        const updates = JSON.parse(e.data);
+        Object.entries(updates).forEach(([symbol, quote]) => onUpdate(symbol, quote));
+    });
+    return source;
+}
+
+function updateQuoteCard(card, quote, currency) {
+    if (!card) return;
+    const isPos = quote.change >= 0;
+    card.querySelector('.card-value').innerText = `${currency}${quote.price.toFixed(2)}`;
+    const change = card.querySelector('.card-change');
+    change.className = `card-change ${isPos ? 'positive' : 'negative'}`;
+    change.innerText = `${isPos ? '▲' : '▼'} ${quote.change.toFixed(2)}%`;
+}
+
 // --- Dashboard Functions ---
 
 async function fetchMarketPulse() {
@@ -13,6 +39,7 @@ async function fetchMarketPulse() {
         data.indices.forEach(idx => {
             const card = document.createElement('div');
             card.className = 'card';
+            card.dataset.symbol = idx.symbol;
             const isPos = idx.isPositive;
 
             // Auto-detect currency based on index name
@@ -27,6 +54,14 @@ async function fetchMarketPulse() {
             `;
             grid.appendChild(card);
         });
+
+        // Keep the cards live without re-requesting the whole pulse
+        subscribeQuotes(data.indices.map(idx => idx.symbol), (symbol, quote) => {
+            const card = grid.querySelector(`[data-symbol="${symbol}"]`);
+            const idx = data.indices.find(i => i.symbol === symbol);
+            const currency = (idx.name.includes("Nifty") || idx.name.includes("Sensex")) ? "₹" : "$";
+            updateQuoteCard(card, quote, currency);
+        });
     } catch (e) {
         console.error("Pulse Error", e);
     }
@@ -43,6 +78,7 @@ async function fetchTrending() {
         data.forEach(stock => {
             const card = document.createElement('div');
             card.className = 'card';
+            card.dataset.symbol = stock.symbol;
             card.onclick = () => window.location.href = `/static/stock.html?symbol=${stock.symbol}`;
 
             const isPos = stock.isPositive;
@@ -59,6 +95,7 @@ async function fetchTrending() {
             } else {
                 currency = "₹"; // Default to INR for local context if not known US
             }
+            card.dataset.currency = currency;
 
             card.innerHTML = `
                 <div style="display:flex; justify-content:space-between; margin-bottom:8px;">
@@ -72,6 +109,11 @@ async function fetchTrending() {
             `;
             grid.appendChild(card);
         });
+
+        subscribeQuotes(data.map(stock => stock.symbol), (symbol, quote) => {
+            const card = grid.querySelector(`[data-symbol="${symbol}"]`);
+            if (card) updateQuoteCard(card, quote, card.dataset.currency);
+        });
     } catch (e) {
         console.error("Trending Error", e);
     }
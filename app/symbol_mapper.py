@@ -1,6 +1,12 @@
 # symbol_mapper.py
 # STEP 1 – Stock Symbol Normalization (Indian + Global)
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
 COMMON_SYMBOL_MAP = {
     # 🇮🇳 INDIAN STOCKS
     "tcs": "TCS",
@@ -31,6 +37,7 @@ COMMON_SYMBOL_MAP = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_symbol(symbol: str, market: str = "GLOBAL") -> str:
     if not symbol:
         return None
@@ -52,3 +59,75 @@ def normalize_symbol(symbol: str, market: str = "GLOBAL") -> str:
         return f"{base_symbol}.BO", "BSE"
 
     return base_symbol, "GLOBAL"
+
+
+# -------------------------------------------------
+# Resolution cache
+# -------------------------------------------------
+# Remembers which exchange suffix worked for a raw symbol (e.g. TCS -> TCS.NS)
+# and which symbols returned no data, so repeated lookups of Indian or
+# mistyped tickers do not cost failed upstream round trips every time.
+# Keys include the data source, since providers cover different symbols.
+
+NEGATIVE_TTL = float(os.getenv("SYMBOL_NEGATIVE_TTL", "300"))
+
+# Keys come from user input, so both maps are LRU-bounded
+SYMBOL_CACHE_MAX_ENTRIES = int(os.getenv("SYMBOL_CACHE_MAX_ENTRIES", "4096"))
+
+_resolved = OrderedDict()
+_missing = OrderedDict()
+_resolution_lock = threading.Lock()
+
+
+def _put(entries: OrderedDict, key, value):
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > SYMBOL_CACHE_MAX_ENTRIES:
+        entries.popitem(last=False)
+
+
+def resolved_symbol(symbol: str, source: str = ""):
+    """
+    The symbol that last returned data for `symbol`, or None.
+    """
+    key = (source, symbol.upper())
+    with _resolution_lock:
+        resolved = _resolved.get(key)
+        if resolved is not None:
+            _resolved.move_to_end(key)
+        return resolved
+
+
+def remember_resolution(symbol: str, resolved: str, source: str = ""):
+    with _resolution_lock:
+        _put(_resolved, (source, symbol.upper()), resolved)
+        _missing.pop((source, resolved.upper()), None)
+
+
+def mark_missing(symbol: str, source: str = ""):
+    """
+    Records that `symbol` returned no data, for NEGATIVE_TTL seconds.
+    """
+    with _resolution_lock:
+        _put(_missing, (source, symbol.upper()), time.monotonic() + NEGATIVE_TTL)
+
+
+def is_missing(symbol: str, source: str = "") -> bool:
+    key = (source, symbol.upper())
+    expires_at = _missing.get(key)
+    if expires_at is None:
+        return False
+
+    if expires_at <= time.monotonic():
+        with _resolution_lock:
+            _missing.pop(key, None)
+        return False
+    return True
+
+
+def resolution_stats() -> dict:
+    return {
+        "resolved": len(_resolved),
+        "missing": len(_missing),
+        "normalize": normalize_symbol.cache_info()._asdict()
+    }
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: NumPy indicator kernel vs the previous pandas path.
+
+Passes only if the kernel is at least as fast as pandas at every
+history length, long "max" histories included.
+
+Run from the repository root:
+    python scripts/bench_indicators.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.indicators import calculate_indicators_df, generate_signal
+from app.ai_engine.batch_indicators import latest_snapshot
+from app.ai_engine.red_pipeline import compute_tech_score
+
+
+# Previous implementation (app/indicators.py + ai_engine MACD), kept
+# here as the baseline
+def pandas_indicators(prices):
+    df = prices.to_frame(name="close")
+    df["sma"] = df["close"].rolling(window=14).mean()
+    df["ema"] = df["close"].ewm(span=14, adjust=False).mean()
+
+    delta = df["close"].diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    rs = gain.rolling(window=14).mean() / loss.rolling(window=14).mean()
+    df["rsi"] = 100 - (100 / (1 + rs))
+
+    ema_12 = df["close"].ewm(span=12, adjust=False).mean()
+    ema_26 = df["close"].ewm(span=26, adjust=False).mean()
+    df["macd"] = ema_12 - ema_26
+    return df.dropna()
+
+
+def pandas_tech_inputs(prices):
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0.0)
+    loss = -delta.where(delta < 0, 0.0)
+    rsi = 100 - (100 / (1 + gain.rolling(14, min_periods=14).mean() / loss.rolling(14, min_periods=14).mean()))
+    macd = prices.ewm(span=12, adjust=False).mean() - prices.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    return rsi.dropna().iloc[-1], macd.iloc[-1], signal.iloc[-1]
+
+
+def bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'bars':>6} | {'pandas df':>10} | {'kernel df':>10} | {'speedup':>7} | {'pandas tech':>11} | {'kernel tech':>11} | {'speedup':>7}")
+    print("-" * 82)
+
+    slower = []
+    for n in (126, 252, 1260, 5040, 20160):
+        prices = pd.Series(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))),
+            index=pd.date_range("2000-01-03", periods=n, freq="B")
+        )
+
+        # Same answer on the latest bar
+        old, new = pandas_indicators(prices).iloc[-1], calculate_indicators_df(prices).iloc[-1]
+        assert np.allclose(old.to_numpy(), new.to_numpy(), rtol=1e-12)
+
+        number = max(20, 20000 // n)
+        t_old = bench(lambda: pandas_indicators(prices), number)
+        t_new = bench(lambda: calculate_indicators_df(prices), number)
+        t_old_tech = bench(lambda: pandas_tech_inputs(prices), number)
+        t_new_tech = bench(lambda: compute_tech_score(prices), number)
+
+        print(
+            f"{n:>6} | {t_old:>8.0f}us | {t_new:>8.0f}us | {t_old / t_new:>6.1f}x | "
+            f"{t_old_tech:>9.0f}us | {t_new_tech:>9.0f}us | {t_old_tech / t_new_tech:>6.1f}x"
+        )
+        if t_new > t_old or t_new_tech > t_old_tech:
+            slower.append(n)
+
+
+    # Cross-section: one symbol at a time vs one matrix call
+    print()
+    print(f"{'symbols':>7} | {'per symbol':>10} | {'matrix':>10} | {'speedup':>7}")
+    print("-" * 46)
+
+    index = pd.date_range("2023-01-02", periods=252, freq="B")
+    for width in (10, 100, 500):
+        closes = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (252, width)), axis=0)),
+            index=index,
+            columns=[f"S{i}" for i in range(width)]
+        )
+
+        def per_symbol():
+            for sym in closes:
+                row = calculate_indicators_df(closes[sym]).iloc[-1]
+                generate_signal(row["rsi"], row["macd"])
+                compute_tech_score(closes[sym])
+
+        number = max(3, 300 // width)
+        t_loop = bench(per_symbol, number)
+        t_matrix = bench(lambda: latest_snapshot(closes), number)
+        print(f"{width:>7} | {t_loop / 1000:>8.1f}ms | {t_matrix / 1000:>8.1f}ms | {t_loop / t_matrix:>6.1f}x")
+
+    if slower:
+        raise SystemExit(f"FAIL: kernel slower than pandas at {', '.join(map(str, slower))} bars")
+    print()
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Import-time budget for the API entry point (what a serverless cold start
+pays before the first request).
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter,
+prints the slowest top-level packages and exits with status 1 if the
+total exceeds the budget.
+
+Run from the repository root:
+    python scripts/import_budget.py [--budget-ms 1500] [--module app.main]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+# Heavy modules that must not be imported at startup
+LAZY_MODULES = ("nltk", "textblob", "yfinance")
+
+
+def measure(module: str, runs: int = 3):
+    """
+    Best-of-`runs` total import time (ms) for `module`, with the self
+    time per top-level package and the set of imported modules.
+    """
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            raise SystemExit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+        by_package = defaultdict(float)
+        imported = set()
+        total = 0.0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            parts = line[len("import time:"):].split("|")
+            try:
+                self_us, cumulative_us = int(parts[0]), int(parts[1])
+            except ValueError:
+                continue   # header line
+            name = parts[2].strip()
+            imported.add(name)
+            by_package[name.split(".")[0]] += self_us / 1000
+            if name == module:
+                total = cumulative_us / 1000
+
+        if best is None or total < best[0]:
+            best = (total, by_package, imported)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    total, by_package, imported = measure(args.module)
+
+    print(f"{'package':<24} {'ms':>8}")
+    print("-" * 33)
+    for name, ms in sorted(by_package.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"{name:<24} {ms:>8.1f}")
+    print("-" * 33)
+    print(f"{'import ' + args.module:<24} {total:>8.1f}   (budget {args.budget_ms:.0f} ms)")
+
+    eager = [name for name in LAZY_MODULES if name in imported]
+    if eager:
+        print(f"Imported at startup but should be lazy: {', '.join(eager)}")
+
+    if total > args.budget_ms or eager:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Backtest of the RED signal pipeline over stored daily bars.
+
+Reads bars offline through the local file provider (CSV / Parquet files
+in --data-dir), optionally with historical sentiment, and prints the
+signal counts, hit rate and equity per symbol.
+
+Sentiment CSV columns: date, symbol, score, confidence.
+
+Run from the repository root:
+    python scripts/run_backtest.py [--data-dir data/local] [--symbols AAPL,MSFT]
+        [--period 5y] [--sentiment sentiment.csv] [--long-only] [--cost 0.001]
+        [--regime-window 126] [--equity-csv equity.csv]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.providers import LOCAL_DATA_DIR
+from app.providers.local_provider import LocalFileProvider
+from app.ai_engine.backtest import NEUTRAL_SENTIMENT_CONFIDENCE, REGIME_WINDOW, load_closes, run_backtest
+
+
+def load_sentiment(path: str):
+    """
+    (score, confidence) frames (dates x symbols) from a long-format CSV.
+    """
+    frame = pd.read_csv(path, parse_dates=["date"])
+    frame["symbol"] = frame["symbol"].str.upper()
+    score = frame.pivot_table(index="date", columns="symbol", values="score")
+    confidence = frame.pivot_table(index="date", columns="symbol", values="confidence")
+    return score, confidence
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data-dir", default=LOCAL_DATA_DIR)
+    parser.add_argument("--symbols", help="comma separated; default: every symbol in --data-dir")
+    parser.add_argument("--period", default="max")
+    parser.add_argument("--sentiment", help="CSV with date, symbol, score, confidence")
+    parser.add_argument("--neutral-confidence", type=float, default=NEUTRAL_SENTIMENT_CONFIDENCE)
+    parser.add_argument("--long-only", action="store_true")
+    parser.add_argument("--cost", type=float, default=0.0, help="per unit of position change")
+    parser.add_argument("--regime-window", type=int, default=REGIME_WINDOW, help="closes per regime volatility window; 0 for all history")
+    parser.add_argument("--equity-csv", help="write the per-symbol equity curves here")
+    args = parser.parse_args()
+
+    provider = LocalFileProvider(args.data_dir)
+    symbols = args.symbols.split(",") if args.symbols else provider.symbols()
+    if not symbols:
+        raise SystemExit(f"No data files in {args.data_dir}")
+
+    started = time.perf_counter()
+    closes = load_closes(symbols, provider, args.period)
+    loaded = time.perf_counter()
+
+    score = confidence = None
+    if args.sentiment:
+        score, confidence = load_sentiment(args.sentiment)
+
+    result = run_backtest(
+        closes,
+        sentiment_score=score,
+        sentiment_confidence=confidence,
+        neutral_confidence=args.neutral_confidence,
+        allow_short=not args.long_only,
+        cost=args.cost,
+        regime_window=args.regime_window or None
+    )
+    finished = time.perf_counter()
+
+    signals = result["signals"]
+    print(f"{'symbol':<14} {'BUY':>6} {'SELL':>6} {'hit rate':>9} {'equity':>8}")
+    print("-" * 47)
+    for symbol in signals.columns:
+        hit_rate = result["hit_rate"][symbol]
+        print(
+            f"{symbol:<14} {int((signals[symbol] == 'BUY').sum()):>6} {int((signals[symbol] == 'SELL').sum()):>6} "
+            f"{'-' if pd.isna(hit_rate) else f'{hit_rate:.1%}':>9} {result['equity'][symbol].iloc[-1]:>8.3f}"
+        )
+    print("-" * 47)
+
+    summary = result["summary"]
+    print(f"symbols: {summary['symbols']}  bars: {summary['bars']}  signals: {summary['signals']}")
+    print(f"hit rate: {summary['hit_rate']}  total return: {summary['total_return']:.2%}  max drawdown: {summary['max_drawdown']:.2%}")
+    print(f"load {loaded - started:.2f}s, backtest {finished - loaded:.2f}s")
+
+    if args.equity_csv:
+        equity = result["equity"].copy()
+        equity["PORTFOLIO"] = result["portfolio"]
+        equity.to_csv(args.equity_csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from app import analysis_memo
+from app.ai_engine.indicators import calculate_rsi
+from app.ai_engine.red_pipeline import compute_tech_score
+from app.ai_engine.regime import detect_market_regime, regime_for_symbol
+from app.indicators import calculate_indicators_df, indicator_frame
+
+
+def random_walk(n, seed=11):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-02", periods=n, freq="B")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=index)
+
+
+def test_memo_hits_until_series_advances():
+    analysis_memo.clear()
+    close = random_walk(120)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert analysis_memo.memoize("x", "abc", close, compute) == 1
+    assert analysis_memo.memoize("x", "ABC", close, compute) == 1
+
+    # Forming bar ticks, then a new bar arrives
+    ticked = close.copy()
+    ticked.iloc[-1] += 1
+    assert analysis_memo.memoize("x", "ABC", ticked, compute) == 2
+    assert analysis_memo.memoize("x", "ABC", random_walk(121), compute) == 3
+
+    # Other intervals are separate entries
+    assert analysis_memo.memoize("x", "ABC", close, compute, interval="1wk") == 4
+
+    stats = analysis_memo.stats()
+    assert stats["hits"] == 1
+    assert stats["invalidations"] == 2
+
+
+def test_pipeline_results_shared_and_unchanged():
+    analysis_memo.clear()
+    close = random_walk(130)
+
+    assert compute_tech_score(close, symbol="ZZZ") == compute_tech_score(close)
+    assert regime_for_symbol("ZZZ", close) == detect_market_regime(close, calculate_rsi(close))
+    assert calculate_indicators_df(close, symbol="ZZZ").equals(calculate_indicators_df(close))
+
+    # One indicator frame served the tech score, regime and frame above
+    assert indicator_frame(close, "ZZZ") is indicator_frame(close, "ZZZ")
+    assert analysis_memo.stats()["misses"] == 3
+
+
+def test_changed_parameters_are_not_served_stale(monkeypatch):
+    from app.ai_engine import regime
+
+    analysis_memo.clear()
+    close = random_walk(130)
+    assert regime_for_symbol("ZZZ", close) != "Volatile"
+
+    # A tuned threshold must not be answered from the old entry
+    monkeypatch.setattr(regime, "VOLATILITY_THRESHOLD", 0.0)
+    assert regime_for_symbol("ZZZ", close) == "Volatile"
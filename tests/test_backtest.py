@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.backtest import load_closes, run_backtest
+from app.ai_engine.batch_indicators import close_matrix
+from app.ai_engine.red_engine import red_engine
+from app.ai_engine.red_pipeline import compute_tech_score
+from app.ai_engine.regime import detect_market_regime
+from app.indicators import indicator_frame
+from app.providers.local_provider import LocalFileProvider
+
+
+def random_closes(n=300, symbols=("AAA", "BBB", "CCC"), seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=n)
+    data = {s: 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))) for s in symbols}
+    closes = pd.DataFrame(data, index=index)
+    closes.iloc[:60, 2] = np.nan   # listed later
+    return closes
+
+
+def test_signals_match_scalar_pipeline():
+    closes = random_closes()
+    result = run_backtest(closes, regime_window=None)
+
+    for symbol in closes.columns:
+        series = closes[symbol].dropna()
+        for t in range(5, len(series), 17):
+            close = series.iloc[:t + 1]
+            regime = detect_market_regime(close, indicator_frame(close)["rsi"])
+            expected = red_engine(compute_tech_score(close), {"score": 0.0, "confidence": 0.5}, regime)
+
+            assert result["signals"].loc[close.index[-1], symbol] == expected["signal"]
+            assert result["confidence"].loc[close.index[-1], symbol] == expected["confidence"]
+
+
+def test_regime_uses_the_live_lookback():
+    # A volatile stretch long before the last 6 months must not leak in
+    closes = random_closes(n=600)
+    rng = np.random.default_rng(1)
+    closes.iloc[:150] *= np.exp(np.cumsum(rng.normal(0, 0.08, (150, 3)), axis=0))
+    result = run_backtest(closes)
+
+    rsi = indicator_frame(closes["AAA"])["rsi"]
+    checked = set()
+    for t in range(5, len(closes), 7):
+        close = closes["AAA"].iloc[:t + 1]
+        regime = detect_market_regime(close.iloc[-126:], rsi.iloc[:t + 1])
+        expected = red_engine(compute_tech_score(close), {"score": 0.0, "confidence": 0.5}, regime)
+        assert result["signals"]["AAA"].iloc[t] == expected["signal"]
+        checked.add(regime)
+
+    assert "Volatile" in checked and len(checked) > 1
+    assert (run_backtest(closes, regime_window=None)["signals"] != result["signals"]).any().any()
+
+
+def test_equity_and_hit_rate():
+    closes = random_closes(n=1000, symbols=tuple("ABCDEFGH"))
+    result = run_backtest(closes)
+
+    positions = result["positions"]
+    forward = closes.pct_change(fill_method=None).shift(-1).fillna(0.0)
+    assert np.allclose(result["equity"].iloc[-1], (1 + positions * forward).prod())
+
+    traded = positions.ne(0) & forward.ne(0)
+    hits = (np.sign(forward) == positions) & traded
+    assert np.allclose(result["hit_rate"], hits.sum() / traded.sum(), equal_nan=True)
+    assert traded.sum().sum() > 0
+    assert result["summary"]["signals"]["HOLD"] >= 60
+
+    # Long-only: SELL signals stay flat and are not counted as trades
+    long_only = run_backtest(closes, allow_short=False)
+    held = long_only["positions"].ne(0) & forward.ne(0)
+    assert (long_only["positions"] >= 0).all().all()
+    assert ((long_only["signals"] == "SELL") & held).sum().sum() == 0
+    long_hits = (np.sign(forward) == long_only["positions"]) & held
+    assert np.allclose(long_only["hit_rate"], long_hits.sum() / held.sum(), equal_nan=True)
+    assert long_only["summary"]["hit_rate"] == round(long_hits.sum().sum() / held.sum().sum(), 4)
+
+    # Low sentiment confidence keeps everything on HOLD
+    quiet = run_backtest(closes, neutral_confidence=0.3)
+    assert (quiet["signals"] == "HOLD").all().all()
+    assert quiet["portfolio"].iloc[-1] == 1.0
+
+
+def test_delisted_symbol_leaves_the_portfolio():
+    closes = random_closes(n=400, symbols=("AAA", "BBB", "CCC"))
+    closes.iloc[200:, 0] = np.nan   # AAA stops trading
+    result = run_backtest(close_matrix({s: closes[s].dropna() for s in closes}))
+
+    assert (result["signals"]["AAA"].iloc[200:] == "HOLD").all()
+
+    # After the last close the portfolio is the mean of the other two
+    later = result["returns"].iloc[201:]
+    expected = np.cumprod(1 + later[["BBB", "CCC"]].mean(axis=1))
+    portfolio = result["portfolio"].iloc[201:] / result["portfolio"].iloc[200]
+    assert np.allclose(portfolio, expected)
+
+
+def test_runs_from_local_files(tmp_path):
+    closes = random_closes(n=120)
+    for symbol in closes.columns:
+        closes[symbol].dropna().rename("Close").to_frame().to_csv(tmp_path / f"{symbol}.csv", index_label="Date")
+
+    provider = LocalFileProvider(str(tmp_path))
+    loaded = load_closes(provider.symbols(), provider)
+
+    assert list(loaded.columns) == ["AAA", "BBB", "CCC"]
+    assert np.allclose(loaded.fillna(0), closes.fillna(0))
+    assert run_backtest(loaded)["summary"]["bars"] == 120
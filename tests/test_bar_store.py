@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from app import bar_store
+from app.fetcher import fetch_history
+from app.symbol_mapper import is_missing
+
+
+def make_bars(start, periods, base=100.0):
+    index = pd.date_range(start, periods=periods, freq="B", tz="America/New_York", name="Date")
+    close = base + np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        "Open": close - 0.5,
+        "High": close + 1.0,
+        "Low": close - 1.0,
+        "Close": close,
+        "Volume": np.full(periods, 1000.0),
+    }, index=index)
+
+
+def test_incremental_append(tmp_path, monkeypatch):
+    monkeypatch.setattr(bar_store, "BAR_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(bar_store, "REFRESH_SECONDS", 0)
+
+    full = make_bars("2024-01-01", 300)
+    calls = []
+
+    def fake_download(provider, symbol, period=None, start=None):
+        calls.append((period, start))
+        if start is None:
+            return full.iloc[:250]
+        return full[full.index.date >= start]
+
+    monkeypatch.setattr(bar_store, "_download", fake_download)
+
+    first = bar_store.get_bars("TEST", "max", provider=None)
+    assert len(first) == 250
+    assert calls == [("max", None)]
+
+    second = bar_store.get_bars("TEST", "max", provider=None)
+    assert len(second) == 300
+    assert calls[1][0] is None  # tail request, not a full download
+    assert (second.index == full.index).all()
+    assert np.array_equal(second["Close"].to_numpy(), full["Close"].to_numpy())
+
+    stored, meta = bar_store.load_bars("TEST")
+    assert meta["rows"] == 300
+    assert str(stored.index.tz) == "America/New_York"
+
+
+def test_slice_period():
+    bars = make_bars("2023-01-02", 520)
+    six_months = bar_store.slice_period(bars, "6mo")
+    assert six_months.index[-1] == bars.index[-1]
+    assert six_months.index[0] >= bars.index[-1] - pd.DateOffset(months=6)
+    assert len(bar_store.slice_period(bars, "max")) == 520
+
+
+def test_download_error_is_not_remembered_as_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(bar_store, "BAR_STORE_DIR", str(tmp_path))
+
+    class FlakyProvider:
+        name = "flaky"
+        persist = True
+        calls = 0
+
+        def history(self, symbol, period=None, start=None, timeout=None):
+            FlakyProvider.calls += 1
+            if FlakyProvider.calls == 1:
+                raise ConnectionError("rate limited")
+            return make_bars("2024-01-01", 60)
+
+    provider = FlakyProvider()
+    assert fetch_history("FLAKY", "1mo", provider) is None
+    assert not is_missing("FLAKY", provider.name)
+
+    bars = fetch_history("FLAKY", "1mo", provider)
+    assert bars is not None and not bars.empty
+    assert FlakyProvider.calls == 2
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.batch_indicators import batch_indicators, close_matrix, latest_snapshot, tech_scores
+from app.ai_engine.indicator_kernel import compute_indicators
+from app.ai_engine.red_pipeline import compute_tech_score
+from app.indicators import calculate_indicators_df, generate_signal
+
+
+def random_walk(n, seed):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-03", periods=n, freq="B")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=index)
+
+
+def universe():
+    return {
+        "AAA": random_walk(200, 1),
+        "BBB": random_walk(200, 2).iloc[60:],          # listed later
+        "CCC": random_walk(200, 3).drop(random_walk(200, 3).index[[100, 101]]),
+    }
+
+
+def test_columns_match_single_symbol_kernel():
+    series = universe()
+    closes = close_matrix(series)
+    ind = batch_indicators(closes)
+
+    for sym in closes:
+        col = closes[sym].dropna()
+        single = compute_indicators(col.to_numpy())
+        for name in ("sma", "ema", "rsi", "macd", "macd_signal"):
+            np.testing.assert_array_equal(ind[name][sym].loc[col.index].to_numpy(), single[name])
+
+
+def test_latest_snapshot_matches_scalar_paths():
+    series = universe()
+    snap = latest_snapshot(close_matrix(series))
+
+    assert list(snap.index) == ["AAA", "BBB", "CCC"]
+    for sym, close in series.items():
+        close = close_matrix(series)[sym].dropna()
+        row = calculate_indicators_df(close).iloc[-1]
+        assert snap.loc[sym, "rsi"] == row["rsi"]
+        assert snap.loc[sym, "signal"] == generate_signal(row["rsi"], row["macd"])
+        assert snap.loc[sym, "tech_score"] == compute_tech_score(close)
+
+
+def test_tech_score_is_zero_without_rsi():
+    ind = compute_indicators(np.column_stack([np.full(30, 10.0), np.linspace(10, 20, 30)]))
+    scores = tech_scores(ind)
+    assert (scores[:, 0] == 0).all()
+    assert (scores[:14, 1] == 0).all()
+    assert scores[-1, 1] == 0.0   # RSI 100 (-0.5) and MACD above signal (+0.5)
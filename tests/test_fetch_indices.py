@@ -0,0 +1,43 @@
+import threading
+import time
+
+import pandas as pd
+
+from app import fetcher
+from app.fetcher import fetch_indices
+
+
+class QuoteProvider:
+    name = "quotes"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def history(self, symbol, period=None, timeout=None):
+        if symbol == "SLOW":
+            self.release.wait(5)
+        if symbol == "BROKEN":
+            raise RuntimeError("upstream failed")
+        if symbol == "EMPTY":
+            return pd.DataFrame()
+        index = pd.date_range("2024-01-01", periods=3, freq="B")
+        return pd.DataFrame({"Close": [100.0, 101.0, 103.02]}, index=index)
+
+
+def test_partial_timeout_and_failure(monkeypatch):
+    provider = QuoteProvider()
+    monkeypatch.setattr(fetcher, "get_provider", lambda: provider)
+
+    started = time.monotonic()
+    try:
+        results = fetch_indices(["OK", "SLOW", "BROKEN", "EMPTY", "OK"], timeout=0.2)
+        elapsed = time.monotonic() - started
+    finally:
+        provider.release.set()
+
+    # Only the good symbol is reported; the slow one does not hold up the
+    # call past its deadline (timeout per round + 1s)
+    assert list(results) == ["OK"]
+    assert results["OK"]["price"] == 103.02
+    assert abs(results["OK"]["change"] - 2.0) < 1e-9
+    assert elapsed < 2.0
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from app import fetcher
+from app.fetcher import fetch_fundamentals, fetch_stock_details
+
+
+class InfoProvider:
+    name = "info"
+    calls = 0
+
+    def info(self, symbol):
+        InfoProvider.calls += 1
+        return {"currency": "USD", "trailingPE": 20.0, "ignored": 1}
+
+
+def test_fundamentals_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(fetcher, "FUNDAMENTALS_MAX_ENTRIES", 3)
+    monkeypatch.setattr(fetcher, "_fundamentals", fetcher.OrderedDict())
+    provider = InfoProvider()
+
+    for i in range(10):
+        assert fetch_fundamentals(f"SYM{i}", provider) == {"currency": "USD", "trailingPE": 20.0}
+
+    assert len(fetcher._fundamentals) == 3
+    assert InfoProvider.calls == 10
+
+    # Cached entries are served without asking the provider
+    fetch_fundamentals("SYM9", provider)
+    assert InfoProvider.calls == 10
+
+
+def test_details_payload_matches_row_iteration(monkeypatch):
+    rng = np.random.default_rng(5)
+    index = pd.date_range("2024-01-02", periods=60, freq="B", tz="America/New_York")
+    close = 100 + np.cumsum(rng.normal(0, 1, 60))
+    bars = pd.DataFrame({
+        "Open": close - 0.5, "High": close + 1, "Low": close - 1, "Close": close,
+        "Volume": rng.integers(1_000, 5_000, 60).astype(float),
+    }, index=index)
+
+    monkeypatch.setattr(fetcher, "fetch_history", lambda symbol, period, provider: bars)
+    monkeypatch.setattr(fetcher, "_fundamentals", fetcher.OrderedDict())
+    details = fetch_stock_details("DETAILS", InfoProvider())
+
+    # Previous iterrows() payload; without day fields in the info it
+    # read the stats from the last bar as well
+    history = [{"time": date.strftime("%Y-%m-%d"), "value": row["Close"]} for date, row in bars.iterrows()]
+    last = bars.iloc[-1]
+    assert details["history"] == history
+    assert details["stats"] == {
+        "Open": last["Open"], "High": last["High"], "Low": last["Low"], "Vol": last["Volume"],
+        "P/E": 20.0, "Mkt Cap": "N/A", "52W High": "N/A", "52W Low": "N/A",
+    }
+
+    # Price and change come from the last two bars
+    assert details["price"] == close[-1]
+    assert details["change_percent"] == (close[-1] - close[-2]) / close[-2] * 100
+    assert details["currency"] == "USD"
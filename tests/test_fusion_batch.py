@@ -0,0 +1,94 @@
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.schemas import FusionResponse, TechnicalIndicators
+from app.services import fusion_service
+
+
+def fake_insight(symbol, market, db=None, interval="1d"):
+    if symbol.startswith("SLOW"):
+        time.sleep(1.0)
+    if symbol == "BROKEN.NS":
+        raise RuntimeError("upstream failed")
+    if symbol == "EMPTY.NS":
+        return None
+    technical = TechnicalIndicators(RSI=50.0, SMA=1.0, EMA=1.0, MACD=0.1, signal="HOLD")
+    return FusionResponse(symbol=symbol, market=market, technical=technical)
+
+
+def test_batch_streams_each_symbol(monkeypatch):
+    monkeypatch.setattr(fusion_service, "generate_fusion_insight", fake_insight)
+    monkeypatch.setattr(fusion_service, "FUSION_SYMBOL_TIMEOUT", 0.3)
+    client = TestClient(app)
+
+    body = {"symbols": ["tcs", "TCS.NS", "SLOW", "BROKEN", "EMPTY", "INFY"], "market": "NSE"}
+    with client.stream("POST", "/fusion/insight/batch", json=body) as response:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    results = {line["symbol"]: line for line in lines[:-1]}
+    assert results["TCS.NS"]["requested"] == ["tcs", "TCS.NS"]
+    assert results["TCS.NS"]["insight"]["technical"]["RSI"] == 50.0
+    assert results["SLOW.NS"]["status"] == "timeout"
+    assert results["BROKEN.NS"]["status"] == "error"
+    assert results["EMPTY.NS"]["status"] == "no_data"
+
+    # The slow symbol is reported last
+    assert lines[-2]["symbol"] == "SLOW.NS"
+    assert lines[-1]["done"] and lines[-1]["counts"] == {"ok": 2, "error": 1, "no_data": 1, "timeout": 1}
+
+
+def test_queued_symbols_are_not_timed_out(monkeypatch):
+    monkeypatch.setattr(fusion_service, "generate_fusion_insight", fake_insight)
+    monkeypatch.setattr(fusion_service, "FUSION_SYMBOL_TIMEOUT", 0.3)
+    client = TestClient(app)
+
+    # The slow symbols fill every worker; the fast ones wait for a free
+    # thread, which must not count against their own timeout
+    slow = [f"SLOW{i}" for i in range(fusion_service.FUSION_BATCH_WORKERS)]
+    fast = [f"FAST{i}" for i in range(8)]
+    with client.stream("POST", "/fusion/insight/batch", json={"symbols": slow + fast}) as response:
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    status = {line["symbol"]: line["status"] for line in lines[:-1]}
+    assert all(status[s] == "timeout" for s in slow)
+    assert all(status[s] == "ok" for s in fast)
+
+
+def test_batch_deadline_cancels_queued_symbols(monkeypatch):
+    started = []
+
+    def counting_insight(symbol, market, db=None, interval="1d"):
+        started.append(symbol)
+        return fake_insight(symbol, market, db, interval)
+
+    monkeypatch.setattr(fusion_service, "generate_fusion_insight", counting_insight)
+    monkeypatch.setattr(fusion_service, "FUSION_SYMBOL_TIMEOUT", 0.3)
+    monkeypatch.setattr(fusion_service, "FUSION_BATCH_DEADLINE", 0.6)
+    client = TestClient(app)
+    time.sleep(1.0)   # slow jobs left running by earlier tests
+
+    # The fast symbols would only get a thread after the deadline
+    slow = [f"SLOW{i}" for i in range(fusion_service.FUSION_BATCH_WORKERS)]
+    fast = [f"FAST{i}" for i in range(8)]
+    with client.stream("POST", "/fusion/insight/batch", json={"symbols": slow + fast}) as response:
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    results = {line["symbol"]: line for line in lines[:-1]}
+    assert all(results[s]["status"] == "timeout" for s in slow + fast)
+    assert all("deadline" in results[s]["detail"] for s in fast)
+    assert lines[-1]["elapsed"] < 0.9
+
+    # Cancelled while queued: they never run once the slow ones finish
+    time.sleep(1.0)
+    assert sorted(started) == sorted(slow)
+
+
+def test_batch_rejects_bad_requests():
+    client = TestClient(app)
+    assert client.post("/fusion/insight/batch", json={"symbols": []}).status_code == 400
+    assert client.post("/fusion/insight/batch", json={"symbols": ["A"], "interval": "5m"}).status_code == 400
+    assert client.post("/fusion/insight/batch", json={"symbols": ["A"] * 1000}).status_code == 400
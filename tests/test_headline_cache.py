@@ -0,0 +1,34 @@
+from app import headline_cache
+
+
+def test_scores_each_distinct_headline_once():
+    headline_cache.clear()
+    calls = []
+
+    def scorer(text):
+        calls.append(text)
+        return float(len(text.split()))
+
+    first = headline_cache.scores(["Markets rally", "Markets  rally ", "MARKETS rally"], "test", scorer)
+    assert first == [2.0, 2.0, 2.0]
+    assert calls == ["Markets rally", "MARKETS rally"]   # whitespace folded, case kept
+
+    second = headline_cache.scores(["Markets rally", "Stocks fall hard"], "test", scorer)
+    assert second == [2.0, 3.0]
+    assert calls[-1] == "Stocks fall hard" and len(calls) == 3
+
+    # Each source is cached separately on the same entry
+    headline_cache.scores(["Markets rally"], "other", lambda t: -1.0)
+    stats = headline_cache.stats()
+    assert stats["entries"] == 3
+    assert stats["hits"] == 2
+    assert stats["misses"] == 4
+
+
+def test_cache_is_bounded(monkeypatch):
+    headline_cache.clear()
+    monkeypatch.setattr(headline_cache, "HEADLINE_CACHE_MAX_ENTRIES", 2)
+
+    headline_cache.scores(["a", "b", "c"], "test", lambda t: 0.0)
+    assert headline_cache.stats()["entries"] == 2
+    assert headline_cache.stats()["evictions"] == 1
@@ -0,0 +1,64 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.services import http_client
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        Handler.hits.append((self.path, self.headers.get("If-None-Match")))
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps({"articles": [{"title": self.path}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_ttl_cache_and_conditional_requests():
+    http_client.clear()
+    Handler.hits = []
+    server, base = serve()
+    try:
+        status, data = http_client.get_json(f"{base}/news", {"q": "AAPL"}, ttl=60)
+        assert status == 200 and data["articles"][0]["title"] == "/news?q=AAPL"
+
+        # Fresh: served from the cache without a request
+        assert http_client.get_json(f"{base}/news", {"q": "AAPL"}, ttl=60)[1] == data
+        assert len(Handler.hits) == 1
+
+        # Stale: revalidated with the ETag, server answers 304
+        assert http_client.get_json(f"{base}/news", {"q": "MSFT"}, ttl=0)[0] == 200
+        assert http_client.get_json(f"{base}/news", {"q": "MSFT"}, ttl=0)[1]["articles"][0]["title"] == "/news?q=MSFT"
+        assert Handler.hits[-1] == ("/news?q=MSFT", '"v1"')
+
+        assert http_client.get_json(f"{base}/missing")[0] == 404
+
+        stats = http_client.stats()
+        assert stats["hits"] == 1
+        assert stats["revalidated"] == 1
+        assert stats["errors"] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.indicator_kernel import EWM_MIN_BARS, compute_indicators
+from app.ai_engine.indicators import calculate_macd, calculate_rsi
+from app.indicators import calculate_indicators_df
+
+
+def random_walk(n, seed=7):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-03", periods=n, freq="B")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.015, n))), index=index)
+
+
+def test_kernel_matches_pandas():
+    close = random_walk(300)
+    ind = compute_indicators(close.to_numpy())
+
+    delta = close.diff()
+    rs = delta.clip(lower=0).rolling(14).mean() / (-delta.clip(upper=0)).rolling(14).mean()
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+
+    np.testing.assert_allclose(ind["sma"], close.rolling(14).mean(), rtol=1e-12)
+    np.testing.assert_allclose(ind["ema"], close.ewm(span=14, adjust=False).mean(), rtol=1e-12)
+    np.testing.assert_allclose(ind["rsi"], 100 - 100 / (1 + rs), rtol=1e-12)
+    np.testing.assert_allclose(ind["macd"], macd, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(ind["macd_signal"], macd.ewm(span=9, adjust=False).mean(), rtol=1e-9, atol=1e-12)
+
+
+def test_call_sites_share_the_kernel():
+    close = random_walk(130)
+    df = calculate_indicators_df(close)
+
+    assert list(df.columns) == ["close", "sma", "ema", "rsi", "macd"]
+    assert not df.isna().any().any()
+    assert df.index[0] == close.index[14]
+
+    rsi = calculate_rsi(close)
+    macd, signal, hist = calculate_macd(close)
+    assert rsi.iloc[-1] == df["rsi"].iloc[-1]
+    assert macd.iloc[-1] == df["macd"].iloc[-1]
+    np.testing.assert_allclose(hist, macd - signal)
+
+
+def test_flat_prices_have_no_rsi():
+    ind = compute_indicators(np.full(40, 50.0))
+    assert np.isnan(ind["rsi"]).all()
+    assert (ind["macd"] == 0).all()
+
+
+def test_long_series_match_pandas_and_the_matrix():
+    close = random_walk(EWM_MIN_BARS + 300)
+    ind = compute_indicators(close.to_numpy())
+
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    np.testing.assert_allclose(ind["ema"], close.ewm(span=14, adjust=False).mean(), rtol=1e-12)
+    np.testing.assert_allclose(ind["macd"], macd, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(ind["macd_signal"], macd.ewm(span=9, adjust=False).mean(), rtol=1e-9, atol=1e-12)
+
+    # Later listing and delisting: each column equals its own 1-D run
+    matrix = np.column_stack([close.to_numpy(), random_walk(len(close), seed=8).to_numpy()])
+    matrix[:100, 1] = np.nan
+    matrix[-50:, 0] = np.nan
+    both = compute_indicators(matrix)
+    for col, values in ((0, matrix[:-50, 0]), (1, matrix[100:, 1])):
+        single = compute_indicators(values)
+        rows = slice(None, -50) if col == 0 else slice(100, None)
+        for name in ("ema", "rsi", "macd", "macd_signal"):
+            np.testing.assert_array_equal(both[name][rows, col], single[name])
+    assert np.isnan(both["ema"][-50:, 0]).all()
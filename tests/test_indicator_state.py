@@ -0,0 +1,91 @@
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from app.ai_engine import indicator_state
+from app.ai_engine.indicator_kernel import compute_indicators
+from app.ai_engine.indicator_state import IndicatorState, latest_indicators
+
+
+def random_walk(n, seed=3):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-02", periods=n, freq="B", tz="Asia/Kolkata")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=index)
+
+
+def test_streaming_matches_batch():
+    closes = random_walk(3000)
+    batch = compute_indicators(closes.to_numpy())
+
+    state = IndicatorState()
+    streamed = {key: [] for key in ("sma", "ema", "rsi", "macd", "macd_signal")}
+    for ts, close in closes.items():
+        values = state.update(close, ts)
+        for key in streamed:
+            streamed[key].append(values[key])
+
+    # Running window sums stay within rounding of the batch kernel
+    for key, values in streamed.items():
+        np.testing.assert_allclose(values, batch[key], rtol=1e-12, atol=1e-9, equal_nan=True, err_msg=key)
+    for key in ("ema", "macd", "macd_signal"):
+        assert streamed[key][:999] == batch[key][:999].tolist()
+
+
+def test_flat_window_has_no_rsi():
+    closes = pd.concat([random_walk(30), pd.Series(50.0, index=pd.date_range("2024-01-01", periods=20, tz="Asia/Kolkata"))])
+    state = IndicatorState.from_closes(closes)
+    assert np.isnan(state.peek(50.0)["rsi"])
+    assert state.peek(50.0)["sma"] == 50.0
+
+
+def test_serialization_round_trip():
+    closes = random_walk(80)
+    state = IndicatorState.from_closes(closes.iloc[:60])
+    restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+    assert restored.last_timestamp == closes.index[59]
+    for close in closes.iloc[60:]:
+        assert restored.update(close) == state.update(close)
+
+
+def test_latest_indicators_only_advances_new_bars(tmp_path, monkeypatch):
+    monkeypatch.setattr(indicator_state, "INDICATOR_STATE_DIR", str(tmp_path))
+    monkeypatch.setattr(indicator_state, "_states", {})
+    closes = random_walk(150)
+
+    first = latest_indicators("TEST", closes.iloc[:120])
+    assert first["rsi"] == compute_indicators(closes.iloc[:120].to_numpy())["rsi"][-1]
+
+    # Simulate a restart: state comes back from disk
+    monkeypatch.setattr(indicator_state, "_states", {})
+    later = latest_indicators("TEST", closes)
+    batch = compute_indicators(closes.to_numpy())
+    assert later["macd"] == batch["macd"][-1]
+    assert np.isclose(later["sma"], batch["sma"][-1], rtol=1e-12)
+
+    state = indicator_state._states["TEST"]
+    assert state.count == 149
+    assert state.last_timestamp == closes.index[-2]
+
+
+def test_symbols_do_not_wait_for_each_other(tmp_path, monkeypatch):
+    monkeypatch.setattr(indicator_state, "INDICATOR_STATE_DIR", str(tmp_path))
+    monkeypatch.setattr(indicator_state, "_states", {})
+    saved = []
+
+    def save_state(symbol, data):
+        # Written after the symbol's lock is released
+        assert not indicator_state._symbol_lock(symbol).locked()
+        saved.append(symbol)
+
+    monkeypatch.setattr(indicator_state, "save_state", save_state)
+
+    with indicator_state._symbol_lock("AAA"):
+        done = threading.Event()
+        worker = threading.Thread(target=lambda: (latest_indicators("BBB", random_walk(60)), done.set()))
+        worker.start()
+        assert done.wait(5)
+    worker.join()
+    assert saved == ["BBB"]
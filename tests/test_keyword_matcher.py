@@ -0,0 +1,60 @@
+import random
+
+from app.ai_engine.keyword_matcher import KeywordMatcher, trie_pattern
+from app.ai_engine.sentiment_ensemble import NEGATIVE_WORDS, POSITIVE_WORDS, lexicon_sentiments
+from app.routes.market_routes import NEWS_MATCHER, NEWS_NEGATIVE, NEWS_POSITIVE
+
+
+def old_lexicon(text):
+    score = 0
+    for w in text.lower().split():
+        if w in POSITIVE_WORDS:
+            score += 1
+        elif w in NEGATIVE_WORDS:
+            score -= 1
+    return 0.0 if score == 0 else max(min(score / 5, 1.0), -1.0)
+
+
+def old_news(title):
+    t_lower = title.lower()
+    if any(x in t_lower for x in NEWS_POSITIVE):
+        return "Positive"
+    if any(x in t_lower for x in NEWS_NEGATIVE):
+        return "Negative"
+    return "Neutral"
+
+
+def random_headlines(n, seed=0):
+    rng = random.Random(seed)
+    vocab = sorted(POSITIVE_WORDS | NEGATIVE_WORDS) + NEWS_POSITIVE + NEWS_NEGATIVE + [
+        "Gains", "RISK", "gains,", "stock", "slow", "bullow", "lowgain", "İstanbul", "market", "\n", "\t",
+    ]
+    return ["".join(rng.choice(vocab) + rng.choice([" ", "", "  "]) for _ in range(rng.randint(0, 8))) for _ in range(n)]
+
+
+def test_trie_pattern_shares_prefixes():
+    assert trie_pattern(["gain", "gains", "growth"]) == "g(?:ain(?:s)?|rowth)"
+    assert trie_pattern([]) == "(?!)"
+
+
+def test_matches_previous_lexicon_and_news_rules():
+    headlines = random_headlines(2000)
+
+    assert lexicon_sentiments(headlines) == [old_lexicon(h) for h in headlines]
+
+    labels = NEWS_MATCHER.labels(headlines)
+    news = ["Positive" if "Positive" in l else "Negative" if "Negative" in l else "Neutral" for l in labels]
+    assert news == [old_news(h) for h in headlines]
+
+
+def test_large_lexicon():
+    rng = random.Random(1)
+    vocab = sorted({"".join(rng.choice("abcdefgh") for _ in range(rng.randint(3, 7))) for _ in range(5000)})
+    positive = set(vocab[::2])
+    negative = set(vocab) - positive
+    matcher = KeywordMatcher({"pos": positive, "neg": negative}, words=False)
+
+    texts = ["".join(rng.choice(vocab) + rng.choice(["", " "]) for _ in range(10)) for _ in range(200)]
+    for text, labels in zip(texts, matcher.labels(texts)):
+        assert ("pos" in labels) == any(w in text for w in positive)
+        assert ("neg" in labels) == any(w in text for w in negative)
@@ -0,0 +1,75 @@
+import pandas as pd
+
+from app import price_cache
+from app.fetcher import fetch_history, fetch_prices
+from app.providers.local_provider import LocalFileProvider
+
+
+def write_csv(path, dates, closes, symbol=None):
+    frame = pd.DataFrame({"Date": dates, "Open": closes, "High": closes, "Low": closes, "Close": closes, "Volume": 10})
+    if symbol is not None:
+        frame.insert(0, "Symbol", symbol)
+    frame.to_csv(path, index=False)
+    return frame
+
+
+def test_per_symbol_and_bulk_files(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=300, freq="B").strftime("%Y-%m-%d")
+    write_csv(tmp_path / "AAPL.csv", dates, range(300))
+
+    bulk = pd.concat([
+        pd.DataFrame({"symbol": "TCS.NS", "date": dates, "close": range(300)}),
+        pd.DataFrame({"symbol": "INFY.NS", "date": dates, "close": range(1000, 1300)}),
+    ])
+    bulk.to_csv(tmp_path / "nse_eod.csv", index=False)
+
+    provider = LocalFileProvider(str(tmp_path))
+    assert provider.symbols() == ["AAPL", "INFY.NS", "TCS.NS"]
+
+    bars = provider.history("infy.ns", period="1mo")
+    assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert bars["Close"].iloc[-1] == 1299
+    assert bars.index[-1] == pd.Timestamp(dates[-1])
+    assert len(bars) < 30
+
+    assert provider.history("MISSING").empty
+
+
+def test_fetcher_reads_local_provider(tmp_path):
+    price_cache.clear()
+    dates = pd.date_range("2023-01-02", periods=400, freq="B").strftime("%Y-%m-%d")
+    write_csv(tmp_path / "RELIANCE.NS.csv", dates, [float(i) for i in range(400)])
+    provider = LocalFileProvider(str(tmp_path))
+
+    closes = fetch_prices("RELIANCE.NS", provider=provider)
+    assert closes.iloc[-1] == 399.0
+
+    year = fetch_history("RELIANCE.NS", "1y", provider)
+    assert year.index[-1] == closes.index[-1]
+    assert price_cache.stats()["hits"] >= 1
+
+
+def test_suffix_resolution_and_negative_cache(tmp_path):
+    price_cache.clear()
+    dates = pd.date_range("2024-01-01", periods=200, freq="B").strftime("%Y-%m-%d")
+    write_csv(tmp_path / "TCS.NS.csv", dates, [float(i) for i in range(200)])
+
+    provider = LocalFileProvider(str(tmp_path))
+    requested = []
+    history = provider.history
+
+    def counting_history(symbol, **kwargs):
+        requested.append(symbol)
+        return history(symbol, **kwargs)
+
+    provider.history = counting_history
+
+    assert fetch_prices("TCS", provider=provider).iloc[-1] == 199.0
+    assert requested == ["TCS", "TCS.NS"]
+
+    price_cache.clear()
+    assert fetch_prices("TCS", provider=provider) is not None
+    assert fetch_prices("NOPE", provider=provider) is None
+    assert fetch_prices("NOPE", provider=provider) is None
+    # Resolved form is tried first; unknown symbols are only probed once
+    assert requested == ["TCS", "TCS.NS", "TCS.NS", "NOPE", "NOPE.NS"]
@@ -0,0 +1,47 @@
+import asyncio
+
+from app.services import market_snapshot
+
+
+def test_refresh_keeps_previous_quotes_on_partial_failure(monkeypatch):
+    rounds = [
+        {"^NSEI": {"price": 100.0, "change": 1.0}, "AAPL": {"price": 200.0, "change": -0.5}},
+        {"^NSEI": {"price": 101.0, "change": 2.0}},
+    ]
+    monkeypatch.setattr(market_snapshot, "_snapshot", None)
+    monkeypatch.setattr(market_snapshot, "fetch_indices", lambda symbols: rounds.pop(0))
+
+    first = market_snapshot.refresh_snapshot()
+    second = market_snapshot.refresh_snapshot()
+
+    assert first.quotes["^NSEI"]["price"] == 100.0
+    assert second.quotes["^NSEI"]["price"] == 101.0
+    assert second.quotes["AAPL"]["price"] == 200.0
+    assert market_snapshot.get_snapshot() is second
+
+    try:
+        second.quotes["AAPL"]["price"] = 0
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("snapshot quotes must be read-only")
+
+
+def test_background_refresher(monkeypatch):
+    calls = []
+    monkeypatch.setattr(market_snapshot, "_snapshot", None)
+    monkeypatch.setattr(market_snapshot, "fetch_indices", lambda symbols: calls.append(symbols) or {})
+
+    async def run():
+        task = asyncio.create_task(market_snapshot.run_refresher(0.01))
+        await asyncio.sleep(0.1)
+        assert market_snapshot._refresher_running
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert len(calls) >= 2
+    assert not market_snapshot._refresher_running
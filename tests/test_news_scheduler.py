@@ -0,0 +1,101 @@
+import threading
+import time
+
+from app.services import news_service
+from app.services.news_service import NEWS_QUERY_MAX_CHARS, NewsQuota, build_queries, split_articles, symbol_terms
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def test_symbol_terms_use_company_names():
+    assert symbol_terms("INFY.NS") == (["INFY"], ["infosys"])
+    assert symbol_terms("TCS") == (["TCS"], ["tata consultancy services", "tcs"])
+    assert symbol_terms("SBIN") == (["SBIN"], ["sbi", "state bank of india"])
+
+
+def test_queries_fit_length_limit():
+    symbols = [f"SYM{i}" for i in range(200)] + ["SBIN", "TCS", "AAPL"]
+    groups = build_queries(symbols)
+
+    assert all(len(query) <= NEWS_QUERY_MAX_CHARS for query, _ in groups)
+    assert [s for _, members in groups for s in members] == symbols
+    assert len(groups) < len(symbols) / 5
+    assert '"state bank of india"' in groups[-1][0]
+
+
+def test_split_articles_by_ticker_and_name():
+    articles = [
+        {"title": "Infosys beats earnings estimates", "description": None},
+        {"title": "TCS and INFY surge", "content": "..."},
+        {"title": "State Bank of India raises dividend"},
+        {"title": "Costs rise at factories"},   # "tcs" only inside a word
+    ]
+    result = split_articles(articles, ["INFY.NS", "TCS", "SBIN"])
+
+    assert result["INFY.NS"] == articles[:2]
+    assert result["TCS"] == [articles[1]]
+    assert result["SBIN"] == [articles[2]]
+
+
+def test_quota_stops_after_limit_and_429():
+    quota = NewsQuota(2)
+    quota.record(Response(200))
+    assert quota.available()
+    quota.record(Response(200))
+    assert not quota.available()
+
+    quota = NewsQuota(100)
+    quota.record(Response(429))
+    assert not quota.available()
+    assert quota.stats()["remaining"] == 0
+
+
+def test_concurrent_requests_share_one_query(monkeypatch):
+    calls = []
+
+    def fake_request(query, page_size):
+        calls.append(query)
+        return [{"title": "AAPL and MSFT surge"}, {"title": "Reliance earnings"}]
+
+    monkeypatch.setattr(news_service, "_request", fake_request)
+    monkeypatch.setattr(news_service, "API_KEY", "test")
+    monkeypatch.setattr(news_service, "scheduler", news_service.NewsScheduler(window=0.1))
+    news_service._symbol_cache.clear()
+
+    results = {}
+
+    def fetch(symbol):
+        results[symbol] = news_service.fetch_stock_news(symbol)
+
+    threads = [threading.Thread(target=fetch, args=(s,)) for s in ("AAPL", "MSFT", "RELIANCE.NS", "TSLA")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert [a["title"] for a in results["AAPL"]] == ["AAPL and MSFT surge"]
+    assert results["RELIANCE.NS"] == [{"title": "Reliance earnings"}]
+    assert results["TSLA"] == []
+
+    # Answered from the per-symbol cache
+    assert news_service.fetch_news_batch(["AAPL", "MSFT"])["MSFT"] == results["MSFT"]
+    assert len(calls) == 1
+
+
+def test_symbol_cache_drops_expired_and_excess_entries(monkeypatch):
+    monkeypatch.setattr(news_service, "_symbol_cache", news_service.OrderedDict())
+    monkeypatch.setattr(news_service, "NEWS_SYMBOL_CACHE_MAX_ENTRIES", 3)
+
+    for i in range(10):
+        news_service._cache_put(f"SYM{i}", [])
+    assert list(news_service._symbol_cache) == ["SYM7", "SYM8", "SYM9"]
+
+    # Once the TTL has passed, the next write drops the stale entries
+    later = time.monotonic() + news_service.NEWS_CACHE_TTL + 1
+    monkeypatch.setattr(news_service.time, "monotonic", lambda: later)
+    news_service._cache_put("SYM0", [])
+    assert list(news_service._symbol_cache) == ["SYM0"]
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.ohlcv_indicators import compute_ohlcv_indicators
+from app.indicators import calculate_fields, calculate_indicators
+
+
+def ohlcv(n=250, seed=3):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-02", periods=n, freq="B")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.5, n),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(1_000, 10_000, n).astype(float),
+    }, index=index)
+
+
+def test_matches_pandas_reference():
+    bars = ohlcv()
+    high, low, close, volume = bars["High"], bars["Low"], bars["Close"], bars["Volume"]
+    ind = compute_ohlcv_indicators(bars)
+
+    prev = close.shift()
+    tr = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)
+    atr = tr.ewm(alpha=1 / 14, adjust=False).mean()
+    np.testing.assert_allclose(ind["atr"][13:], atr[13:], rtol=1e-12)
+    assert np.isnan(ind["atr"][:13]).all()
+
+    middle = close.rolling(20).mean()
+    std = close.rolling(20).std(ddof=0)
+    np.testing.assert_allclose(ind["bb_upper"], middle + 2 * std, rtol=1e-9)
+    np.testing.assert_allclose(ind["bb_lower"], middle - 2 * std, rtol=1e-9)
+
+    lowest, highest = low.rolling(14).min(), high.rolling(14).max()
+    stoch_k = 100 * (close - lowest) / (highest - lowest)
+    np.testing.assert_allclose(ind["stoch_k"], stoch_k, rtol=1e-12)
+    np.testing.assert_allclose(ind["stoch_d"], stoch_k.rolling(3).mean(), rtol=1e-12)
+
+    obv = (np.sign(close.diff()).fillna(0) * volume).cumsum()
+    np.testing.assert_allclose(ind["obv"], obv)
+
+    typical = (high + low + close) / 3
+    vwap = (typical * volume).rolling(20).sum() / volume.rolling(20).sum()
+    np.testing.assert_allclose(ind["vwap"], vwap, rtol=1e-12)
+
+
+def test_only_requested_fields_are_computed():
+    bars = ohlcv()
+    assert set(compute_ohlcv_indicators(bars, ["atr", "obv"])) == {"atr", "obv"}
+
+    values = calculate_fields(bars, ["rsi", "signal", "bollinger"])
+    assert list(values) == ["rsi", "signal", "bb_upper", "bb_middle", "bb_lower", "bb_width"]
+    assert values["rsi"] == calculate_indicators(bars["Close"])["rsi"]
+    assert values["signal"] in ("BUY", "SELL", "HOLD")
+
+    assert list(calculate_fields(bars, ["vwap"])) == ["vwap"]
+
+
+def test_missing_bar_is_skipped():
+    bars = ohlcv(120)
+    gappy = bars.copy()
+    gappy.iloc[30] = np.nan
+    ind = compute_ohlcv_indicators(gappy, ["atr", "obv"])
+    clean = compute_ohlcv_indicators(bars.drop(bars.index[30]), ["atr", "obv"])
+
+    for col in ("atr", "obv"):
+        assert np.isnan(ind[col][30])
+        np.testing.assert_array_equal(np.delete(ind[col], 30), clean[col])
+
+    values = calculate_fields(gappy, ["atr", "obv"])
+    assert values == {"atr": clean["atr"][-1], "obv": clean["obv"][-1]}
+
+    # A missing last bar: the latest real bar answers
+    gappy.iloc[-1] = np.nan
+    assert calculate_fields(gappy, ["atr"])["atr"] == ind["atr"][-2]
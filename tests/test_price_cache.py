@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from app import price_cache
+
+
+def make_bars(periods):
+    index = pd.date_range("2023-01-02", periods=periods, freq="B", name="Date")
+    close = np.linspace(100.0, 200.0, periods)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": close}, index=index)
+
+
+def test_shorter_period_served_from_longer_window():
+    price_cache.clear()
+    bars = make_bars(400)
+    loads = []
+
+    def loader(period):
+        loads.append(period)
+        return bars
+
+    year = price_cache.get_or_load("TEST", "1y", loader)
+    month = price_cache.get_or_load("TEST", "1mo", loader)
+
+    assert loads == ["1y"]
+    assert month.index[-1] == year.index[-1]
+    assert len(month) < len(year)
+
+    stats = price_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_longer_period_is_a_miss():
+    price_cache.clear()
+    bars = make_bars(400)
+    price_cache.put("TEST", "1mo", bars.tail(22))
+    assert price_cache.get("TEST", "6mo") is None
+    assert price_cache.get("TEST", "5d") is not None
+
+
+def test_ttl_and_lru_eviction(monkeypatch):
+    price_cache.clear()
+    bars = make_bars(100)
+    size = bars.memory_usage(index=True, deep=True).sum()
+    monkeypatch.setattr(price_cache, "PRICE_CACHE_MAX_BYTES", int(size * 2.5))
+
+    price_cache.put("A", "max", bars)
+    price_cache.put("B", "max", bars)
+    price_cache.get("A", "max")
+    price_cache.put("C", "max", bars)
+
+    assert price_cache.get("B", "max") is None
+    assert price_cache.get("A", "max") is not None
+    assert price_cache.stats()["evictions"] == 1
+
+    monkeypatch.setattr(price_cache, "PRICE_CACHE_TTL", -1)
+    price_cache.put("D", "max", bars)
+    assert price_cache.get("D", "max") is None
+    assert price_cache.stats()["expired"] == 1
@@ -0,0 +1,45 @@
+import asyncio
+from types import MappingProxyType
+
+from app.services import quote_stream
+from app.services.market_snapshot import MarketSnapshot
+
+
+def test_one_poll_serves_all_subscribers(monkeypatch):
+    polls = []
+    prices = iter([100.0, 100.0, 101.0, 101.0, 101.0, 101.0])
+
+    def fake_fetch(symbols):
+        polls.append(tuple(symbols))
+        price = next(prices)
+        return {s: {"price": price, "change": 0.0} for s in symbols}
+
+    snapshot = MarketSnapshot(quotes=MappingProxyType({}), taken_at=0)
+    monkeypatch.setattr(quote_stream.market_snapshot, "get_snapshot", lambda: snapshot)
+    monkeypatch.setattr(quote_stream, "fetch_indices", fake_fetch)
+
+    async def run():
+        hub = quote_stream.QuoteHub(interval=0.01)
+        clients = [hub.subscribe(["AAPL"]) for _ in range(20)]
+        other = hub.subscribe(["TSLA", "AAPL"])
+
+        first = await clients[0].next_update(1)
+        assert first == {"AAPL": {"price": 100.0, "change": 0.0}}
+
+        second = await clients[0].next_update(1)
+        assert second == {"AAPL": {"price": 101.0, "change": 0.0}}
+
+        # Slow client: updates are conflated, only the latest survives
+        merged = await other.next_update(1)
+        assert merged["AAPL"]["price"] == 101.0
+        assert set(merged) == {"AAPL", "TSLA"}
+
+        for sub in clients + [other]:
+            hub.unsubscribe(sub)
+        await asyncio.sleep(0.05)
+        assert hub._task.done()
+
+    asyncio.run(run())
+
+    # 21 clients, one upstream request per poll
+    assert all(p == ("AAPL", "TSLA") for p in polls)
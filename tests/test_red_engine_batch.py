@@ -0,0 +1,31 @@
+import numpy as np
+
+from app.ai_engine.red_engine import REGIME_CODES, red_engine, red_engine_batch, regime_codes
+
+
+def test_batch_matches_scalar_engine():
+    rng = np.random.default_rng(0)
+    n = 20000
+    tech = rng.uniform(-1, 1, n)
+    sent = rng.uniform(-1, 1, n)
+    conf = rng.choice([0.0, 0.3, 0.39, 0.4, 0.7, 1.0], n)
+    labels = rng.choice(list(REGIME_CODES) + ["Unknown"], n)
+
+    # Values on the decision boundaries
+    tech[:4] = [0.4 / 0.6, -0.4 / 0.6, 0.8, 0.0]
+    sent[:4] = 0.0
+
+    out = red_engine_batch(tech, sent, conf, regime_codes(labels))
+
+    for i in range(n):
+        expected = red_engine(tech[i], {"score": sent[i], "confidence": conf[i]}, labels[i])
+        assert out["signal"][i] == expected["signal"]
+        assert out["confidence"][i] == expected["confidence"]
+        assert out["risk"][i] == expected["risk"]
+
+
+def test_batch_keeps_shape():
+    tech = np.full((3, 4), 0.9)
+    out = red_engine_batch(tech, 0.9, 0.7, REGIME_CODES["Trending"])
+    assert out["signal"].shape == (3, 4)
+    assert (out["signal"] == "BUY").all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.indicators import calculate_rsi
+from app.ai_engine.regime import detect_market_regime, regime_frame, regime_series
+
+
+def prices(n, sigma, seed):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-02", periods=n, freq="B")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0.001, sigma, n))), index=index)
+
+
+def test_every_bar_matches_scalar_function():
+    for sigma, seed in ((0.008, 1), (0.02, 2), (0.04, 3)):
+        close = prices(120, sigma, seed)
+        rsi = calculate_rsi(close)
+        series = regime_series(close, rsi)
+
+        expected = [detect_market_regime(close.iloc[:t + 1], rsi.iloc[:t + 1]) for t in range(len(close))]
+        assert series.tolist() == expected
+
+
+def test_rolling_window_and_interval():
+    close = pd.concat([prices(100, 0.05, 4), prices(100, 0.004, 5) * 3])
+    close.index = pd.date_range("2023-01-02", periods=200, freq="B")
+    rsi = calculate_rsi(close)
+
+    full = regime_series(close, rsi)
+    rolling = regime_series(close, rsi, window=30)
+    assert full.iloc[-1] == "Volatile"
+    assert rolling.iloc[-1] != "Volatile"
+    assert rolling.iloc[-1] == detect_market_regime(close.iloc[-31:], rsi)
+
+    weekly = regime_series(close, rsi, interval="1wk")
+    assert weekly.iloc[-1] == detect_market_regime(close, rsi, interval="1wk")
+
+
+def test_frame_matches_series_per_column():
+    closes = pd.DataFrame({f"S{i}": prices(150, 0.01 * (i + 1), i) for i in range(4)})
+    closes.iloc[:30, 1] = np.nan   # listed later
+    closes.iloc[60:85, 2] = closes.iloc[60, 2]   # flat stretch leaves RSI gaps
+    rsi = closes.apply(calculate_rsi)
+
+    for window in (None, 30):
+        frame = regime_frame(closes, rsi, window=window)
+        for symbol in closes.columns:
+            assert frame[symbol].tolist() == regime_series(closes[symbol], rsi[symbol], window=window).tolist()
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from app import price_cache, resample
+from app.ai_engine.regime import detect_market_regime
+from app.fetcher import fetch_bars
+from app.providers.local_provider import LocalFileProvider
+
+
+def daily_bars(n, seed=5):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-03", periods=n, freq="B")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        "Open": close * 0.99,
+        "High": close * 1.01,
+        "Low": close * 0.98,
+        "Close": close,
+        "Volume": rng.integers(100, 1000, n).astype(float),
+    }, index=index)
+
+
+def test_weekly_and_monthly_aggregation():
+    daily = daily_bars(60)
+    weekly = resample.resample_bars(daily, "1wk")
+    monthly = resample.resample_bars(daily, "1mo")
+
+    first_week = daily.iloc[:5]
+    assert weekly.index[0] == first_week.index[-1]
+    assert weekly["Open"].iloc[0] == first_week["Open"].iloc[0]
+    assert weekly["High"].iloc[0] == first_week["High"].max()
+    assert weekly["Low"].iloc[0] == first_week["Low"].min()
+    assert weekly["Close"].iloc[0] == first_week["Close"].iloc[-1]
+    assert weekly["Volume"].iloc[0] == first_week["Volume"].sum()
+
+    assert list(monthly.index.month) == [1, 2, 3]
+    assert monthly["Volume"].sum() == daily["Volume"].sum()
+
+
+def test_incremental_update_matches_rebuild():
+    resample.clear()
+    daily = daily_bars(300)
+
+    for end in (200, 201, 203, 210, 300):
+        window = daily.iloc[:end].copy()
+        window.iloc[-1, window.columns.get_loc("Close")] += 0.5   # forming bar
+        for interval in ("1wk", "1mo"):
+            bars = resample.get_resampled("XYZ", window, interval)
+            assert bars.equals(resample.resample_bars(window, interval))
+
+    stats = resample.stats()
+    assert stats["rebuilds"] == 2
+    assert stats["extends"] == 8
+
+    # Back-adjusted history (e.g. a split) forces a rebuild
+    revised = daily.copy()
+    revised[["Open", "High", "Low", "Close"]] *= 0.5
+    assert resample.get_resampled("XYZ", revised, "1wk").equals(resample.resample_bars(revised, "1wk"))
+    assert resample.stats()["rebuilds"] == 3
+
+
+def test_fetch_bars_from_daily_data(tmp_path):
+    price_cache.clear()
+    resample.clear()
+    daily = daily_bars(600)
+    daily.rename_axis("Date").to_csv(tmp_path / "ABC.csv")
+
+    provider = LocalFileProvider(str(tmp_path))
+    weekly = fetch_bars("ABC", "1wk", provider=provider)
+
+    assert len(weekly) > 100
+    assert weekly["Close"].iloc[-1] == daily["Close"].iloc[-1]
+    assert (weekly.index.dayofweek == 4).mean() > 0.95
+
+
+def test_regime_threshold_scales_with_interval():
+    close = pd.Series(100 * np.cumprod(np.where(np.arange(60) % 2, 1.04, 0.97)))
+    rsi = pd.Series(np.full(60, 50.0))
+
+    assert detect_market_regime(close, rsi) == "Volatile"
+    assert detect_market_regime(close, rsi, interval="1wk") != "Volatile"
@@ -0,0 +1,131 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ai_engine.red_engine import red_engine
+from app.ai_engine.red_pipeline import compute_tech_score
+from app.ai_engine.regime import regime_for_symbol
+from app.indicators import indicator_frame
+from app.services import screener
+from app.services.screener import parse_filter, parse_sort, resolve_universe, screen
+
+
+def random_prices(seed, n=200):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2024-01-01", periods=n)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=index, name="Close")
+
+
+PRICES = {f"S{i}": random_prices(i) for i in range(12)}
+PRICES["SHORT"] = random_prices(99, n=20)
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    news = {"S1": [{"title": "S1 beats estimates"}], "S2": [{"title": "S2 warns"}]}
+    monkeypatch.setattr(screener, "fetch_market_prices", lambda symbol, market: PRICES.get(symbol))
+    monkeypatch.setattr(screener, "fetch_stock_news", lambda symbol: news.get(symbol, []))
+    monkeypatch.setattr(screener, "analyze_sentiment", lambda articles: {"score": 0.5 if articles else 0.0})
+
+
+def test_parse_filters():
+    assert parse_filter("rsi < 30") == ("rsi", "<", 30.0)
+    assert parse_filter("regime=Range-Bound") == ("regime", "=", "range-bound")
+    assert parse_sort("-confidence") == ("confidence", True)
+
+    for bad in ("rsi", "volume>1", "rsi<low", "regime>2"):
+        with pytest.raises(ValueError):
+            parse_filter(bad)
+    with pytest.raises(ValueError):
+        parse_sort("regime")
+    with pytest.raises(ValueError):
+        resolve_universe("sp9000")
+
+    assert resolve_universe(symbols="tcs, infosys", market="NSE") == ["TCS.NS", "INFY.NS"]
+    assert len(resolve_universe("nifty50")) == 50
+
+
+def test_screen_matches_per_symbol_pipeline(offline):
+    result = screen(symbols=",".join(PRICES), filters=["rsi>0"], sort="rsi")
+
+    assert result["skipped"] == {"SHORT": "not enough data"}
+    assert result["screened"] == 12 and result["matched"] == 12
+    rsis = [row["rsi"] for row in result["results"]]
+    assert rsis == sorted(rsis)
+
+    for row in result["results"]:
+        close = PRICES[row["symbol"]]
+        assert row["tech_score"] == compute_tech_score(close)
+        assert row["regime"] == regime_for_symbol(row["symbol"], close)
+        assert "signal" not in row   # no news needed
+
+
+def test_mixed_calendars_use_each_symbols_own_dates(monkeypatch):
+    full = random_prices(1)
+    holidays = random_prices(2)
+    holidays = holidays[np.arange(len(holidays)) % 7 != 3]   # another exchange's calendar
+    prices = {"FULL": full, "HOLIDAYS": holidays, "HOLIDAYS2": holidays * 2}
+    monkeypatch.setattr(screener, "fetch_market_prices", lambda symbol, market: prices.get(symbol))
+
+    result = screen(symbols="FULL,HOLIDAYS,HOLIDAYS2", sort="rsi")
+
+    assert result["screened"] == 3
+    for row in result["results"]:
+        close = prices[row["symbol"]]
+        assert row["rsi"] == round(float(indicator_frame(close)["rsi"].iloc[-1]), 2)
+        assert row["macd"] == round(float(indicator_frame(close)["macd"].iloc[-1]), 2)
+        assert row["tech_score"] == compute_tech_score(close)
+        assert row["regime"] == regime_for_symbol(row["symbol"], close)
+
+
+def test_red_signal_filters_fetch_sentiment(offline):
+    result = screen(symbols=",".join(PRICES), filters=["signal!=hold"], sort="-confidence", limit=3)
+
+    for row in result["results"]:
+        close = PRICES[row["symbol"]]
+        sentiment = {"score": 0.5 if row["symbol"] in ("S1", "S2") else 0.0, "confidence": 0.7 if row["symbol"] in ("S1", "S2") else 0.3}
+        expected = red_engine(compute_tech_score(close), sentiment, regime_for_symbol(row["symbol"], close))
+        assert row["signal"] == expected["signal"] != "HOLD"
+        assert row["confidence"] == round(expected["confidence"], 2)
+    assert len(result["results"]) <= 3
+
+
+def test_deadline_skips_slow_symbols(monkeypatch):
+    def slow(symbol, market):
+        if symbol == "S3":
+            time.sleep(1.0)
+        return PRICES.get(symbol)
+
+    monkeypatch.setattr(screener, "fetch_market_prices", slow)
+    result = screen(symbols="S1,S2,S3", deadline=0.3)
+
+    assert result["skipped"] == {"S3": "deadline"}
+    assert result["screened"] == 2
+    assert result["elapsed"] < 0.9
+
+
+def test_concurrent_screens_share_the_fetch_limit(monkeypatch):
+    lock = threading.Lock()
+    active = [0, 0]   # running, peak
+
+    def counting(symbol, market):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return PRICES.get(symbol)
+
+    monkeypatch.setattr(screener, "fetch_market_prices", counting)
+    symbols = ",".join(f"S{i}" for i in range(12))
+    threads = [threading.Thread(target=screen, kwargs={"symbols": symbols}) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert active[1] <= screener.SCREEN_MAX_WORKERS
@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+from app.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    group = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def slow_fetch(symbol):
+        calls.append(symbol)
+        gate.wait(2)
+        return {"symbol": symbol}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(group.do("AAPL", slow_fetch, "AAPL")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert calls == ["AAPL"]
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+    assert group.stats == {"calls": 1, "shared": 7}
+
+
+def test_exception_propagates_and_key_is_released():
+    group = SingleFlight()
+
+    def boom():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        group.do("key", boom)
+
+    assert group.do("key", lambda: 42) == 42
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from app import fetcher, price_cache, symbol_mapper
+from app.providers.base import MarketDataProvider, empty_bars
+from app.symbol_mapper import is_missing, mark_missing, remember_resolution, resolved_symbol
+
+
+def test_resolution_maps_are_bounded(monkeypatch):
+    monkeypatch.setattr(symbol_mapper, "SYMBOL_CACHE_MAX_ENTRIES", 3)
+    monkeypatch.setattr(symbol_mapper, "_resolved", symbol_mapper.OrderedDict())
+    monkeypatch.setattr(symbol_mapper, "_missing", symbol_mapper.OrderedDict())
+
+    for i in range(10):
+        remember_resolution(f"SYM{i}", f"SYM{i}.NS", "test")
+        mark_missing(f"BAD{i}", "test")
+        if i == 7:
+            assert resolved_symbol("SYM6", "test") == "SYM6.NS"   # recently used
+
+    assert len(symbol_mapper._resolved) == 3
+    assert len(symbol_mapper._missing) == 3
+    assert resolved_symbol("SYM6", "test") == "SYM6.NS"
+    assert resolved_symbol("SYM0", "test") is None
+    assert is_missing("BAD9", "test") and not is_missing("BAD0", "test")
+
+
+class CountingProvider(MarketDataProvider):
+    """
+    Serves bars for `known` symbols only and records every lookup.
+    """
+    name = "counting"
+
+    def __init__(self, known):
+        self.known = set(known)
+        self.calls = []
+
+    def history(self, symbol, period=None, start=None, timeout=None):
+        self.calls.append(symbol)
+        if symbol not in self.known:
+            return empty_bars()
+        index = pd.date_range("2024-01-01", periods=30, freq="B", name="Date")
+        close = np.linspace(100.0, 110.0, 30)
+        return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1.0}, index=index)
+
+
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(symbol_mapper, "_resolved", symbol_mapper.OrderedDict())
+    monkeypatch.setattr(symbol_mapper, "_missing", symbol_mapper.OrderedDict())
+    price_cache.clear()
+
+
+def test_remembered_suffix_is_tried_first(monkeypatch):
+    fresh_caches(monkeypatch)
+    provider = CountingProvider({"TCS.NS"})
+
+    assert fetcher.fetch_ohlcv("TCS", provider) is not None
+    assert provider.calls == ["TCS", "TCS.NS"]
+    assert resolved_symbol("TCS", "counting") == "TCS.NS"
+
+    # Without the price cache or the negative entry for "TCS", the
+    # remembered form alone answers the next lookup
+    price_cache.clear()
+    symbol_mapper._missing.clear()
+    provider.calls.clear()
+    assert fetcher.fetch_ohlcv("TCS", provider) is not None
+    assert provider.calls == ["TCS.NS"]
+
+
+def test_missing_symbol_is_not_fetched_until_ttl(monkeypatch):
+    fresh_caches(monkeypatch)
+    provider = CountingProvider(set())
+    now = [1000.0]
+    monkeypatch.setattr(symbol_mapper.time, "monotonic", lambda: now[0])
+
+    for _ in range(5):
+        assert fetcher.fetch_history("NOPE", "6mo", provider) is None
+    assert provider.calls == ["NOPE"]
+
+    now[0] += symbol_mapper.NEGATIVE_TTL - 1
+    assert fetcher.fetch_history("NOPE", "6mo", provider) is None
+    assert provider.calls == ["NOPE"]
+
+    # Expired: the next lookup asks upstream again
+    now[0] += 2
+    assert fetcher.fetch_history("NOPE", "6mo", provider) is None
+    assert provider.calls == ["NOPE", "NOPE"]